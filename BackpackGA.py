@@ -1,106 +1,677 @@
+import copy
+import math
 import random
 import time
-from typing import List, Tuple
+from contextlib import closing
+from itertools import compress, count
+from operator import attrgetter, ne
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from Checkpoint import Checkpoint, instance_fingerprint, read_checkpoint, redistribute, restore_rng_state, rng_state, write_checkpoint
+from Evaluators import Evaluator, KnapsackEvaluator
+from FitnessCache import CacheEntry, FitnessCache, genome_key, merge_stats
+from ItemTable import Items, ItemTable
+from Profiler import NO_PHASE, PhaseProfiler, ProfileReport, format_report
+from RandomStreams import bernoulli_positions, numpy_stream, python_stream, seed_sequence
+from ReferenceSolvers import optimality_gap, reference_value
+from Selection import check_selection, elite_indices, select_parents
+from StopCriteria import StopCriteria, StopMonitor
+
+
+# Особина: геном разом із закешованими фітнесом, вагою та цінністю (обчислюються один раз при створенні)
+class Individual:
+    __slots__ = ("genome", "fitness", "weight", "value")
+
+    def __init__(self, genome: List[int], fitness: float, weight: int, value: int):
+        self.genome: List[int] = genome
+        self.fitness: float = fitness
+        self.weight: int = weight
+        self.value: int = value
+
+
+by_fitness = attrgetter("fitness")
+
+
+# Фітнес популяції одним масивом — вхід пакетної селекції
+def population_fitness(population: List[Individual]) -> np.ndarray:
+    return np.fromiter(map(by_fitness, population), dtype=np.float64, count=len(population))
+
+# Розкид рандомізованого жадібного засіву: щільність предмета множиться на випадковий множник з [1 - noise, 1 + noise]
+GREEDY_NOISE: float = 0.5
+
+
+# Цінність на одиницю ваги; предмети без ваги — найщільніші
+def item_density(weight: int, value: int) -> float:
+    return value / weight if weight > 0 else math.inf
+
+
+# Легкий знімок стану після покоління для run_iter(): лише агреговані числа, без копії популяції
+class GenerationStats:
+    __slots__ = ("generation", "best_fitness", "mean_fitness", "best_weight", "best_value", "diversity", "elapsed", "island")
+
+    def __init__(
+        self,
+        generation: int,
+        best_fitness: float,
+        mean_fitness: float,
+        best_weight: int,
+        best_value: int,
+        diversity: float,
+        elapsed: float,
+        island: Optional[int] = None,
+    ):
+        self.generation: int = generation
+        self.best_fitness: float = best_fitness
+        self.mean_fitness: float = mean_fitness
+        self.best_weight: int = best_weight
+        self.best_value: int = best_value
+        # Частка унікальних геномів у популяції
+        self.diversity: float = diversity
+        self.elapsed: float = elapsed
+        # Номер острова для Island Model (None для решти рушіїв)
+        self.island: Optional[int] = island
+
+    def __repr__(self) -> str:
+        island = f"острів {self.island}, " if self.island is not None else ""
+        return (
+            f"GenerationStats({island}покоління {self.generation}: best = {self.best_fitness:.1f}, "
+            f"mean = {self.mean_fitness:.1f}, вага = {self.best_weight}, різноманіття = {self.diversity:.2f}, "
+            f"{self.elapsed:.3f} с)"
+        )
+
 
 class BackpackGA:
+    # Атрибути, похідні від предметів: не серіалізуються разом із таблицею з файлу, а відтворюються на місці
+    _item_state: Tuple[str, ...] = ("_weights", "_values", "_densities", "_density_order")
+
     def __init__(
         self,
-        items: List[Tuple[int, int]],
+        items: Items,
         max_weight: int,
         population_size: int,
         generations: int,
         mutation_rate: float,
         verbose: bool = False,
+        cache_size: int = 0,
+        stop_criteria: Optional[StopCriteria] = None,
+        profile: bool = False,
+        on_profile: Optional[Callable[[ProfileReport], None]] = None,
+        repair: bool = False,
+        greedy_fraction: float = 0.0,
+        reference: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = 10,
+        selection: str = "tournament",
+        seed: Optional[int] = None,
+        evaluator: Optional[Evaluator] = None,
     ):
-        self.items: List[Tuple[int, int]] = items
+        if not 0.0 <= greedy_fraction <= 1.0:
+            raise ValueError("Частка жадібного засіву має бути в межах [0, 1].")
+        check_selection(selection)
+        self.items: Items = items
         self.max_weight: int = max_weight
         self.population_size: int = population_size
         self.generations: int = generations
         self.mutation_rate: float = mutation_rate
         self.verbose: bool = verbose
+        self._prepare_items()
+        # Пакетний оцінювач фітнесу (за замовчуванням — рюкзак із нульовим фітнесом перевантажених розв'язків)
+        self.evaluator: Evaluator = evaluator if evaluator is not None else KnapsackEvaluator(items, max_weight)
+        # Кеш оцінок між поколіннями (0 — вимкнено); рушій, що не оцінює геноми повністю, його не приймає
+        if cache_size > 0 and not self._evaluates_genomes():
+            raise ValueError(f"Кеш фітнесу не діє для {type(self).__name__} з цим оцінювачем: геноми не оцінюються повністю.")
+        self._cache: Optional[FitnessCache] = FitnessCache(cache_size) if cache_size > 0 else None
+        self.cache_stats: Dict[str, int] = {}
+        # Рання зупинка: критерії задаються користувачем, монітор живе протягом одного run()
+        self.stop_criteria: Optional[StopCriteria] = stop_criteria
+        self.stop_reason: Optional[str] = None
+        self.generations_run: int = 0
+        self._monitor: Optional[StopMonitor] = None
+        # Профілювання фаз: звіт після run() у profile_report і/або у колбек on_profile
+        self.profile: bool = profile or on_profile is not None
+        self.on_profile: Optional[Callable[[ProfileReport], None]] = on_profile
+        self.profile_report: ProfileReport = {}
+        self._profiler: Optional[PhaseProfiler] = None
+        # Результат останнього запуску: (найкращий геном, цінність, вага)
+        self.result: Optional[Tuple[List[int], int, int]] = None
+        # Ремонт перевантажених нащадків і жадібний засів початкової популяції
+        self.repair: bool = repair
+        self.greedy_fraction: float = greedy_fraction
+        # Еталон якості ("dp" — точний оптимум, "lp" — верхня межа LP): обчислюється один раз;
+        # після run() розрив до нього — в optimality_gap, а досягнення оптимуму зупиняє запуск
+        self.reference: Optional[str] = reference
+        self.reference_value: Optional[float] = reference_value(items, max_weight, reference) if reference else None
+        self.optimality_gap: Optional[float] = None
+        # Контрольні точки: файл і період запису в поколіннях (0 — лише наприкінці запуску);
+        # resume()/warm_start() задають точку, з якої почнеться наступний run()
+        self.checkpoint_path: Optional[str] = checkpoint_path
+        self.checkpoint_interval: int = checkpoint_interval
+        self._start_checkpoint: Optional[Checkpoint] = None
+        self._resume_run: bool = False
+        self._checkpointed_generation: Optional[int] = None
+        self._fingerprint: Optional[bytes] = None
+        # Схема пакетної селекції батьків ("tournament", "truncation", "sus")
+        self.selection: str = selection
+        # Власні потоки випадкових чисел (NumPy — для блоків, random.Random — для бітових масок і міграції).
+        # З seed кожен запуск починається з тих самих потоків, а острови й воркери отримують незалежні дочірні
+        self.seed: Optional[int] = seed
+        self._reseed(seed_sequence(seed))
+
+    # Структури, похідні від предметів; порядок предметів за спаданням щільності обчислюється один раз.
+    # Обмеження: спискові й бітові рушії будують ці списки Python (~100 байт на предмет у кожному процесі)
+    # і для таблиці з файлу (ItemTable) — їхні ядра індексують предмети поштучно, а поштучне читання
+    # відображеного файлу значно повільніше. Таблицю без копії в пам'ять читають лише векторизовані рушії
+    def _prepare_items(self) -> None:
+        self._weights: List[int] = [w for w, _ in self.items]
+        self._values: List[int] = [v for _, v in self.items]
+        self._densities: List[float] = [item_density(w, v) for w, v in zip(self._weights, self._values)]
+        self._density_order: List[int] = sorted(range(len(self._weights)), key=self._densities.__getitem__, reverse=True)
 
-    # Випадково оберемо k особин, і з них візьмемо ту, яка найкраща. Саме вона буде обрана для схрещування
-    def _tournament_selection(self, pop: List[List[int]], k: int = 3) -> List[int]:
-        selected: List[List[int]] = random.sample(pop, k)
-        return max(selected, key=self._fitness)
+    # Таблиця предметів із файлу серіалізується шляхом (процес відображає той самий файл),
+    # тож похідні структури не пересилаються, а відтворюються після десеріалізації
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        if isinstance(self.items, ItemTable):
+            for name in self._item_state:
+                state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if isinstance(self.items, ItemTable):
+            self._prepare_items()
+
+    # Поверхнева копія в межах процесу (напр., для команд IslandExecutor) не перебудовує похідні структури
+    def __copy__(self) -> "BackpackGA":
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+    # Батьківські пари для num нащадків: усі турніри (або інша схема) покоління — один векторизований прохід
+    # над масивом уже обчисленого фітнесу
+    def _select_parents(self, population: List[Individual], fitness: np.ndarray, num: int) -> List[Tuple[Individual, Individual]]:
+        pairs: List[List[int]] = select_parents(fitness, num, self._rng, self.selection).tolist()
+        return [(population[i], population[j]) for i, j in pairs]
+
+    # Еліта — частковим відбором найкращих (argpartition) замість повного сортування популяції
+    def _elite(self, population: List[Individual], fitness: np.ndarray, size: int = 2) -> List[Individual]:
+        return [population[i] for i in elite_indices(fitness, min(size, len(population))).tolist()]
 
 
     def _log(self, msg: str) -> None:
         if self.verbose:
             print(msg)
 
+    # Потоки GA з послідовності sequence (корінь запуску, острів або порція роботи воркера)
+    def _reseed(self, sequence: np.random.SeedSequence) -> None:
+        self._seed_sequence: np.random.SeedSequence = sequence
+        self._rng: np.random.Generator = numpy_stream(sequence)
+        self._random: random.Random = python_stream(sequence)
+
     def _create_individual(self, num_items: int) -> List[int]:
-        return [random.randint(0, 1) for _ in range(num_items)]
+        return self._rng.integers(0, 2, size=num_items, dtype=np.uint8).tolist()
 
-    def _crossover(self, p1: List[int], p2: List[int]) -> List[int]:
-        fitness_p1: float = self._fitness(p1)
-        fitness_p2: float = self._fitness(p2)
+    # Нащадок — копія кращого з батьків, у якій гени, що відрізняються від гіршого,
+    # з імовірністю 1 - prob_better беруться від гіршого. Вага й цінність рахуються від кращого батька.
+    # Випробування для відмінних генів усіх пар генеруються одним блоком
+    def _crossover_all(self, parent_pairs: List[Tuple[Individual, Individual]]) -> List[Individual]:
+        prob_better: float = 0.55
+        ordered: List[Tuple[Individual, Individual]] = [
+            (p1, p2) if p1.fitness > p2.fitness else (p2, p1) for p1, p2 in parent_pairs
+        ]
+        differs: List[List[int]] = [
+            list(compress(count(), map(ne, better.genome, worse.genome))) for better, worse in ordered
+        ]
+        from_worse: List[bool] = (self._rng.random(sum(map(len, differs))) >= prob_better).tolist()
 
-        if fitness_p1 > fitness_p2:
-            better, worse = p1, p2
-        else:
-            better, worse = p2, p1
+        children: List[Individual] = []
+        offset: int = 0
+        for (better, _), differ in zip(ordered, differs):
+            child = Individual(better.genome.copy(), better.fitness, better.weight, better.value)
+            children.append(self._flip(child, list(compress(differ, from_worse[offset:offset + len(differ)]))))
+            offset += len(differ)
+        return children
 
-        prob_better: float = 0.55
-        child: List[int] = []
-        for i in range(len(p1)):
-            if random.random() < prob_better:
-                child.append(better[i])
-            else:
-                child.append(worse[i])
-        return child
-
-    def _mutate(self, individual: List[int]) -> List[int]:
-        mutated = []
-        for bit in individual:
-            if random.random() <= self.mutation_rate:
-                mutated.append(1 - bit)  # інверсія: 0 → 1, 1 → 0
+    # Мутація всіх нащадків покоління на місці: позиції мутацій для всіх len(children)·n бітів
+    # генеруються одним блоком і розбиваються по нащадках
+    def _mutate_all(self, children: List[Individual]) -> List[Individual]:
+        num_items: int = len(self.items)
+        flat: np.ndarray = bernoulli_positions(len(children) * num_items, self.mutation_rate, self._rng)
+        owners, positions = np.divmod(flat, num_items)
+        bounds: List[int] = np.searchsorted(owners, np.arange(len(children) + 1)).tolist()
+        positions = positions.tolist()
+        return [self._flip(child, positions[a:b]) for child, a, b in zip(children, bounds, bounds[1:])]
+
+    # Ремонт перевантаженої особини: обрані предмети вилучаються в порядку зростання щільності,
+    # доки вага не вміститься в max_weight; вага й цінність оновлюються інкрементно через _flip
+    def _repair(self, individual: Individual) -> Individual:
+        excess: int = individual.weight - self.max_weight
+        if excess <= 0:
+            return individual
+
+        genome = individual.genome
+        positions: List[int] = []
+        for i in reversed(self._density_order):
+            if self._gene(genome, i):
+                positions.append(i)
+                excess -= self._weights[i]
+                if excess <= 0:
+                    break
+        return self._flip(individual, positions)
+
+    # Жадібний геном: предмети за спаданням щільності, кожен додається, якщо ще вміщається.
+    # noise > 0 — рандомізований варіант із випадково збуреною щільністю
+    def _greedy_genome(self, noise: float = 0.0) -> List[int]:
+        order: List[int] = self._density_order
+        if noise > 0:
+            factors: List[float] = self._rng.uniform(1.0 - noise, 1.0 + noise, size=len(self._densities)).tolist()
+            densities = [d * f for d, f in zip(self._densities, factors)]
+            order = sorted(range(len(self.items)), key=densities.__getitem__, reverse=True)
+
+        bits: List[int] = [0] * len(self.items)
+        total_weight: int = 0
+        for i in order:
+            if total_weight + self._weights[i] <= self.max_weight:
+                bits[i] = 1
+                total_weight += self._weights[i]
+        return self._encode(bits)
+
+    # Інверсія бітів (0 → 1, 1 → 0) з інкрементним оновленням ваги й цінності: O(змінених бітів)
+    def _flip(self, individual: Individual, positions: List[int]) -> Individual:
+        if not positions:
+            return individual
+
+        genome: List[int] = individual.genome
+        total_weight: int = individual.weight
+        total_value: int = individual.value
+        for i in positions:
+            if genome[i]:
+                genome[i] = 0
+                total_weight -= self._weights[i]
+                total_value -= self._values[i]
             else:
-                mutated.append(bit)  # залишаємо як є
-        return mutated
+                genome[i] = 1
+                total_weight += self._weights[i]
+                total_value += self._values[i]
+
+        individual.weight = total_weight
+        individual.value = total_value
+        individual.fitness = self._score(total_weight, total_value)
+        return individual
+
 
+    # Сумарні вага та цінність обраних предметів
+    def _totals(self, genome: List[int]) -> Tuple[int, int]:
+        return sum(compress(self._weights, genome)), sum(compress(self._values, genome))
+
+    # Фітнес за сумами; NaN, якщо оцінювач не виражає його через суми (тоді див. _evaluate_stale)
+    def _score(self, total_weight: int, total_value: int) -> float:
+        return self.evaluator.score(total_weight, total_value)
 
     def _fitness(self, individual: List[int]) -> float:
-        total_weight: int = sum(
-            self.items[i][0] for i in range(len(self.items)) if individual[i] == 1
-        )
-        total_value: int = sum(
-            self.items[i][1] for i in range(len(self.items)) if individual[i] == 1
-        )
-        if total_weight > self.max_weight:
-            return 0.0
-        return total_value - 0.1 * total_weight
+        return self._score(*self._totals(individual))
+
+    # Чи оцінює рушій геноми повністю (інакше кешувати нічого): спискові геноми з адитивним оцінювачем
+    # оновлюються лише інкрементно, через _flip і кросовер
+    def _evaluates_genomes(self) -> bool:
+        return not self.evaluator.additive
+
+    # Пакетна оцінка особин, чий фітнес не оновлено інкрементно (NaN): їхні геноми — одна матриця бітів
+    # і один виклик оцінювача. З кешем оцінюються лише відсутні в ньому геноми, і в кеш вони потрапляють
+    # уже з фітнесом. Для оцінювачів, що рахують фітнес за сумами, нічого не робить
+    def _evaluate_stale(self, individuals: List[Individual]) -> List[Individual]:
+        if self.evaluator.additive or not individuals:
+            return individuals
+        stale: List[Individual] = [individuals[i] for i in np.flatnonzero(np.isnan(population_fitness(individuals))).tolist()]
+        keys: List[bytes] = []
+        if self._cache is not None:
+            missed: List[Individual] = []
+            for individual in stale:
+                key: bytes = self._genome_key(individual.genome)
+                entry: Optional[CacheEntry] = self._cache.get(key)
+                if entry is None:
+                    missed.append(individual)
+                    keys.append(key)
+                else:
+                    individual.fitness = entry[0]
+            stale = missed
+        if stale:
+            fitness: List[float] = self.evaluator.evaluate(self._population_bits(stale)).tolist()
+            for individual, value in zip(stale, fitness):
+                individual.fitness = value
+        for key, individual in zip(keys, stale):
+            self._cache.put(key, (individual.fitness, individual.weight, individual.value))
+        return individuals
 
-    def _evolve_population(self, population: List[List[int]], generations: int) -> List[List[int]]:
-        for gen in range(generations):
-            population.sort(key=self._fitness, reverse=True)
-            elite: List[List[int]] = population[:2]
+    # Упакований геном для передачі між процесами і для ключів кешу
+    def _pack_genome(self, genome: List[int]) -> bytes:
+        return bytes(genome)
 
-            new_population: List[List[int]] = elite.copy()
+    def _unpack_genome(self, data: bytes) -> List[int]:
+        return list(data)
 
-            while len(new_population) < len(population):
-                p1: List[int] = self._tournament_selection(population)
-                p2: List[int] = self._tournament_selection(population)
-                child: List[int] = self._mutate(self._crossover(p1, p2))
-                new_population.append(child)
+    def _genome_nbytes(self) -> int:
+        return len(self.items)
 
-            population = new_population
+    def _genome_key(self, genome: List[int]) -> bytes:
+        return genome_key(self._pack_genome(genome))
+
+    # Геном у вигляді списку бітів для результату run() і навпаки
+    def _decode(self, genome: List[int]) -> List[int]:
+        return genome
+
+    def _encode(self, bits: List[int]) -> List[int]:
+        return bits
+
+    def _gene(self, genome: List[int], i: int) -> int:
+        return genome[i]
+
+    def _new_individual(self, genome: List[int]) -> Individual:
+        total_weight, total_value = self._totals(genome)
+        return Individual(genome, self._score(total_weight, total_value), total_weight, total_value)
+
+    # Повне обчислення сум генома (напр., нащадок кросовера бітсету); з кешем — лише для відсутніх у ньому.
+    # Фітнес неадитивного оцінювача ще невідомий (NaN), тож такі геноми кешує _evaluate_stale
+    def _cached_individual(self, genome: List[int]) -> Individual:
+        if self._cache is None or not self.evaluator.additive:
+            return self._new_individual(genome)
+        key: bytes = self._genome_key(genome)
+        entry: Optional[CacheEntry] = self._cache.get(key)
+        if entry is not None:
+            return Individual(genome, *entry)
+        individual: Individual = self._new_individual(genome)
+        self._cache.put(key, (individual.fitness, individual.weight, individual.value))
+        return individual
+
+    # Єдине місце, де геноми оцінюються повністю: далі всі читають закешовані поля
+    def _make_individuals(self, genomes: List[List[int]]) -> List[Individual]:
+        return self._evaluate_stale([self._new_individual(genome) for genome in genomes])
+
+    def _start_monitor(self, stop_event=None) -> Optional[StopMonitor]:
+        if self.stop_criteria is None and stop_event is None and self.reference_value is None:
+            return None
+        return StopMonitor(self._effective_criteria(), stop_event)
+
+    # Критерії користувача; з еталоном — ще й зупинка на цінності, вищої за яку не буває
+    # (ціла частина межі: оптимум цілий і не перевищує її)
+    def _effective_criteria(self) -> StopCriteria:
+        criteria: StopCriteria = self.stop_criteria or StopCriteria()
+        if self.reference_value is not None and criteria.target_value is None:
+            criteria = copy.copy(criteria)
+            criteria.target_value = math.floor(self.reference_value + 1e-9)
+        return criteria
+
+    # Перевірка критеріїв зупинки після покоління gen
+    def _should_stop(self, gen: int, best_fitness: float, best_value: Optional[float] = None) -> bool:
+        self.generations_run = gen + 1
+        if self._monitor is None or not self._monitor.update(best_fitness, best_value):
+            return False
+        self.stop_reason = self._monitor.reason
+        self._log(f"Зупинка після покоління {gen+1}: {self.stop_reason}")
+        return True
+
+    # Контекст вимірювання фази; коли профілювання вимкнено — порожній
+    def _phase(self, name: str, calls: int = 1):
+        if self._profiler is None:
+            return NO_PHASE
+        return self._profiler.phase(name, calls)
+
+    def _start_profiler(self) -> None:
+        self._profiler = PhaseProfiler() if self.profile else None
+
+    # Звіт профілювання (разом зі звітами воркерів/островів) — в атрибут і колбек
+    def _finish_profiler(self, *worker_reports: ProfileReport) -> None:
+        if self._profiler is None:
+            return
+        for report in worker_reports:
+            self._profiler.merge(report)
+        self.profile_report = self._profiler.report()
+        self._profiler = None
+        self._log("Профіль фаз:\n" + format_report(self.profile_report))
+        if self.on_profile is not None:
+            self.on_profile(self.profile_report)
+
+    # Початкова популяція: створення геномів і їх повна оцінка. Частка greedy_fraction засівається
+    # жадібними розв'язками (перший — чистий жадібний, решта — рандомізовані), решта — випадкові
+    def _initial_population(self, size: int) -> List[Individual]:
+        num_items: int = len(self.items)
+        num_greedy: int = round(size * self.greedy_fraction)
+        genomes = [self._greedy_genome(GREEDY_NOISE if k else 0.0) for k in range(num_greedy)]
+        genomes += [self._create_individual(num_items) for _ in range(size - num_greedy)]
+        with self._phase("fitness", size):
+            population: List[Individual] = self._make_individuals(genomes)
+        if self.repair:
+            with self._phase("repair", size):
+                population = self._evaluate_stale([self._repair(individual) for individual in population])
+        return population
+
+    # Підсумкова статистика кешу (разом зі статистикою воркерів, якщо вони були)
+    def _report_cache(self, *worker_stats: Dict[str, int]) -> None:
+        if self._cache is None:
+            return
+        self.cache_stats = merge_stats(self._cache.stats(), *worker_stats)
+        self._log(f"Кеш фітнесу: влучань = {self.cache_stats['hits']}, промахів = {self.cache_stats['misses']}")
+
+    # Генератор поколінь: після кожного покоління віддає (номер, популяція)
+    def _generations(self, population: List[Individual], generations: int, start: int = 0) -> Iterator[Tuple[int, List[Individual]]]:
+        for gen in range(start, generations):
+            fitness: np.ndarray = population_fitness(population)
+            with self._phase("elite"):
+                elite: List[Individual] = self._elite(population, fitness)
+            num_children: int = len(population) - len(elite)
+
+            # Фази покоління виконуються пакетами, тож кожну можна виміряти окремо
+            with self._phase("selection", num_children):
+                parents: List[Tuple[Individual, Individual]] = self._select_parents(population, fitness, num_children)
+            # Кросовер і мутація одразу оновлюють вагу, цінність і фітнес нащадка
+            with self._phase("crossover", num_children):
+                children: List[Individual] = self._crossover_all(parents)
+            with self._phase("mutation", num_children):
+                children = self._mutate_all(children)
+            if self.repair:
+                with self._phase("repair", num_children):
+                    children = [self._repair(child) for child in children]
+            # Оцінювач без формули від сум: змінені нащадки оцінюються тут одним пакетом
+            if not self.evaluator.additive:
+                with self._phase("fitness", num_children):
+                    children = self._evaluate_stale(children)
+
+            population = elite + children
+
+            best: Individual = max(population, key=by_fitness)
+            stop: bool = self._should_stop(gen, best.fitness, best.value)
 
             if self.verbose:
-                best_fit: float = self._fitness(population[0])
-                # self._log(f"Покоління {gen+1}: найкраща цінність = {best_fit}, вага = {sum(self.items[i][0] for i in range(len(self.items)) if population[0][i] == 1)}")
-                # self._log(f"Найкращий індивід: {population[0]}")
+                best_fit: float = population[0].fitness
+                # self._log(f"Покоління {gen+1}: найкраща цінність = {best_fit}, вага = {population[0].weight}")
+                # self._log(f"Найкращий індивід: {population[0].genome}")
 
+            yield gen, population
+            if stop:
+                break
+
+    def _evolve_population(self, population: List[Individual], generations: int) -> List[Individual]:
+        for _, population in self._generations(population, generations):
+            pass
         return population
 
-    def run(self) -> Tuple[List[int], int, int]:
-        num_items: int = len(self.items)
-        population: List[List[int]] = [self._create_individual(num_items) for _ in range(self.population_size)]
+    # Повний запуск як генератор поколінь; підсумок (self.result, кеш, профіль) фіксується і тоді,
+    # коли споживач перериває ітерацію
+    def _run_generations(self) -> Iterator[Tuple[int, List[Individual]]]:
+        self._start_profiler()
+        start, start_bits, rng_states = self._run_start(1, self.population_size)
+        population: List[Individual] = self._start_population(self.population_size, start_bits[0])
+        if rng_states:
+            self._restore_rng(rng_states[0])
+
+        self.stop_reason = None
+        self._monitor = self._start_monitor()
+        gen: int = start - 1
+        try:
+            for gen, population in self._generations(population, self.generations, start):
+                self._checkpoint(gen, [population])
+                yield gen, population
+        finally:
+            self._monitor = None
+            self._checkpoint(gen, [population], final=True)
+            self._finish_run(population)
+
+    # Продовження перерваного запуску: наступний run() починається з покоління, популяцій і станів RNG
+    # контрольної точки. Точка має належати тому самому екземпляру задачі
+    def resume(self, path: str) -> "BackpackGA":
+        checkpoint: Checkpoint = read_checkpoint(path)
+        if checkpoint.fingerprint != self._instance_fingerprint():
+            raise ValueError("Контрольна точка належить іншому екземпляру задачі; для схожого екземпляра використовуйте warm_start().")
+        if checkpoint.generation >= self.generations:
+            raise ValueError(f"Контрольна точка вже містить {checkpoint.generation} поколінь із {self.generations}.")
+        self._start_checkpoint, self._resume_run = checkpoint, True
+        return self
+
+    # Теплий старт на схожому екземплярі: популяції контрольної точки стають початковими
+    # (геноми обрізаються або доповнюються до нової кількості предметів), покоління і RNG — з нуля
+    def warm_start(self, path: str) -> "BackpackGA":
+        self._start_checkpoint, self._resume_run = read_checkpoint(path), False
+        return self
+
+    def _instance_fingerprint(self) -> bytes:
+        if self._fingerprint is None:
+            self._fingerprint = instance_fingerprint(self.items, self.max_weight)
+        return self._fingerprint
+
+    # Початок запуску на num_islands островах: з seed потоки випадкових чисел повертаються до початкових.
+    # Повертає стан, з якого починається запуск: (перше покоління, біти популяцій островів або None,
+    # стани RNG або None). Контрольна точка використовується одним запуском
+    def _run_start(self, num_islands: int, island_size: int) -> Tuple[int, list, Optional[List[bytes]]]:
+        if self.seed is not None:
+            self._reseed(seed_sequence(self.seed))
+        checkpoint, self._start_checkpoint = self._start_checkpoint, None
+        self._checkpointed_generation = None
+        if checkpoint is None:
+            return 0, [None] * num_islands, None
+        if not self._resume_run:
+            return 0, redistribute(checkpoint.populations, num_islands, island_size, len(self.items)), None
+        if len(checkpoint.populations) != num_islands:
+            raise ValueError(
+                f"Контрольна точка має {len(checkpoint.populations)} островів, а запуск — {num_islands}; "
+                "для іншої кількості островів використовуйте warm_start()."
+            )
+        self._log(f"Продовження з покоління {checkpoint.generation}")
+        return checkpoint.generation, checkpoint.populations, checkpoint.rng_states
+
+    # Початкова популяція запуску: особини з контрольної точки (доповнені новими до size) або нова
+    def _start_population(self, size: int, bits: Optional[np.ndarray]) -> List[Individual]:
+        if bits is None:
+            return self._initial_population(size)
+        genomes = [self._encode(row) for row in bits[:size].tolist()]
+        with self._phase("fitness", len(genomes)):
+            population: List[Individual] = self._make_individuals(genomes)
+        if self.repair:
+            with self._phase("repair", len(population)):
+                population = self._evaluate_stale([self._repair(individual) for individual in population])
+        if len(population) < size:
+            population += self._initial_population(size - len(population))
+        return population
+
+    # Популяція як матриця бітів (P, n) для контрольної точки
+    def _population_bits(self, population: List[Individual]) -> np.ndarray:
+        return np.array([self._decode(individual.genome) for individual in population], dtype=np.uint8).reshape(len(population), len(self.items))
+
+    def _rng_state(self) -> bytes:
+        return rng_state(self._rng, self._random)
+
+    def _restore_rng(self, state: bytes) -> None:
+        restore_rng_state(state, self._rng, self._random)
 
-        final_population: List[List[int]] = self._evolve_population(population, self.generations)
+    # Запис контрольної точки після покоління gen: кожні checkpoint_interval поколінь і наприкінці запуску
+    # (final — якщо останнє покоління ще не записане)
+    def _checkpoint(self, gen: int, populations: list, rng_states: Optional[List[bytes]] = None, final: bool = False) -> None:
+        if self.checkpoint_path is None:
+            return
+        generation: int = gen + 1
+        if final:
+            if generation <= 0 or generation == self._checkpointed_generation:
+                return
+        elif not self._checkpoint_due(gen):
+            return
+        with self._phase("checkpoint"):
+            bits = [self._population_bits(population) for population in populations]
+            self._save_checkpoint(generation, bits, rng_states or [self._rng_state()])
 
-        best_individual: List[int] = max(final_population, key=self._fitness)
-        best_value: int = sum(self.items[i][1] for i in range(num_items) if best_individual[i] == 1)
-        best_weight: int = sum(self.items[i][0] for i in range(num_items) if best_individual[i] == 1)
+    def _checkpoint_due(self, gen: int) -> bool:
+        return self.checkpoint_path is not None and self.checkpoint_interval > 0 and (gen + 1) % self.checkpoint_interval == 0
 
-        return best_individual, best_value, best_weight
+    # Частина контрольної точки від острова; файл пишеться, щойно це покоління надіслали всі острови
+    def _checkpoint_part(
+        self,
+        parts: Dict[int, Dict[int, Tuple[np.ndarray, bytes]]],
+        num_islands: int,
+        id: int,
+        generation: int,
+        bits: np.ndarray,
+        state: bytes,
+    ) -> None:
+        island_parts = parts.setdefault(generation, {})
+        island_parts[id] = (bits, state)
+        if len(island_parts) < num_islands:
+            return
+        for done in [g for g in parts if g <= generation]:
+            del parts[done]
+        with self._phase("checkpoint"):
+            self._save_checkpoint(
+                generation,
+                [island_parts[i][0] for i in range(num_islands)],
+                [island_parts[i][1] for i in range(num_islands)],
+            )
+
+    def _save_checkpoint(self, generation: int, bits: List[np.ndarray], rng_states: List[bytes]) -> None:
+        checkpoint = Checkpoint(generation, len(self.items), self._instance_fingerprint(), bits, rng_states)
+        write_checkpoint(self.checkpoint_path, checkpoint)
+        self._checkpointed_generation = generation
+
+    def _finish_run(self, population: List[Individual], *worker_cache_stats: Dict[str, int]) -> None:
+        best: Individual = max(population, key=by_fitness)
+        self._set_result(self._decode(best.genome), best.value, best.weight)
+        self._report_cache(*worker_cache_stats)
+        self._finish_profiler()
+
+    # Підсумок запуску для всіх рушіїв: результат і розрив до еталону, якщо він заданий
+    def _set_result(self, solution: List[int], value: int, weight: int) -> None:
+        self.result = (solution, value, weight)
+        if self.reference_value is None:
+            self.optimality_gap = None
+            return
+        self.optimality_gap = optimality_gap(value, self.reference_value)
+        self._log(f"Розрив до еталону ({self.reference}): {self.optimality_gap:.2%}")
+
+    def _diversity(self, population: List[Individual]) -> float:
+        return len({self._pack_genome(ind.genome) for ind in population}) / len(population)
+
+    def _snapshot(self, gen: int, population: List[Individual], start: float, island: Optional[int] = None) -> GenerationStats:
+        best: Individual = max(population, key=by_fitness)
+        return GenerationStats(
+            gen + 1,
+            best.fitness,
+            math.fsum(ind.fitness for ind in population) / len(population),
+            best.weight,
+            best.value,
+            self._diversity(population),
+            time.perf_counter() - start,
+            island,
+        )
+
+    # Знімки поколінь поверх генератора (номер, популяція); break у циклі споживача зупиняє запуск
+    def _stream(self, generations: Iterator[Tuple[int, List[Individual]]]) -> Iterator[GenerationStats]:
+        start: float = time.perf_counter()
+        with closing(generations):
+            for gen, population in generations:
+                yield self._snapshot(gen, population, start)
+
+    def run_iter(self) -> Iterator[GenerationStats]:
+        return self._stream(self._run_generations())
+
+    def run(self) -> Tuple[List[int], int, int]:
+        for _ in self._run_generations():
+            pass
+        return self.result
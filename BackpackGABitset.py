@@ -0,0 +1,129 @@
+import random
+from typing import List, Tuple
+
+from BackpackGA import BackpackGA, Individual
+from BackpackGAIslandModel import BackpackGAIslandModel
+from BackpackGAMasterSlave import BackpackGAMasterSlave
+
+
+# Бітові площини чисел: x_i = sum(scale * біт_i(mask)), тож sum(x_i для обраних) = sum(scale * popcount(genome & mask))
+def bit_planes(numbers: List[int]) -> List[Tuple[int, int]]:
+    if any(x < 0 for x in numbers):
+        raise ValueError("Бітове кодування підтримує лише невід'ємні ваги та цінності.")
+    planes: List[Tuple[int, int]] = []
+    for b in range(max(numbers, default=0).bit_length()):
+        mask = int("".join("1" if (x >> b) & 1 else "0" for x in reversed(numbers)), 2)
+        if mask:
+            planes.append((1 << b, mask))
+    return planes
+
+
+# Маска з num_bits бітів, кожен з яких встановлено з імовірністю p (точність 2^-precision).
+# Кожен раунд — одне getrandbits: OR для одиничних двійкових цифр p, AND — для нульових
+def random_mask(num_bits: int, p: float, precision: int = 16, rng=random) -> int:
+    scaled: int = round(p * (1 << precision))
+    if scaled <= 0:
+        return 0
+    if scaled >= 1 << precision:
+        return (1 << num_bits) - 1
+
+    mask: int = 0
+    for b in range((scaled & -scaled).bit_length() - 1, precision):
+        r: int = rng.getrandbits(num_bits)
+        mask = mask | r if (scaled >> b) & 1 else mask & r
+    return mask
+
+
+# Геном — ціле число Python, біт i якого означає, що предмет i у рюкзаку.
+# Займає ~n/8 байт замість ~8n байт для List[int] і так само компактно серіалізується між процесами
+class BitsetGenomeMixin:
+    _item_state = BackpackGA._item_state + ("_num_items", "_weight_planes", "_value_planes")
+
+    def _prepare_items(self) -> None:
+        super()._prepare_items()
+        self._num_items: int = len(self.items)
+        self._weight_planes: List[Tuple[int, int]] = bit_planes(self._weights)
+        self._value_planes: List[Tuple[int, int]] = bit_planes(self._values)
+
+    # Нащадок кросовера оцінюється повністю (_cached_individual)
+    def _evaluates_genomes(self) -> bool:
+        return True
+
+    def _create_individual(self, num_items: int) -> int:
+        return self._random.getrandbits(num_items)
+
+    def _totals(self, genome: int) -> Tuple[int, int]:
+        total_weight: int = sum(scale * (genome & mask).bit_count() for scale, mask in self._weight_planes)
+        total_value: int = sum(scale * (genome & mask).bit_count() for scale, mask in self._value_planes)
+        return total_weight, total_value
+
+    # Гени, якими батьки відрізняються, беруться від гіршого за випадковою маскою
+    def _crossover(self, p1: Individual, p2: Individual) -> Individual:
+        if p1.fitness > p2.fitness:
+            better, worse = p1, p2
+        else:
+            better, worse = p2, p1
+
+        prob_better: float = 0.55
+        differ: int = better.genome ^ worse.genome
+        if not differ:
+            return Individual(better.genome, better.fitness, better.weight, better.value)
+
+        child: int = better.genome ^ (differ & random_mask(self._num_items, 1.0 - prob_better, rng=self._random))
+        return self._cached_individual(child)
+
+    def _crossover_all(self, parent_pairs: List[Tuple[Individual, Individual]]) -> List[Individual]:
+        return [self._crossover(p1, p2) for p1, p2 in parent_pairs]
+
+    def _flip(self, individual: Individual, positions: List[int]) -> Individual:
+        if not positions:
+            return individual
+
+        genome: int = individual.genome
+        total_weight: int = individual.weight
+        total_value: int = individual.value
+        for i in positions:
+            bit: int = 1 << i
+            if genome & bit:
+                total_weight -= self._weights[i]
+                total_value -= self._values[i]
+            else:
+                total_weight += self._weights[i]
+                total_value += self._values[i]
+            genome ^= bit
+
+        individual.genome = genome
+        individual.weight = total_weight
+        individual.value = total_value
+        individual.fitness = self._score(total_weight, total_value)
+        return individual
+
+    def _pack_genome(self, genome: int) -> bytes:
+        return genome.to_bytes(self._genome_nbytes(), "little")
+
+    def _unpack_genome(self, data: bytes) -> int:
+        return int.from_bytes(data, "little")
+
+    def _genome_nbytes(self) -> int:
+        return (self._num_items + 7) // 8
+
+    def _decode(self, genome: int) -> List[int]:
+        return [(genome >> i) & 1 for i in range(self._num_items)]
+
+    def _encode(self, bits: List[int]) -> int:
+        return sum(1 << i for i, bit in enumerate(bits) if bit)
+
+    def _gene(self, genome: int, i: int) -> int:
+        return (genome >> i) & 1
+
+
+class BackpackGABitset(BitsetGenomeMixin, BackpackGA):
+    pass
+
+
+class BackpackGAMasterSlaveBitset(BitsetGenomeMixin, BackpackGAMasterSlave):
+    pass
+
+
+class BackpackGAIslandModelBitset(BitsetGenomeMixin, BackpackGAIslandModel):
+    pass
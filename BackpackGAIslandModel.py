@@ -1,91 +1,264 @@
-from BackpackGA import BackpackGA
+from BackpackGA import BackpackGA, GenerationStats, Individual, by_fitness
+from IslandExecutor import IslandExecutor
+from Profiler import PhaseProfiler
+from MigrationMailbox import MigrantRecord, MigrationMailbox
+from MigrationTopology import (
+    check_migration_config,
+    max_in_degree,
+    migration_targets,
+    replace_with_migrants,
+    select_emigrants,
+)
 import multiprocessing
+import queue
+import threading
 import time
-from threading import Thread
-from typing import List, Tuple, Dict
+import traceback
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 
 class BackpackGAIslandModel(BackpackGA):
-    # Окремий процес, що виконує еволюцію на одному острові
+    # Окремий процес, що виконує еволюцію на одному острові. Початкова популяція створюється на острові
+    # з власних потоків випадкових чисел (або з бітів контрольної точки).
+    # З бар'єром міграція синхронна: острови надсилають емігрантів, чекають одне одного, забирають
+    # мігрантів цієї епохи і знову чекають, тож вміст скриньок не залежить від швидкості островів
     def _island_worker(
         self,
         id: int,
-        population: List[List[int]],
-        in_queue: multiprocessing.Queue,
-        migration_queue: multiprocessing.Queue,
+        island_pop_size: int,
+        mailboxes: List[MigrationMailbox],
         result_queue: multiprocessing.Queue,
         migration_size: int,
         migration_interval: int,
-        accepted_migrations_counter: multiprocessing.Value = None
+        migration_counter: multiprocessing.Value = None,
+        accepted_migrations_counter: multiprocessing.Value = None,
+        topology: str = "ring",
+        emigrant_policy: str = "best",
+        replacement_policy: str = "worst",
+        stop_event: multiprocessing.Event = None,
+        stats_queue: Optional[multiprocessing.Queue] = None,
+        run_start: float = 0.0,
+        start_generation: int = 0,
+        rng_state: Optional[bytes] = None,
+        snapshots: bool = True,
+        initial_bits: Optional[np.ndarray] = None,
+        seed_sequence: Optional[np.random.SeedSequence] = None,
+        barrier: Optional[multiprocessing.Barrier] = None
     ) -> None:
-        self._log(f"[Острів {id}] Стартує.")
-        pop_size = len(population)
-
-        for gen in range(self.generations):
-            # Перевірка черги на наявність мігрантів
-            try:
-                migrants: List[List[int]] = in_queue.get_nowait()
-                population.extend(migrants)
-                population = sorted(population, key=self._fitness, reverse=True)[:pop_size]
-                self._log(f"[Острів {id}] Прийняв {len(migrants)} мігрантів")
-
-                # Підрахунок прийнятих міграцій
-                if accepted_migrations_counter is not None:
-                    with accepted_migrations_counter.get_lock():
-                        accepted_migrations_counter.value += 1
-            except:
-                pass
-
-            # Еволюція на одне покоління
-            population = list(self._evolve_population(population, 1))
-
-            # Періодична міграція найкращих особин
-            if gen % migration_interval == 0:
-                best = sorted(population, key=self._fitness, reverse=True)[:migration_size]
-                migration_queue.put((id, best))
-
-        # Надсилання фінальної популяції
-        result_queue.put((id, population))
-        self._log(f"[Острів {id}] Завершено. Надіслав результат.")
-        return
-
-    # Окремий потік, що керує міжострівною міграцією
-    def _migration_worker(
+        try:
+            self._log(f"[Острів {id}] Стартує.")
+            start_time = time.perf_counter()
+            # Власний монітор зупинки острова; stop_event спільний для всіх островів
+            monitor = self._start_monitor(stop_event)
+            # Кеш і профайлер успадковано від батьківського процесу — рахуємо лише власні події
+            if self._cache is not None:
+                self._cache.reset_stats()
+            self._profiler = PhaseProfiler() if self.profile else None
+
+            # Потоки острова — дочірня послідовність запуску; при продовженні — стан з контрольної точки
+            if seed_sequence is not None:
+                self._reseed(seed_sequence)
+            population: List[Individual] = self._start_population(island_pop_size, initial_bits)
+            if rng_state is not None:
+                self._restore_rng(rng_state)
+
+            num_islands = len(mailboxes)
+            # Час, витрачений на надсилання і прийом мігрантів (накладні витрати топології)
+            send_time = receive_time = 0.0
+            migrants_sent = migrants_replaced = 0
+            # Після зламаного бар'єра стан острова вже не збігається з непереривним запуском
+            diverged = False
+
+            for gen in range(start_generation, self.generations):
+                # Асинхронна міграція: мігранти, що надійшли від сусідів, забираються на початку покоління
+                if barrier is None:
+                    receive_start = time.perf_counter()
+                    migrants_replaced += self._receive_migrants(id, population, mailboxes[id], replacement_policy, accepted_migrations_counter)
+                    receive_time += time.perf_counter() - receive_start
+
+                # Еволюція на одне покоління
+                population = list(self._evolve_population(population, 1))
+
+                # Періодична міграція: емігранти пишуться просто у скриньки сусідів за топологією
+                if gen % migration_interval == 0:
+                    send_start = time.perf_counter()
+                    emigrants = self._to_records(select_emigrants(population, migration_size, emigrant_policy, self._random))
+                    targets = migration_targets(topology, id, num_islands, self._random)
+                    for target_island in targets:
+                        with self._phase("mailbox_put"):
+                            mailboxes[target_island].put(id, emigrants)
+                        self._log(f"[Міграція] {len(emigrants)} індивідів з острова {id} → {target_island}")
+                    migrants_sent += len(emigrants) * len(targets)
+
+                    # Підрахунок загальної кількості міграцій
+                    if migration_counter is not None:
+                        with migration_counter.get_lock():
+                            migration_counter.value += len(targets)
+                    send_time += time.perf_counter() - send_start
+
+                    # Синхронна міграція; якщо інший острів уже зупинився, бар'єр зламано — далі асинхронно
+                    if barrier is not None:
+                        receive_start = time.perf_counter()
+                        try:
+                            with self._phase("barrier_wait"):
+                                barrier.wait()
+                            migrants_replaced += self._receive_migrants(id, population, mailboxes[id], replacement_policy, accepted_migrations_counter)
+                            with self._phase("barrier_wait"):
+                                barrier.wait()
+                        except threading.BrokenBarrierError:
+                            barrier = None
+                            diverged = True
+                        receive_time += time.perf_counter() - receive_start
+
+                best = max(population, key=by_fitness)
+                stop = monitor is not None and monitor.update(best.fitness, best.value)
+
+                # Знімок покоління для run_iter() батьківського процесу
+                if stats_queue is not None and snapshots:
+                    stats_queue.put(self._snapshot(gen, population, run_start, id))
+                # Частина контрольної точки (геноми упаковано): файл пише батьківський процес.
+                # Після пропущеної синхронної міграції частини не надсилаються, тож точка з них була б неточною
+                if stats_queue is not None and self._checkpoint_due(gen) and not diverged:
+                    with self._phase("checkpoint"):
+                        packed = np.packbits(self._population_bits(population), axis=-1)
+                        stats_queue.put(("checkpoint", id, gen + 1, packed, self._rng_state()))
+
+                if stop:
+                    self._log(f"[Острів {id}] Зупинка після покоління {gen+1}: {monitor.reason}")
+                    break
+
+            generations_done: int = start_generation + monitor.generations if monitor is not None else self.generations
+            # Острови, що чекають на бар'єрі, не повинні чекати на острів, який зупинився раніше
+            if barrier is not None and generations_done < self.generations:
+                barrier.abort()
+
+            # Надсилання фінальної популяції
+            cache_stats = self._cache.stats() if self._cache is not None else {}
+            island_stats = {
+                "send_time": send_time,
+                "receive_time": receive_time,
+                "total_time": time.perf_counter() - start_time,
+                "migrants_sent": migrants_sent,
+                "migrants_replaced": migrants_replaced,
+                "generations": generations_done,
+                "stop_reason": monitor.reason if monitor is not None else None,
+                "profile": self._profiler.report() if self._profiler is not None else {},
+                "rng_state": self._rng_state() if self.checkpoint_path is not None else None,
+            }
+            result_queue.put((id, population, cache_stats, island_stats))
+            # Маркер завершення острова для потоку знімків
+            if stats_queue is not None:
+                stats_queue.put(None)
+            self._log(f"[Острів {id}] Завершено. Надіслав результат.")
+        except Exception:
+            # Помилка острова не повинна лишити батьківський процес чекати вічно: сусіди зупиняються,
+            # а замість результату надсилається текст помилки (як у IslandExecutor)
+            if stop_event is not None:
+                stop_event.set()
+            if barrier is not None:
+                barrier.abort()
+            result_queue.put((id, None, traceback.format_exc(), None))
+            if stats_queue is not None:
+                stats_queue.put(None)
+
+    # Вичитування власної скриньки: мігранти від сусідів заміщують особин популяції на місці.
+    # Повідомлення обробляються в порядку номерів островів-відправників, а не надходження
+    def _receive_migrants(
         self,
-        in_queues: List[multiprocessing.Queue],
-        num_islands: int,
-        migration_queue: multiprocessing.Queue,
-        migration_active: multiprocessing.Event,
-        migration_count: multiprocessing.Value
-    ) -> None:
-        self._log("[Міграційний процес] Стартував")
-        while migration_active.is_set():
-            try:
-                island_id, migrants = migration_queue.get_nowait()
-                # Міграція до наступного острова по колу
-                target_island = (island_id + 1) % num_islands
-                in_queues[target_island].put(migrants)
-
-                # Підрахунок загальної кількості міграцій
-                with migration_count.get_lock():
-                    migration_count.value += 1
-
-                self._log(f"[Міграція] {len(migrants)} індивідів з острова {island_id} → {target_island}")
-            except:
-                time.sleep(0.2)
-        self._log("[Міграційний процес] Завершився")
+        id: int,
+        population: List[Individual],
+        mailbox: MigrationMailbox,
+        replacement_policy: str,
+        accepted_migrations_counter: Optional[multiprocessing.Value],
+    ) -> int:
+        with self._phase("mailbox_get"):
+            messages = sorted(mailbox.get_all(), key=itemgetter(0))
+        replaced: int = 0
+        for source, records in messages:
+            if self._profiler is not None:
+                self._profiler.count("migrations_received")
+            replaced += replace_with_migrants(population, self._from_records(records), replacement_policy, self._random)
+            self._log(f"[Острів {id}] Прийняв {len(records)} мігрантів з острова {source}")
+
+            # Підрахунок прийнятих міграцій
+            if accepted_migrations_counter is not None:
+                with accepted_migrations_counter.get_lock():
+                    accepted_migrations_counter.value += 1
+        return replaced
+
+    # Серіалізація мігрантів для скриньки: геном пакується, фітнес/вага/цінність передаються як є
+    def _to_records(self, migrants: List[Individual]) -> List[MigrantRecord]:
+        return [(ind.fitness, ind.weight, ind.value, self._pack_genome(ind.genome)) for ind in migrants]
+
+    def _from_records(self, records: List[MigrantRecord]) -> List[Individual]:
+        return [
+            Individual(self._unpack_genome(genome), fitness, weight, value)
+            for fitness, weight, value, genome in records
+        ]
 
     # Основний метод запуску Island Model
     def run(
         self,
         num_threads: int,
-        migration_interval: int = 10
+        migration_interval: int = 10,
+        topology: str = "ring",
+        emigrant_policy: str = "best",
+        replacement_policy: str = "worst",
+        executor: Optional[IslandExecutor] = None
     ) -> Tuple[List[int], int, int]:
+        for _ in self._run_islands(num_threads, migration_interval, topology, emigrant_policy, replacement_policy, False, executor):
+            pass
+        return self.result
+
+    # Знімки поколінь усіх островів у порядку надходження (кожен позначено номером острова).
+    # Переривання ітерації зупиняє острови на наступному поколінні; результат доступний у self.result
+    def run_iter(
+        self,
+        num_threads: int,
+        migration_interval: int = 10,
+        topology: str = "ring",
+        emigrant_policy: str = "best",
+        replacement_policy: str = "worst",
+        executor: Optional[IslandExecutor] = None
+    ) -> Iterator[GenerationStats]:
+        return self._run_islands(num_threads, migration_interval, topology, emigrant_policy, replacement_policy, True, executor)
+
+    # Очікування повідомлення островів з черги. Процес острова, що загинув без результату (SIGKILL, OOM),
+    # інакше лишив би батьківський процес чекати вічно; продовжити можна з останньої контрольної точки
+    def _island_get(self, source: multiprocessing.Queue, processes: List[multiprocessing.Process]):
+        while True:
+            try:
+                return source.get(timeout=1.0)
+            except queue.Empty:
+                dead = [(i, p.exitcode) for i, p in enumerate(processes) if not p.is_alive() and p.exitcode != 0]
+                if dead:
+                    islands = ", ".join(f"{i} (код {exitcode})" for i, exitcode in dead)
+                    raise RuntimeError(
+                        f"Процес острова аварійно завершився без результату: {islands}. "
+                        "Продовжити можна з останньої контрольної точки: resume()."
+                    )
+
+    def _run_islands(
+        self,
+        num_threads: int,
+        migration_interval: int,
+        topology: str,
+        emigrant_policy: str,
+        replacement_policy: str,
+        stream: bool,
+        executor: Optional[IslandExecutor] = None
+    ) -> Iterator[GenerationStats]:
+
+        check_migration_config(topology, emigrant_policy, replacement_policy)
 
         if num_threads < 2:
-            raise ValueError("Необхідно принаймні 2 потоки: 1 для міграцій, решта для островів.")
+            raise ValueError("Необхідно принаймні 2 потоки: по одному на острів.")
 
-        num_islands = num_threads - 1
+        # Окремий потік-посередник для міграцій не потрібен: кожен потік — це острів
+        num_islands = num_threads
 
         # Перевірка, щоб популяція була достатньою для розподілу
         min_island_pop = 4
@@ -95,86 +268,216 @@ class BackpackGAIslandModel(BackpackGA):
         if num_islands < 1:
             raise ValueError("Неможливо розподілити популяцію по островах. Збільште розмір популяції або зменшіть кількість потоків.")
 
-        num_items: int = len(self.items)
         island_pop_size: int = self.population_size // num_islands
         migration_size: int = max(1, island_pop_size // 10)
 
-        # Створення початкових популяцій для кожного острова
-        populations: List[List[List[int]]] = [
-            [self._create_individual(num_items) for _ in range(island_pop_size)]
-            for _ in range(num_islands)
-        ]
-
-        # Черги для прийому мігрантів на кожному острові (кожен острів має окрему чергу)
-        in_queues: List[multiprocessing.Queue] = [multiprocessing.Queue() for _ in range(num_islands)]
-        # Загальна черга, куди острови надсилають своїх найкращих особин для міграції
-        migration_queue: multiprocessing.Queue = multiprocessing.Queue()
-        # Черга для збору фінальних популяцій від усіх островів після завершення еволюції
-        result_queue: multiprocessing.Queue = multiprocessing.Queue()
-
-
-        # Синхронізація і підрахунки
-        migration_active: multiprocessing.Event = multiprocessing.Event() # сигнальний об’єкт, спеціально створений для безпечної та ефективної синхронізації між процесами.
-
-
-        migration_active.set() # set() migration_active = True
-
-
-        migration_count: multiprocessing.Value = multiprocessing.Value('i', 0) # аналог атомарної змінної з блокуванням, 'i' — ціле число (int) 
-        accepted_migrations_count: multiprocessing.Value = multiprocessing.Value('i', 0)
-
-        # Запуск островів у окремих процесах
-        processes: List[multiprocessing.Process] = []
-        for i in range(num_islands):
-            p = multiprocessing.Process(
-                target=self._island_worker,
-                args=(
-                    i,
-                    populations[i],
-                    in_queues[i],
-                    migration_queue,
-                    result_queue,
-                    migration_size,
-                    migration_interval,
-                    accepted_migrations_count
-                )
-            )
-            processes.append(p)
-            p.start()
-
-        # Запуск окремого потоку для координації міграцій
-        migration_thread = Thread(
-            target=self._migration_worker,
-            args=(in_queues, num_islands, migration_queue, migration_active, migration_count)
-        )
-        migration_thread.start()
-
-        # Збір результатів з кожного острова
-        final_populations: Dict[int, List[List[int]]] = {}
-        for _ in range(num_islands):
-            idx, pop = result_queue.get()
-            final_populations[idx] = pop
-
-        self._log("Всі острови завершили роботу")
-
-        # Завершення міграцій
-        migration_active.clear()
-        migration_thread.join()
+        self._start_profiler()
+        start, start_bits, rng_states = self._run_start(num_islands, island_pop_size)
+        # Частини контрольних точок надходять тією самою чергою, що й знімки поколінь
+        use_stats_queue: bool = stream or self.checkpoint_path is not None
+
+        if executor is not None:
+            # Постійні процеси виконавця: черги, лічильники й сигнал зупинки вже створено
+            executor.begin(num_islands)
+            result_queue = executor.result_queue
+            migration_count = executor.migration_counter
+            accepted_migrations_count = executor.accepted_migrations_counter
+            stop_event = executor.stop_event
+            stats_queue = executor.stats_queue if use_stats_queue else None
+            barrier = executor.barrier(num_islands) if self.seed is not None else None
+        else:
+            # Черга для збору фінальних популяцій від усіх островів після завершення еволюції
+            result_queue: multiprocessing.Queue = multiprocessing.Queue()
+
+            migration_count: multiprocessing.Value = multiprocessing.Value('i', 0) # аналог атомарної змінної з блокуванням, 'i' — ціле число (int)
+            accepted_migrations_count: multiprocessing.Value = multiprocessing.Value('i', 0)
+            # Сигнал зупинки для всіх островів (ціль досягнуто або вичерпано бюджет часу)
+            stop_event: multiprocessing.Event = multiprocessing.Event()
+            # Черга знімків поколінь (для run_iter()) і частин контрольних точок
+            stats_queue: Optional[multiprocessing.Queue] = multiprocessing.Queue() if use_stats_queue else None
+            # З seed міграція синхронна (бар'єр), щоб результат не залежав від швидкості островів
+            barrier: Optional[multiprocessing.Barrier] = multiprocessing.Barrier(num_islands) if self.seed is not None else None
+        # Незалежні потоки випадкових чисел островів
+        island_sequences: List[np.random.SeedSequence] = self._seed_sequence.spawn(num_islands)
+        run_start = time.perf_counter()
+
+        mailboxes: List[MigrationMailbox] = []
+        try:
+            # Скриньки мігрантів у спільній пам'яті (по одній на острів): острови пишуть у скриньку сусіда напряму,
+            # тож мігранти не проходять через батьківський процес
+            mailbox_capacity: int = 4 * max(1, max_in_degree(topology, num_islands))
+            for i in range(num_islands):
+                mailboxes.append(MigrationMailbox(
+                    capacity=mailbox_capacity,
+                    max_migrants=migration_size,
+                    genome_nbytes=self._genome_nbytes(),
+                    lock=executor.mailbox_locks[i] if executor is not None else None,
+                ))
+
+            processes: List[multiprocessing.Process] = []
+            if executor is not None:
+                # Острів i виконує процес i виконавця
+                processes = executor._processes[:num_islands]
+                for i in range(num_islands):
+                    with self._phase("submit"):
+                        executor.submit(
+                            self, i, island_pop_size, island_sequences[i], use_stats_queue,
+                            synchronous=barrier is not None,
+                            initial_bits=start_bits[i],
+                            start_generation=start,
+                            rng_state=rng_states[i] if rng_states else None,
+                            snapshots=stream,
+                            mailboxes=mailboxes,
+                            migration_size=migration_size,
+                            migration_interval=migration_interval,
+                            topology=topology,
+                            emigrant_policy=emigrant_policy,
+                            replacement_policy=replacement_policy,
+                            run_start=run_start,
+                        )
+            else:
+                # Запуск островів у окремих процесах
+                for i in range(num_islands):
+                    p = multiprocessing.Process(
+                        target=self._island_worker,
+                        args=(i, island_pop_size),
+                        kwargs=dict(
+                            mailboxes=mailboxes,
+                            result_queue=result_queue,
+                            migration_size=migration_size,
+                            migration_interval=migration_interval,
+                            migration_counter=migration_count,
+                            accepted_migrations_counter=accepted_migrations_count,
+                            topology=topology,
+                            emigrant_policy=emigrant_policy,
+                            replacement_policy=replacement_policy,
+                            stop_event=stop_event,
+                            stats_queue=stats_queue,
+                            run_start=run_start,
+                            start_generation=start,
+                            rng_state=rng_states[i] if rng_states else None,
+                            snapshots=stream,
+                            initial_bits=start_bits[i],
+                            seed_sequence=island_sequences[i],
+                            barrier=barrier,
+                        ),
+                    )
+                    processes.append(p)
+                    with self._phase("process_start"):
+                        p.start()
+
+            # Потік знімків: кожен острів завершує свою частину маркером None
+            running = num_islands if stats_queue is not None else 0
+            checkpoint_parts: Dict[int, Dict[int, Tuple[np.ndarray, bytes]]] = {}
+            interrupted: bool = False
+            while running:
+                snapshot = self._island_get(stats_queue, processes)
+                if snapshot is None:
+                    running -= 1
+                elif isinstance(snapshot, tuple):
+                    _, idx, generation, packed, state = snapshot
+                    bits = np.unpackbits(packed, axis=-1, count=len(self.items))
+                    self._checkpoint_part(checkpoint_parts, num_islands, idx, generation, bits, state)
+                elif not interrupted:
+                    try:
+                        yield snapshot
+                    except GeneratorExit:
+                        # Споживач перервав ітерацію: зупиняємо острови й дочитуємо решту черги
+                        # (частини контрольних точок, що ще в дорозі, теж записуються),
+                        # щоб процеси могли завершитися, а результат — сформуватися
+                        interrupted = True
+                        stop_event.set()
+
+            # Збір результатів з кожного острова
+            final_populations: Dict[int, List[Individual]] = {}
+            final_rng_states: Dict[int, Optional[bytes]] = {}
+            island_cache_stats: List[Dict[str, int]] = []
+            island_stats: List[Dict[str, float]] = []
+            island_errors: List[str] = []
+            for _ in range(num_islands):
+                with self._phase("result_get"):
+                    idx, pop, cache_stats, stats = self._island_get(result_queue, processes)
+                if pop is None:
+                    island_errors.append(f"[Острів {idx}]\n{cache_stats}")
+                    continue
+                final_populations[idx] = pop
+                final_rng_states[idx] = stats["rng_state"]
+                island_cache_stats.append(cache_stats)
+                island_stats.append(stats)
+
+            if executor is None:
+                for p in processes:
+                    with self._phase("process_join"):
+                        p.join()
+
+            self._log("Всі острови завершили роботу")
+            dropped_migrations = sum(mailbox.dropped for mailbox in mailboxes)
+        except RuntimeError:
+            # Загиблий острів: решта островів зупиняється; виконавець без одного з процесів
+            # непридатний до наступних запусків, тож закривається (його можна перезапустити start())
+            stop_event.set()
+            if barrier is not None:
+                barrier.abort()
+            if executor is not None:
+                executor.close()
+            for p in processes:
+                if p.is_alive():
+                    p.terminate()
+                p.join()
+            raise
+        finally:
+            for mailbox in mailboxes:
+                mailbox.unlink()
+            if executor is not None:
+                executor.end()
+
+        if island_errors:
+            raise RuntimeError("Острови завершились помилкою:\n" + "\n".join(island_errors))
 
         self._log("Обробка результатів...")
 
-        # Пошук найкращого індивіда серед усіх островів
-        best_individual: List[int] = max(
-            (ind for pop in final_populations.values() for ind in pop),
-            key=self._fitness
+        # Пошук найкращого індивіда серед усіх островів (у порядку номерів островів, а не надходження результатів)
+        best: Individual = max(
+            (ind for idx in sorted(final_populations) for ind in final_populations[idx]),
+            key=by_fitness
         )
 
-        # Обрахунок ваги та цінності найкращого рішення
-        best_value: int = sum(self.items[i][1] for i in range(num_items) if best_individual[i] == 1)
-        best_weight: int = sum(self.items[i][0] for i in range(num_items) if best_individual[i] == 1)
+        # Причина зупинки: та, що спрацювала першою на будь-якому острові (а не сигнал від іншого острова)
+        reasons = [stats["stop_reason"] for stats in island_stats if stats["stop_reason"] not in (None, "stop_signal")]
+        self.stop_reason = reasons[0] if reasons else None
+        self.generations_run = max(stats["generations"] for stats in island_stats)
+        # Після переривання острови зупинились на різних поколіннях: продовження точне лише
+        # з останньої повної контрольної точки, тож підсумкова не пишеться
+        if not interrupted:
+            self._checkpoint(
+                self.generations_run - 1,
+                [final_populations[i] for i in range(num_islands)],
+                [final_rng_states[i] for i in range(num_islands)],
+                final=True,
+            )
+
+        # Накладні витрати міграції для обраної топології (сумарно по островах)
+        total_time = sum(stats["total_time"] for stats in island_stats)
+        overhead = sum(stats["send_time"] + stats["receive_time"] for stats in island_stats)
+        self.migration_stats = {
+            "topology": topology,
+            "islands": num_islands,
+            "messages_sent": migration_count.value,
+            "messages_accepted": accepted_migrations_count.value,
+            "messages_dropped": dropped_migrations,
+            "migrants_sent": sum(stats["migrants_sent"] for stats in island_stats),
+            "migrants_replaced": sum(stats["migrants_replaced"] for stats in island_stats),
+            "send_time": sum(stats["send_time"] for stats in island_stats),
+            "receive_time": sum(stats["receive_time"] for stats in island_stats),
+            "overhead_share": overhead / total_time if total_time > 0 else 0.0,
+        }
 
         # Вивід статистики
+        self._log(f"Топологія міграції: {topology}, накладні витрати: {self.migration_stats['overhead_share']:.2%} часу островів")
         self._log(f"Загальна кількість міграцій: {migration_count.value}")
         self._log(f"Загальна кількість прийнятих міграцій: {accepted_migrations_count.value}")
+        self._log(f"Міграцій, перезаписаних у повних скриньках: {dropped_migrations}")
+        self._report_cache(*island_cache_stats)
+        self._finish_profiler(*(stats["profile"] for stats in island_stats))
 
-        return best_individual, best_value, best_weight
+        self._set_result(self._decode(best.genome), best.value, best.weight)
@@ -1,42 +1,124 @@
-from typing import List, Tuple
+import heapq
+import os
+import pickle
+import queue
+import time
+from contextlib import closing
+from typing import Dict, Iterator, List, Optional, Tuple
 from multiprocessing import Pool
-from BackpackGA import BackpackGA
+
+import numpy as np
+
+from BackpackGA import BackpackGA, GenerationStats, Individual, by_fitness, population_fitness
+from FitnessCache import merge_stats
+
+# Екземпляр GA у процесі-воркері: передається один раз через initializer,
+# тому кеш фітнесу воркера живе між завданнями і поколіннями
+_worker_ga: Optional["BackpackGAMasterSlave"] = None
+
+# Кількість нащадків в одній порції воркера, коли задано seed
+RNG_BLOCK: int = 32
+
+
+def _init_worker(ga: "BackpackGAMasterSlave") -> None:
+    global _worker_ga
+    _worker_ga = ga
+    ga._profiler = None
+    if ga._cache is not None:
+        ga._cache.reset_stats()
+
+
+# Створення порції нащадків у воркері. Завдання й результат серіалізуються явно (pickle),
+# щоб master міг виміряти час серіалізації окремо від очікування пулу.
+# Завдання: (батьківські пари, seed порції) — нащадки залежать лише від завдання, а не від воркера.
+# Результат: (нащадки, приріст лічильників кешу, (pid воркера, розмір його кешу), час обчислень у воркері)
+def _breed_chunk(payload: bytes) -> bytes:
+    parent_pairs, seed = pickle.loads(payload)
+    start = time.perf_counter()
+    ga = _worker_ga
+    ga._reseed(np.random.SeedSequence(seed))
+    cache = ga._cache
+    before = cache.stats() if cache is not None else {}
+    children = ga._breed(parent_pairs)
+    cache_delta: Dict[str, int] = {}
+    cache_size: Optional[Tuple[int, int]] = None
+    if cache is not None:
+        after = cache.stats()
+        cache_delta = {name: after[name] - before[name] for name in ("hits", "misses", "evictions")}
+        cache_size = (os.getpid(), after["size"])
+    return pickle.dumps((children, cache_delta, cache_size, time.perf_counter() - start), protocol=pickle.HIGHEST_PROTOCOL)
+
 
 class BackpackGAMasterSlave(BackpackGA):
-    def _mutate_crossover(self, p1: List[int], p2: List[int]) -> List[int]:
-        child = self._crossover(p1, p2)
-        return self._mutate(child)
+    # Нащадки порції оцінюються у воркері й повертаються разом зі своїм фітнесом
+    def _breed(self, parent_pairs: List[Tuple[Individual, Individual]]) -> List[Individual]:
+        children: List[Individual] = self._mutate_all(self._crossover_all(parent_pairs))
+        if self.repair:
+            children = [self._repair(child) for child in children]
+        return self._evaluate_stale(children)
 
-    def _evolve_population(self, population: List[List[int]], num_threads: int) -> List[List[int]]:
-        with Pool(processes=num_threads) as pool:
-            for gen in range(self.generations):
-                self._log(f"\n--- Покоління {gen+1}/{self.generations} ---")
-                self._log("Починаємо обчислення фітнесів у потоках...")
+    # Пул воркерів, кожен з яких отримує копію GA один раз через initializer
+    def _start_pool(self, num_threads: int) -> Pool:
+        with self._phase("pool_start"):
+            return Pool(processes=num_threads, initializer=_init_worker, initargs=(self,))
 
-                # Розподіл: оцінка фітнесу
-                fitness_scores = pool.map(self._fitness, population)
-                self._log(f"Фітнеси обчислено (використано {num_threads} потоків).")
+    # Seed порції береться з генератора master-процесу в порядку створення завдань
+    def _pickle_task(self, parent_pairs: List[Tuple[Individual, Individual]]) -> bytes:
+        seed = int(self._rng.integers(0, 2**63))
+        with self._phase("pickling"):
+            return pickle.dumps((parent_pairs, seed), protocol=pickle.HIGHEST_PROTOCOL)
 
-                # Сортування популяції
-                sorted_pop_with_fit = sorted(zip(fitness_scores, population), key=lambda pair: pair[0], reverse=True)
-                sorted_population = [ind for _, ind in sorted_pop_with_fit]
+    # Розмір порції: з seed — фіксований (результат не залежить від кількості воркерів),
+    # інакше — близько чотирьох порцій на воркер
+    def _chunk_size(self, num_pairs: int, num_threads: int) -> int:
+        if self.seed is not None:
+            return RNG_BLOCK
+        return max(1, -(-num_pairs // (4 * num_threads)))
+
+    # Розпакування результату воркера; час обчислень у воркері враховується окремою фазою.
+    # Розмір кешу — не приріст: запам'ятовується останній розмір кешу кожного воркера
+    def _unpickle_result(self, payload: bytes) -> Tuple[List[Individual], Dict[str, int]]:
+        with self._phase("unpickling"):
+            children, cache_delta, cache_size, compute_time = pickle.loads(payload)
+        if cache_size is not None:
+            worker, size = cache_size
+            self._worker_cache_sizes[worker] = size
+        if self._profiler is not None:
+            self._profiler.add("worker_compute", compute_time, len(children))
+        return children, cache_delta
+
+    # Поколіннєвий режим як генератор: після кожного покоління віддає (номер, популяція)
+    def _parallel_generations(self, population: List[Individual], num_threads: int, start: int = 0) -> Iterator[Tuple[int, List[Individual]]]:
+        with self._start_pool(num_threads) as pool:
+            for gen in range(start, self.generations):
+                self._log(f"\n--- Покоління {gen+1}/{self.generations} ---")
 
-                # Еліта (кращі індивіди)
-                elite = sorted_population[:2]
+                # Еліта (кращі індивіди) — частковим відбором за вже обчисленим фітнесом
+                fitness = population_fitness(population)
+                with self._phase("elite"):
+                    elite = self._elite(population, fitness)
                 new_population = elite.copy()
                 self._log(f"Еліта збережена: {len(elite)} індивіди.")
 
-                # Формування батьківських пар
-                parent_pairs = []
-                while len(new_population) + len(parent_pairs) < self.population_size:
-                    p1 = self._tournament_selection(sorted_population)
-                    p2 = self._tournament_selection(sorted_population)
-                    parent_pairs.append((p1, p2))
+                # Формування батьківських пар — одним пакетом на все покоління
+                with self._phase("selection"):
+                    parent_pairs = self._select_parents(population, fitness, max(0, self.population_size - len(new_population)))
                 self._log(f"Батьківських пар для кросоверу: {len(parent_pairs)}")
 
                 # Розподіл: створення нащадків
                 self._log("Створення нащадків у потоках...")
-                children = pool.starmap(self._mutate_crossover, parent_pairs)
+                chunk_size = self._chunk_size(len(parent_pairs), num_threads)
+                chunks = [
+                    self._pickle_task(parent_pairs[i:i + chunk_size])
+                    for i in range(0, len(parent_pairs), chunk_size)
+                ]
+                with self._phase("pool_wait"):
+                    results = pool.map(_breed_chunk, chunks)
+                children = []
+                for payload in results:
+                    chunk_children, cache_delta = self._unpickle_result(payload)
+                    children.extend(chunk_children)
+                    self._worker_cache_stats = merge_stats(self._worker_cache_stats, cache_delta)
                 self._log(f"Нащадків створено: {len(children)}")
 
                 # Завершення популяції
@@ -44,21 +126,103 @@ class BackpackGAMasterSlave(BackpackGA):
                 self._log(f"Нова популяція сформована (розмір = {len(new_population)}).")
                 population = new_population
 
+                best_ind = max(population, key=by_fitness)
+                stop = self._should_stop(gen, best_ind.fitness, best_ind.value)
+
                 # Логування найкращого індивіда
-                if self.verbose:
-                    best_ind = max(population, key=self._fitness)
-                    best_fit = self._fitness(best_ind)
-                    best_weight = sum(self.items[i][0] for i in range(len(self.items)) if best_ind[i] == 1)
-                    self._log(f"Покоління {gen+1}/{self.generations}: найкращий fitness = {best_fit:.4f}, вага = {best_weight}")
-                    self._log(f"Найкращий індивід: {best_ind}")
-
-        return population
-
-    def run(self, num_threads: int, ) -> Tuple[List[int], int, int]:
-        num_items = len(self.items)
-        population = [self._create_individual(num_items) for _ in range(self.population_size)]
-        final_population = self._evolve_population(population, num_threads)
-        best_individual = max(final_population, key=self._fitness)
-        best_value = sum(self.items[i][1] for i in range(num_items) if best_individual[i] == 1)
-        best_weight = sum(self.items[i][0] for i in range(num_items) if best_individual[i] == 1)
-        return best_individual, best_value, best_weight
+                if self.verbose and not stop:
+                    self._log(f"Покоління {gen+1}/{self.generations}: найкращий fitness = {best_ind.fitness:.4f}, вага = {best_ind.weight}")
+                    self._log(f"Найкращий індивід: {best_ind.genome}")
+
+                yield gen, population
+                if stop:
+                    break
+
+    # Асинхронний steady-state режим без бар'єра між поколіннями: воркери безперервно створюють нащадків,
+    # а master вставляє кожного готового нащадка в популяцію замість найгіршої особини (якщо він кращий).
+    # Бюджет оцінок такий самий, як у поколіннєвому режимі; популяція віддається раз на "покоління"
+    # (нумерація продовжується з покоління start). Порядок вставки залежить від того, коли воркери
+    # завершують порції, тож навіть із seed цей режим не відтворюється точно
+    def _steady_state_generations(self, population: List[Individual], num_threads: int, start: int = 0) -> Iterator[Tuple[int, List[Individual]]]:
+        pop_size = len(population)
+        generation_size = max(1, pop_size - 2)
+        budget = (self.generations - start) * generation_size
+        batch_size = self._chunk_size(pop_size - 2, num_threads)
+        max_in_flight = 2 * num_threads
+
+        # Купа (фітнес, слот): на вершині — найгірша особина популяції
+        worst_heap = [(ind.fitness, slot) for slot, ind in enumerate(population)]
+        heapq.heapify(worst_heap)
+
+        results: "queue.Queue" = queue.Queue()
+        submitted = received = in_flight = gen = 0
+
+        with self._start_pool(num_threads) as pool:
+            while received < budget:
+                # Підтримуємо всіх воркерів зайнятими
+                while in_flight < max_in_flight and submitted < budget:
+                    size = min(batch_size, budget - submitted)
+                    with self._phase("selection"):
+                        parent_pairs = self._select_parents(population, population_fitness(population), size)
+                    payload = self._pickle_task(parent_pairs)
+                    pool.apply_async(_breed_chunk, (payload,), callback=results.put, error_callback=results.put)
+                    submitted += size
+                    in_flight += 1
+
+                with self._phase("pool_wait"):
+                    result = results.get()
+                if isinstance(result, BaseException):
+                    raise result
+                in_flight -= 1
+
+                children, cache_delta = self._unpickle_result(result)
+                self._worker_cache_stats = merge_stats(self._worker_cache_stats, cache_delta)
+                with self._phase("replacement", len(children)):
+                    for child in children:
+                        if child.fitness > worst_heap[0][0]:
+                            _, slot = heapq.heapreplace(worst_heap, (child.fitness, worst_heap[0][1]))
+                            population[slot] = child
+                received += len(children)
+
+                # Лог і критерії зупинки — раз на "покоління", тобто кожні generation_size нащадків
+                if received >= (gen + 1) * generation_size:
+                    gen = received // generation_size
+                    best_ind = max(population, key=by_fitness)
+                    self._log(f"Оцінено нащадків: {received}/{budget}, найкращий fitness = {best_ind.fitness:.4f}, вага = {best_ind.weight}")
+                    stop = self._should_stop(start + gen - 1, best_ind.fitness, best_ind.value)
+                    yield start + gen - 1, population
+                    if stop:
+                        break
+
+    def _run_generations(self, num_threads: int, asynchronous: bool = False) -> Iterator[Tuple[int, List[Individual]]]:
+        self._start_profiler()
+        # Стану RNG master-процесу досить: воркери отримують seed кожної порції від нього
+        start, start_bits, rng_states = self._run_start(1, self.population_size)
+        population = self._start_population(self.population_size, start_bits[0])
+        if rng_states:
+            self._restore_rng(rng_states[0])
+        self.stop_reason = None
+        self._monitor = self._start_monitor()
+        # Лічильники кешу, накопичені воркерами за запуск, і розміри кешів воркерів
+        self._worker_cache_stats: Dict[str, int] = {}
+        self._worker_cache_sizes: Dict[int, int] = {}
+        evolve = self._steady_state_generations if asynchronous else self._parallel_generations
+        gen = start - 1
+        try:
+            # closing() гарантує закриття пулу, навіть коли споживач run_iter() перериває ітерацію
+            with closing(evolve(population, num_threads, start)) as generations:
+                for gen, population in generations:
+                    self._checkpoint(gen, [population])
+                    yield gen, population
+        finally:
+            self._monitor = None
+            self._checkpoint(gen, [population], final=True)
+            self._finish_run(population, self._worker_cache_stats, {"size": sum(self._worker_cache_sizes.values())})
+
+    def run_iter(self, num_threads: int, asynchronous: bool = False) -> Iterator[GenerationStats]:
+        return self._stream(self._run_generations(num_threads, asynchronous))
+
+    def run(self, num_threads: int, asynchronous: bool = False) -> Tuple[List[int], int, int]:
+        for _ in self._run_generations(num_threads, asynchronous):
+            pass
+        return self.result
@@ -0,0 +1,293 @@
+import weakref
+from contextlib import closing
+from multiprocessing import Pool, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from BackpackGA import GenerationStats
+from BackpackGAVectorized import (
+    BackpackGAVectorized,
+    crossover,
+    evaluate_population,
+    evaluate_repaired,
+    mutate,
+)
+from Evaluators import Evaluator
+from ItemTable import ItemTable
+from Selection import elite_indices, select_parents
+
+
+# Розкладка популяції у спільній пам'яті. Подвійна буферизація: покоління src читається, 1 - src заповнюється.
+#   population[2, P, n] uint8 — геноми
+#   stats[2, 3, P] float64   — фітнес, вага, цінність
+#   parents[2, P] int64      — індекси батьків для кожного рядка наступного покоління
+class SharedPopulation:
+    def __init__(self, buf, pop_size: int, num_items: int):
+        offset: int = 0
+        self.population: np.ndarray = np.ndarray((2, pop_size, num_items), dtype=np.uint8, buffer=buf, offset=offset)
+        offset += _aligned(2 * pop_size * num_items)
+        self.stats: np.ndarray = np.ndarray((2, 3, pop_size), dtype=np.float64, buffer=buf, offset=offset)
+        offset += 2 * 3 * pop_size * 8
+        self.parents: np.ndarray = np.ndarray((2, pop_size), dtype=np.int64, buffer=buf, offset=offset)
+
+    @staticmethod
+    def nbytes(pop_size: int, num_items: int) -> int:
+        return _aligned(2 * pop_size * num_items) + 2 * 3 * pop_size * 8 + 2 * pop_size * 8
+
+
+def _aligned(size: int) -> int:
+    return (size + 7) // 8 * 8
+
+
+# Стан процесу-воркера: таблиця предметів і поточний блок популяції (підключаються один раз).
+# Місткість і ймовірність мутації надходять із кожним завданням: їх можна змінити між run() того самого пулу
+_items_shm: Optional[SharedMemory] = None
+_items: Optional[np.ndarray] = None
+_repair_order: Optional[np.ndarray] = None
+_evaluator: Optional[Evaluator] = None
+_population_shm: Optional[SharedMemory] = None
+_population: Optional[SharedPopulation] = None
+
+
+# Предмети — ім'я блоку спільної пам'яті або таблиця з файлу (воркер відображає той самий файл)
+def _init_shared_worker(
+    items_source: Union[str, ItemTable],
+    num_items: int,
+    repair_order: Optional[np.ndarray] = None,
+    evaluator: Optional[Evaluator] = None,
+) -> None:
+    global _items_shm, _items, _repair_order, _evaluator
+    if isinstance(items_source, ItemTable):
+        _items = items_source.matrix
+    else:
+        _items_shm = SharedMemory(name=items_source)
+        _items = np.ndarray((num_items, 2), dtype=np.float64, buffer=_items_shm.buf)
+    _repair_order = repair_order
+    _evaluator = evaluator
+
+
+# Оцінка рядків у воркері; з ремонтом перевантажені рядки виправляються на місці
+def _evaluate_rows(population: np.ndarray, max_weight: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if _repair_order is None:
+        return evaluate_population(population, _items, _evaluator)
+    return evaluate_repaired(population, _items, max_weight, _repair_order, _evaluator)
+
+
+def _shared_population(name: str, pop_size: int) -> SharedPopulation:
+    global _population_shm, _population
+    if _population_shm is None or _population_shm.name != name:
+        if _population_shm is not None:
+            _population = None
+            _population_shm.close()
+        _population_shm = SharedMemory(name=name)
+        _population = SharedPopulation(_population_shm.buf, pop_size, _items.shape[0])
+    return _population
+
+
+# Завдання: оцінити рядки [start, end) покоління src
+def _evaluate_chunk(task: Tuple[str, int, int, int, int, float]) -> None:
+    name, pop_size, src, start, end, max_weight = task
+    view = _shared_population(name, pop_size)
+    fitness, weight, value = _evaluate_rows(view.population[src, start:end], max_weight)
+    view.stats[src, 0, start:end] = fitness
+    view.stats[src, 1, start:end] = weight
+    view.stats[src, 2, start:end] = value
+
+
+# Завдання: створити й оцінити нащадків для рядків [start, end) покоління 1 - src
+def _breed_chunk(task: Tuple[str, int, int, int, int, int, float, float]) -> None:
+    name, pop_size, src, start, end, seed, max_weight, mutation_rate = task
+    view = _shared_population(name, pop_size)
+    rng = np.random.default_rng(seed)
+
+    population = view.population[src]
+    fitness = view.stats[src, 0]
+    idx1 = view.parents[0, start:end]
+    idx2 = view.parents[1, start:end]
+    children = crossover(population[idx1], population[idx2], fitness[idx1], fitness[idx2], rng)
+    children = mutate(children, mutation_rate, rng)
+
+    dst = 1 - src
+    child_fitness, child_weight, child_value = _evaluate_rows(children, max_weight)
+    view.population[dst, start:end] = children
+    view.stats[dst, 0, start:end] = child_fitness
+    view.stats[dst, 1, start:end] = child_weight
+    view.stats[dst, 2, start:end] = child_value
+
+
+# Зупинка пулу і звільнення спільної пам'яті рушія. Реєструється через weakref.finalize,
+# тож ресурси звільняються й тоді, коли рушій не закрили явно (close() або with)
+def _release_pool(pool: Pool, *blocks: Optional[SharedMemory]) -> None:
+    pool.close()
+    pool.join()
+    for shm in blocks:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+# Рядків нащадків в одній порції воркера, коли задано seed
+RNG_BLOCK_ROWS: int = 64
+
+
+# Рівні порції рядків [start, end) для воркерів
+def _chunks(start: int, end: int, num_chunks: int) -> List[Tuple[int, int]]:
+    bounds = np.linspace(start, end, num_chunks + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+# Master-slave без серіалізації популяцій: пул створюється один раз і перевикористовується між run(),
+# таблиця предметів і популяція лежать у multiprocessing.shared_memory (теж одні на всі run()),
+# а завдання — це лише межі порцій
+class BackpackGAMasterSlaveShared(BackpackGAVectorized):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool: Optional[Pool] = None
+        self._pool_threads: int = 0
+        self._items_shm: Optional[SharedMemory] = None
+        self._population_shm: Optional[SharedMemory] = None
+        self._pool_population: int = 0
+        # Порядок ремонту й оцінювач передаються воркерам під час створення пулу: їх зміна потребує нового пулу
+        self._pool_repair: bool = False
+        self._pool_evaluator: Optional[Evaluator] = None
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def __enter__(self) -> "BackpackGAMasterSlaveShared":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Зупинка пулу і звільнення спільної пам'яті
+    def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._pool = None
+        self._pool_threads = 0
+        self._items_shm = None
+        self._population_shm = None
+        self._pool_population = 0
+        self._pool_repair = False
+        self._pool_evaluator = None
+
+    def _ensure_pool(self, num_threads: int) -> Pool:
+        if (
+            self._pool is not None
+            and self._pool_threads == num_threads
+            and self._pool_population == self.population_size
+            and self._pool_repair == self.repair
+            and self._pool_evaluator is self.evaluator
+        ):
+            return self._pool
+        self.close()
+
+        # Таблиця з файлу вже спільна між процесами; список предметів копіюється у спільну пам'ять один раз
+        if isinstance(self.items, ItemTable):
+            items_source: Union[str, ItemTable] = self.items
+        else:
+            self._items_shm = SharedMemory(create=True, size=max(1, self._item_matrix.nbytes))
+            np.ndarray(self._item_matrix.shape, dtype=np.float64, buffer=self._items_shm.buf)[:] = self._item_matrix
+            items_source = self._items_shm.name
+        self._population_shm = SharedMemory(create=True, size=SharedPopulation.nbytes(self.population_size, len(self.items)))
+
+        # Трекер спільної пам'яті має існувати до fork, інакше кожен воркер запустить власний
+        resource_tracker.ensure_running()
+        self._pool = Pool(
+            processes=num_threads,
+            initializer=_init_shared_worker,
+            initargs=(
+                items_source,
+                len(self.items),
+                self._repair_order if self.repair else None,
+                self.evaluator,
+            ),
+        )
+        self._pool_threads = num_threads
+        self._pool_population = self.population_size
+        self._pool_repair = self.repair
+        self._pool_evaluator = self.evaluator
+        self._finalizer = weakref.finalize(self, _release_pool, self._pool, self._items_shm, self._population_shm)
+        self._log(f"Пул на {num_threads} воркерів запущено, таблиця предметів у спільній пам'яті.")
+        return self._pool
+
+    # Поколіннєвий цикл над спільним буфером. Стан покоління віддається без копії — представленнями буфера,
+    # які наступне покоління перезаписує: знімок run_iter їх не зберігає, а результат береться з останнього
+    def _shared_generations(
+        self, pool: Pool, shm: SharedMemory, num_threads: int, population: np.ndarray, start: int = 0
+    ) -> Iterator[Tuple[int, Tuple[np.ndarray, ...]]]:
+        pop_size: int = self.population_size
+        view = SharedPopulation(shm.buf, pop_size, len(self.items))
+        view.population[0] = population
+        max_weight: float = float(self.max_weight)
+        pool.map(_evaluate_chunk, [(shm.name, pop_size, 0, a, b, max_weight) for a, b in _chunks(0, pop_size, num_threads)])
+
+        elite_size: int = min(2, pop_size)
+        # З seed кількість порцій залежить лише від розміру популяції, а не від кількості воркерів
+        num_chunks: int = -(-(pop_size - elite_size) // RNG_BLOCK_ROWS) if self.seed is not None else num_threads
+        chunks = _chunks(elite_size, pop_size, num_chunks)
+        src: int = 0
+        for gen in range(start, self.generations):
+            dst: int = 1 - src
+            fitness = view.stats[src, 0]
+
+            # Еліта й селекція батьків — у master, векторизовано
+            with self._phase("selection", pop_size - elite_size):
+                elite = elite_indices(fitness, elite_size)
+                view.population[dst, :elite_size] = view.population[src, elite]
+                view.stats[dst, :, :elite_size] = view.stats[src][:, elite]
+                view.parents[:, elite_size:] = select_parents(fitness, pop_size - elite_size, self._rng, self.selection).T
+
+            # Кросовер, мутація й оцінка — у воркерах, кожен над своєю порцією спільного буфера
+            seeds = self._rng.integers(0, 2**63, size=len(chunks))
+            with self._phase("pool_wait"):
+                pool.map(
+                    _breed_chunk,
+                    [(shm.name, pop_size, src, a, b, int(s), max_weight, self.mutation_rate) for (a, b), s in zip(chunks, seeds)],
+                )
+            src = dst
+
+            best = int(view.stats[src, 0].argmax())
+            stop: bool = self._should_stop(gen, float(view.stats[src, 0, best]), float(view.stats[src, 2, best]))
+
+            if self.verbose and not stop:
+                self._log(f"Покоління {gen+1}/{self.generations}: найкращий fitness = {view.stats[src, 0, best]:.4f}, вага = {int(view.stats[src, 1, best])}")
+
+            fitness, weight, value = view.stats[src]
+            yield gen, (view.population[src], fitness, weight, value)
+            if stop:
+                break
+
+    def _run_generations(self, num_threads: int) -> Iterator[Tuple[int, Tuple[np.ndarray, ...]]]:
+        self._start_profiler()
+        pool = self._ensure_pool(num_threads)
+        # Насіння порцій воркерів береться з RNG master-процесу, тож його стану досить для відновлення
+        start, start_bits, rng_states = self._run_start(1, self.population_size)
+        population: np.ndarray = self._start_population(self.population_size, start_bits[0])
+        if rng_states:
+            self._restore_rng(rng_states[0])
+        shm: SharedMemory = self._population_shm
+        state: Optional[Tuple[np.ndarray, ...]] = None
+        self.stop_reason = None
+        self._monitor = self._start_monitor()
+        gen: int = start - 1
+        try:
+            with closing(self._shared_generations(pool, shm, num_threads, population, start)) as generations:
+                for gen, state in generations:
+                    self._checkpoint(gen, [state])
+                    yield gen, state
+        finally:
+            self._monitor = None
+            if state is not None:
+                self._checkpoint(gen, [state], final=True)
+            self._finish_run(self._final_state(population, state))
+
+    def run_iter(self, num_threads: int) -> Iterator[GenerationStats]:
+        return self._stream(self._run_generations(num_threads))
+
+    def run(self, num_threads: int) -> Tuple[List[int], int, int]:
+        for _ in self._run_generations(num_threads):
+            pass
+        return self.result
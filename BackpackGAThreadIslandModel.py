@@ -0,0 +1,307 @@
+import queue
+import random
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from BackpackGA import GenerationStats
+from BackpackGAVectorized import BackpackGAVectorized, evolve_generation
+from Checkpoint import restore_rng_state, rng_state
+from MigrationTopology import check_migration_config, migration_targets
+from RandomStreams import numpy_stream
+from Selection import elite_indices
+
+
+# Island Model на потоках одного процесу. Усі острови — зрізи одного масиву популяції (I, P, n);
+# кожен потік еволюціонує свій зріз векторизованими ядрами NumPy (вони звільняють GIL на великих масивах),
+# а міграція — це копіювання рядків між зрізами без серіалізації.
+# Міграція синхронна: раз на migration_interval поколінь острови кладуть емігрантів у свій буфер,
+# зустрічаються на бар'єрі й забирають мігрантів із буферів сусідів за топологією
+class BackpackGAThreadIslandModel(BackpackGAVectorized):
+    # Фази островів-потоків перекривались би в одному профайлері, тож профілювання не приймається
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.profile:
+            raise ValueError("Профілювання фаз не підтримується для BackpackGAThreadIslandModel.")
+
+    def _island_thread(
+        self,
+        id: int,
+        island_rng: np.random.Generator,
+        migration_size: int,
+        migration_interval: int,
+        emigrant_policy: str,
+        replacement_policy: str,
+        stats_queue: Optional[queue.Queue],
+        run_start: float,
+        start_generation: int = 0,
+    ) -> None:
+        try:
+            monitor = self._start_monitor(self._stop_event)
+            fitness, weight, value = self._evaluate(self._population[id])
+            stats = self._island_stats[id]
+            migrating = len(self._population) > 1
+            # Після пропущеної міграції стан острова вже не збігається з непереривним запуском
+            diverged = False
+
+            for gen in range(start_generation, self.generations):
+                self._population[id] = evolve_generation(self._population[id], fitness, self.mutation_rate, island_rng, selection=self.selection)
+                population = self._population[id]
+                fitness, weight, value = self._evaluate(population)
+
+                if migrating and gen % migration_interval == 0:
+                    start = time.perf_counter()
+                    self._post_emigrants(id, gen // migration_interval, fitness, migration_size, emigrant_policy, island_rng)
+                    stats["send_time"] += time.perf_counter() - start
+                    try:
+                        self._barrier.wait()
+                    except threading.BrokenBarrierError:
+                        # Інший острів зупинився раніше: далі без міграцій
+                        migrating = False
+                        diverged = True
+                    else:
+                        start = time.perf_counter()
+                        replaced = self._receive_migrants(id, gen // migration_interval, fitness, weight, value, replacement_policy, island_rng)
+                        stats["migrants_replaced"] += replaced
+                        stats["receive_time"] += time.perf_counter() - start
+
+                best = int(fitness.argmax())
+                stop = monitor is not None and monitor.update(float(fitness[best]), float(value[best]))
+                stats["generations"] = gen + 1
+
+                if stats_queue is not None:
+                    stats_queue.put(self._snapshot(gen, (population, fitness, weight, value), run_start, id))
+                # Частина контрольної точки: файл записує острів, що надіслав її останнім.
+                # Після пропущеної міграції частини не надсилаються, тож точка з них була б неточною
+                if self._checkpoint_due(gen) and not diverged:
+                    part = population.copy(), rng_state(island_rng)
+                    with self._checkpoint_lock:
+                        self._checkpoint_part(self._checkpoint_parts, len(self._population), id, gen + 1, *part)
+
+                if stop:
+                    stats["stop_reason"] = monitor.reason
+                    self._log(f"[Острів {id}] Зупинка після покоління {gen+1}: {monitor.reason}")
+                    break
+
+            # Острови, що ще чекають на бар'єрі, не повинні чекати на острів, який зупинився раніше
+            if stats["generations"] < self.generations:
+                self._barrier.abort()
+            self._fitness[id] = fitness
+        except Exception as error:
+            # Помилка острова: решта зупиняються (і не чекають на бар'єрі), а _run_islands повторно її піднімає
+            self._island_errors[id] = error
+            self._stop_event.set()
+            self._barrier.abort()
+
+    # Емігранти острова копіюються у буфер поточної епохи міграції (подвійна буферизація за парністю епохи:
+    # буфер перезаписується лише через епоху, коли всі сусіди гарантовано його прочитали)
+    def _post_emigrants(
+        self,
+        id: int,
+        epoch: int,
+        fitness: np.ndarray,
+        migration_size: int,
+        policy: str,
+        island_rng: np.random.Generator,
+    ) -> None:
+        if policy == "best":
+            rows = elite_indices(fitness, migration_size)
+        else:
+            rows = island_rng.choice(len(fitness), size=migration_size, replace=False)
+        outbox, outbox_fitness = self._outboxes[epoch % 2]
+        outbox[id] = self._population[id][rows]
+        outbox_fitness[id] = fitness[rows]
+
+    def _receive_migrants(
+        self,
+        id: int,
+        epoch: int,
+        fitness: np.ndarray,
+        weight: np.ndarray,
+        value: np.ndarray,
+        policy: str,
+        island_rng: np.random.Generator,
+    ) -> int:
+        sources = self._sources[epoch % 2][id]
+        if not sources:
+            return 0
+        outbox, outbox_fitness = self._outboxes[epoch % 2]
+        migrants = outbox[sources].reshape(-1, outbox.shape[-1])
+        migrant_fitness = outbox_fitness[sources].reshape(-1)
+        count = min(len(migrants), len(fitness))
+
+        if policy == "random":
+            slots = island_rng.choice(len(fitness), size=count, replace=False)
+            chosen = np.arange(count)
+        else:
+            # Найкращі мігранти проти найгірших особин; заміна лише там, де мігрант кращий
+            slots = np.argsort(fitness, kind="stable")[:count]
+            chosen = np.argsort(-migrant_fitness, kind="stable")[:count]
+            better = migrant_fitness[chosen] > fitness[slots]
+            slots, chosen = slots[better], chosen[better]
+
+        population = self._population[id]
+        population[slots] = migrants[chosen]
+        # Фітнес, вага й цінність замінених рядків перераховуються лише для них
+        fitness[slots], weight[slots], value[slots] = self._evaluate(population[slots])
+        return len(slots)
+
+    # Дія бар'єра (виконується одним потоком, коли всі острови прибули): карта джерел мігрантів на епоху.
+    # Для топології random цілі обираються один раз на епоху для всіх островів
+    def _plan_migration(self) -> None:
+        epoch = self._epoch
+        num_islands = len(self._population)
+        sources: List[List[int]] = [[] for _ in range(num_islands)]
+        for source in range(num_islands):
+            targets = migration_targets(self._topology, source, num_islands, self._migration_rng)
+            for target in targets:
+                sources[target].append(source)
+            self._island_stats[source]["messages_sent"] += len(targets)
+            self._island_stats[source]["migrants_sent"] += len(targets) * self._migration_size
+        self._sources[epoch % 2] = sources
+        self._epoch = epoch + 1
+
+    def run(
+        self,
+        num_threads: int,
+        migration_interval: int = 10,
+        topology: str = "ring",
+        emigrant_policy: str = "best",
+        replacement_policy: str = "worst"
+    ) -> Tuple[List[int], int, int]:
+        for _ in self._run_islands(num_threads, migration_interval, topology, emigrant_policy, replacement_policy, False):
+            pass
+        return self.result
+
+    def run_iter(
+        self,
+        num_threads: int,
+        migration_interval: int = 10,
+        topology: str = "ring",
+        emigrant_policy: str = "best",
+        replacement_policy: str = "worst"
+    ) -> Iterator[GenerationStats]:
+        return self._run_islands(num_threads, migration_interval, topology, emigrant_policy, replacement_policy, True)
+
+    def _run_islands(
+        self,
+        num_threads: int,
+        migration_interval: int,
+        topology: str,
+        emigrant_policy: str,
+        replacement_policy: str,
+        stream: bool
+    ) -> Iterator[GenerationStats]:
+        check_migration_config(topology, emigrant_policy, replacement_policy)
+
+        if num_threads < 2:
+            raise ValueError("Необхідно принаймні 2 потоки: по одному на острів.")
+
+        num_islands = num_threads
+        min_island_pop = 4
+        while num_islands > 1 and self.population_size // num_islands < min_island_pop:
+            num_islands -= 1
+
+        island_pop_size: int = self.population_size // num_islands
+        migration_size: int = max(1, island_pop_size // 10)
+        num_items: int = len(self.items)
+        start, start_bits, rng_states = self._run_start(num_islands, island_pop_size)
+
+        # Одна популяція на всі острови: острів i — зріз self._population[i] (жадібний засів — у кожному острові)
+        self._population: np.ndarray = np.stack([self._start_population(island_pop_size, bits) for bits in start_bits])
+        self._fitness: List[Optional[np.ndarray]] = [None] * num_islands
+        self._island_errors: List[Optional[Exception]] = [None] * num_islands
+        self._outboxes = [
+            (np.zeros((num_islands, migration_size, num_items), dtype=np.uint8), np.zeros((num_islands, migration_size)))
+            for _ in range(2)
+        ]
+        self._sources: List[List[List[int]]] = [[], []]
+        # Номер першої епохи міграції запуску (при продовженні — не з нуля, щоб парність буферів збігалась з островами)
+        self._epoch: int = -(-start // migration_interval)
+        self._topology: str = topology
+        self._migration_size: int = migration_size
+        # Цілі топології random обирає дія бар'єра — один потік за раз, тож генератор запуску спільний
+        self._migration_rng: random.Random = self._random
+        self._barrier = threading.Barrier(num_islands, action=self._plan_migration)
+        self._stop_event = threading.Event()
+        self._island_stats: List[Dict[str, float]] = [
+            {"send_time": 0.0, "receive_time": 0.0, "messages_sent": 0, "migrants_sent": 0,
+             "migrants_replaced": 0, "generations": start, "stop_reason": None}
+            for _ in range(num_islands)
+        ]
+        self._checkpoint_parts: Dict[int, Dict[int, Tuple[np.ndarray, bytes]]] = {}
+        self._checkpoint_lock = threading.Lock()
+
+        stats_queue: Optional[queue.Queue] = queue.Queue() if stream else None
+        # Незалежні потоки островів — дочірні послідовності запуску
+        island_rngs = [numpy_stream(sequence) for sequence in self._seed_sequence.spawn(num_islands)]
+        for island_rng, state in zip(island_rngs, rng_states or []):
+            restore_rng_state(state, island_rng)
+        run_start = time.perf_counter()
+        self.stop_reason = None
+
+        threads = [
+            threading.Thread(
+                target=self._island_thread,
+                args=(i, island_rngs[i], migration_size, migration_interval, emigrant_policy,
+                      replacement_policy, stats_queue, run_start, start),
+                daemon=True,
+            )
+            for i in range(num_islands)
+        ]
+        for thread in threads:
+            thread.start()
+
+        interrupted: bool = False
+        try:
+            while stats_queue is not None and (any(thread.is_alive() for thread in threads) or not stats_queue.empty()):
+                try:
+                    snapshot = stats_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                yield snapshot
+        except GeneratorExit:
+            # Переривання run_iter(): острови зупиняються на наступному поколінні
+            interrupted = True
+            self._stop_event.set()
+            self._barrier.abort()
+        for thread in threads:
+            thread.join()
+        errors = [error for error in self._island_errors if error is not None]
+        if errors:
+            raise errors[0]
+
+        fitness = np.stack(self._fitness)
+        _, weight, value = self._evaluate(self._population)
+        island, row = np.unravel_index(int(fitness.argmax()), fitness.shape)
+        self._set_result(self._population[island, row].tolist(), int(value[island, row]), int(weight[island, row]))
+
+        island_stats = self._island_stats
+        reasons = [stats["stop_reason"] for stats in island_stats if stats["stop_reason"] not in (None, "stop_signal")]
+        self.stop_reason = reasons[0] if reasons else None
+        self.generations_run = max(stats["generations"] for stats in island_stats)
+        # Після переривання острови зупинились на різних поколіннях і без останньої міграції:
+        # продовження точне лише з останньої повної контрольної точки, тож підсумкова не пишеться
+        if not interrupted:
+            self._checkpoint(
+                self.generations_run - 1,
+                list(self._population),
+                [rng_state(island_rng) for island_rng in island_rngs],
+                final=True,
+            )
+
+        total_time = (time.perf_counter() - run_start) * num_islands
+        overhead = sum(stats["send_time"] + stats["receive_time"] for stats in island_stats)
+        self.migration_stats = {
+            "topology": topology,
+            "islands": num_islands,
+            "messages_sent": sum(stats["messages_sent"] for stats in island_stats),
+            "migrants_sent": sum(stats["migrants_sent"] for stats in island_stats),
+            "migrants_replaced": sum(stats["migrants_replaced"] for stats in island_stats),
+            "send_time": sum(stats["send_time"] for stats in island_stats),
+            "receive_time": sum(stats["receive_time"] for stats in island_stats),
+            "overhead_share": overhead / total_time if total_time > 0 else 0.0,
+        }
+        self._log(f"Топологія міграції: {topology}, накладні витрати: {self.migration_stats['overhead_share']:.2%} часу островів")
@@ -0,0 +1,324 @@
+import time
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from BackpackGA import GREEDY_NOISE, BackpackGA, GenerationStats
+from Evaluators import Evaluator, KnapsackEvaluator, item_matrix
+from Selection import elite_indices, select_parents
+
+
+# Векторизовані ядра. Популяція — матриця uint8 форми (..., P, n), де n — кількість предметів.
+# Провідні осі (...) дозволяють обробляти одразу кілька незалежних популяцій.
+
+# Вага, цінність і фітнес усієї популяції одним матричним добутком; фітнес рахує оцінювач
+# (за вже обчисленими сумами, якщо вміє)
+def evaluate_population(
+    population: np.ndarray,
+    items: np.ndarray,
+    evaluator: Evaluator,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    totals: np.ndarray = population.astype(np.float64) @ items
+    weight: np.ndarray = totals[..., 0]
+    value: np.ndarray = totals[..., 1]
+    return evaluator.evaluate_totals(population, weight, value), weight, value
+
+
+# Ремонт перевантажених рядків на місці: обрані предмети вилучаються в порядку зростання щільності
+# (order — індекси предметів від найменш щільного), доки вага не вміститься в max_weight.
+# Предмети спільні для всіх рядків; повертає маску відремонтованих рядків
+def repair_population(
+    population: np.ndarray,
+    weight: np.ndarray,
+    items: np.ndarray,
+    order: np.ndarray,
+    max_weight,
+) -> np.ndarray:
+    excess: np.ndarray = weight - max_weight
+    over: np.ndarray = excess > 0
+    if over.any():
+        rows: np.ndarray = population[over]
+        genes: np.ndarray = rows[:, order]
+        removed: np.ndarray = genes * items[order, 0]
+        # Предмет вилучається, якщо вилучених перед ним ще не досить, щоб покрити надлишок
+        drop: np.ndarray = (genes == 1) & (np.cumsum(removed, axis=-1) - removed < excess[over][:, None])
+        rows[:, order] = np.where(drop, 0, genes)
+        population[over] = rows
+    return over
+
+
+# Оцінка з ремонтом: перевантажені рядки ремонтуються і переоцінюються лише вони
+def evaluate_repaired(
+    population: np.ndarray,
+    items: np.ndarray,
+    max_weight,
+    order: np.ndarray,
+    evaluator: Evaluator,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    fitness, weight, value = evaluate_population(population, items, evaluator)
+    over: np.ndarray = repair_population(population, weight, items, order, max_weight)
+    if over.any():
+        fitness[over], weight[over], value[over] = evaluate_population(population[over], items, evaluator)
+    return fitness, weight, value
+
+
+# Предмети від найменш щільного (цінність / вага) до найщільнішого; предмети без ваги — останні.
+# Порядок — обернений до BackpackGA._density_order, тож ремонт збігається з ремонтом спискових рушіїв
+def ascending_density(items: np.ndarray) -> np.ndarray:
+    density: np.ndarray = np.divide(items[:, 1], items[:, 0], out=np.full(len(items), np.inf), where=items[:, 0] > 0)
+    return np.argsort(-density, kind="stable")[::-1].copy()
+
+
+# Жадібні розв'язки: предмети за спаданням щільності, кожен додається, якщо ще вміщається.
+# Перший рядок — чистий жадібний, у решти щільність збурена множником з [1 - noise, 1 + noise]
+def greedy_population(
+    count: int,
+    items: np.ndarray,
+    max_weight,
+    rng: np.random.Generator,
+    noise: float = GREEDY_NOISE,
+) -> np.ndarray:
+    num_items: int = len(items)
+    weights: np.ndarray = items[:, 0]
+    density: np.ndarray = np.divide(items[:, 1], weights, out=np.full(num_items, np.inf), where=weights > 0)
+    factors: np.ndarray = rng.uniform(1.0 - noise, 1.0 + noise, size=(count, num_items))
+    factors[0] = 1.0
+    orders: np.ndarray = np.argsort(-(density * factors), axis=-1, kind="stable")
+
+    # Жадібний прохід кроками: на кожному кроці беруться всі ще не розглянуті предмети, що вміщаються
+    # в залишок поодинці, доки їх сума вміщається. Це той самий результат, що й поелементний прохід
+    # (предмет, який не вмістився, не вміститься й пізніше), але кроків — лише кілька
+    ordered: np.ndarray = weights[orders]
+    remaining: np.ndarray = np.full(count, float(max_weight))
+    taken: np.ndarray = np.zeros((count, num_items), dtype=bool)
+    while True:
+        candidates: np.ndarray = ~taken & (ordered <= remaining[:, None])
+        if not candidates.any():
+            break
+        candidate_weights: np.ndarray = np.where(candidates, ordered, 0.0)
+        fits: np.ndarray = candidates & (np.cumsum(candidate_weights, axis=-1) <= remaining[:, None])
+        taken |= fits
+        remaining -= np.where(fits, ordered, 0.0).sum(axis=-1)
+
+    population: np.ndarray = np.zeros((count, num_items), dtype=np.uint8)
+    np.put_along_axis(population, orders, taken, axis=-1)
+    return population
+
+
+# Вибір рядків популяції за індексами вздовж осі особин
+def take_rows(population: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    return np.take_along_axis(population, indices[..., None], axis=-2)
+
+
+# Кожен ген береться від кращого з батьків з імовірністю prob_better
+def crossover(
+    p1: np.ndarray,
+    p2: np.ndarray,
+    fit1: np.ndarray,
+    fit2: np.ndarray,
+    rng: np.random.Generator,
+    prob_better: float = 0.55,
+) -> np.ndarray:
+    first_better: np.ndarray = (fit1 > fit2)[..., None]
+    better: np.ndarray = np.where(first_better, p1, p2)
+    worse: np.ndarray = np.where(first_better, p2, p1)
+    mask: np.ndarray = rng.random(better.shape, dtype=np.float32) < prob_better
+    return np.where(mask, better, worse)
+
+
+# Інверсія бітів за маскою, згенерованою для всієї матриці нащадків одразу
+def mutate(children: np.ndarray, mutation_rate: float, rng: np.random.Generator) -> np.ndarray:
+    flips: np.ndarray = rng.random(children.shape, dtype=np.float32) <= mutation_rate
+    np.bitwise_xor(children, flips, out=children)
+    return children
+
+
+# Одне покоління: еліта + турнірна селекція + кросовер + мутація для всієї популяції
+def evolve_generation(
+    population: np.ndarray,
+    fitness: np.ndarray,
+    mutation_rate: float,
+    rng: np.random.Generator,
+    elite: int = 2,
+    selection: str = "tournament",
+) -> np.ndarray:
+    pop_size: int = population.shape[-2]
+    elite = min(elite, pop_size)
+    num_children: int = pop_size - elite
+
+    elite_rows: np.ndarray = take_rows(population, elite_indices(fitness, elite))
+
+    parents: np.ndarray = select_parents(fitness, num_children, rng, selection)
+    idx1: np.ndarray = parents[..., 0]
+    idx2: np.ndarray = parents[..., 1]
+    children: np.ndarray = crossover(
+        take_rows(population, idx1),
+        take_rows(population, idx2),
+        np.take_along_axis(fitness, idx1, axis=-1),
+        np.take_along_axis(fitness, idx2, axis=-1),
+        rng,
+    )
+    children = mutate(children, mutation_rate, rng)
+
+    return np.concatenate((elite_rows, children), axis=-2)
+
+
+# Кілька незалежних екземплярів задачі одним пакетом: популяції (B, P, n), предмети (B, n, 2).
+# Коротші екземпляри доповнюються предметами з нульовою вагою й цінністю, які не впливають на фітнес.
+# Повертає для кожного екземпляра (найкращий розв'язок без доповнення, цінність, вага)
+def solve_instances(
+    instances: List[Tuple[List[Tuple[int, int]], int]],
+    population_size: int,
+    generations: int,
+    mutation_rate: float,
+    rng: Union[np.random.Generator, Sequence[int]],
+) -> List[Tuple[List[int], int, int]]:
+    sizes: List[int] = [len(items) for items, _ in instances]
+    num_items: int = max(sizes)
+    items: np.ndarray = np.zeros((len(instances), num_items, 2), dtype=np.float64)
+    for row, (instance_items, _) in enumerate(instances):
+        items[row, :len(instance_items)] = item_matrix(instance_items)
+    max_weights: np.ndarray = np.array([max_weight for _, max_weight in instances], dtype=np.float64)
+    # Фітнес (..., P) пакета: місткість кожного екземпляра транслюється на його популяцію
+    evaluator = KnapsackEvaluator(items, max_weights[:, None])
+
+    # rng — або генератор, або seed кожного екземпляра: тоді початкова популяція екземпляра залежить
+    # лише від його seed, а спільний потік еволюції — від seed усіх екземплярів пакета
+    if isinstance(rng, np.random.Generator):
+        population: np.ndarray = rng.integers(0, 2, size=(len(instances), population_size, num_items), dtype=np.uint8)
+    else:
+        seeds: List[int] = list(rng)
+        population = np.zeros((len(instances), population_size, num_items), dtype=np.uint8)
+        for row, (seed, size) in enumerate(zip(seeds, sizes)):
+            population[row, :, :size] = np.random.default_rng(seed).integers(0, 2, size=(population_size, size), dtype=np.uint8)
+        rng = np.random.default_rng(seeds)
+    fitness, weight, value = evaluate_population(population, items, evaluator)
+    for _ in range(generations):
+        population = evolve_generation(population, fitness, mutation_rate, rng)
+        fitness, weight, value = evaluate_population(population, items, evaluator)
+
+    best: np.ndarray = fitness.argmax(axis=-1)
+    return [
+        (population[row, best[row], :size].tolist(), int(value[row, best[row]]), int(weight[row, best[row]]))
+        for row, size in enumerate(sizes)
+    ]
+
+
+# Частка унікальних рядків популяції (по останніх двох осях)
+def diversity(population: np.ndarray) -> float:
+    packed: np.ndarray = np.packbits(population, axis=-1)
+    return len(np.unique(packed, axis=0)) / len(packed)
+
+
+class BackpackGAVectorized(BackpackGA):
+    _item_state = ("_item_matrix", "_repair_order")
+
+    # Лише матриця предметів: для таблиці з файлу це відображений файл без копії.
+    # Спискові структури базового класу векторизованим ядрам не потрібні й не створюються
+    def _prepare_items(self) -> None:
+        self._item_matrix: np.ndarray = item_matrix(self.items)
+        self._repair_order: np.ndarray = ascending_density(self._item_matrix)
+
+    # Популяція оцінюється матрично цілком, поштучного кешу фітнесу тут немає
+    def _evaluates_genomes(self) -> bool:
+        return False
+
+    # Перші greedy_fraction рядків — жадібні розв'язки, решта — випадкові
+    def _create_population(self, population_size: int) -> np.ndarray:
+        population: np.ndarray = self._rng.integers(0, 2, size=(population_size, len(self.items)), dtype=np.uint8)
+        num_greedy: int = round(population_size * self.greedy_fraction)
+        if num_greedy:
+            population[:num_greedy] = greedy_population(num_greedy, self._item_matrix, self.max_weight, self._rng)
+        return population
+
+    # Рядки контрольної точки (повторно оцінюються в першому поколінні), доповнені новими до population_size
+    def _start_population(self, population_size: int, bits: Optional[np.ndarray]) -> np.ndarray:
+        if bits is None:
+            return self._create_population(population_size)
+        rows: np.ndarray = np.array(bits[:population_size], dtype=np.uint8)
+        if len(rows) < population_size:
+            rows = np.concatenate([rows, self._create_population(population_size - len(rows))])
+        return rows
+
+    def _population_bits(self, state) -> np.ndarray:
+        return state[0] if isinstance(state, tuple) else state
+
+    # З repair=True перевантажені рядки спершу ремонтуються на місці
+    def _evaluate(self, population: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.repair:
+            return evaluate_repaired(population, self._item_matrix, self.max_weight, self._repair_order, self.evaluator)
+        return evaluate_population(population, self._item_matrix, self.evaluator)
+
+    # Стан покоління: (популяція, фітнес, вага, цінність)
+    def _generations(self, population: np.ndarray, generations: int, start: int = 0) -> Iterator[Tuple[int, Tuple[np.ndarray, ...]]]:
+        with self._phase("fitness", len(population)):
+            fitness, weight, _ = self._evaluate(population)
+        for gen in range(start, generations):
+            # Селекція, кросовер і мутація — одне векторизоване ядро, тож і одна фаза профілю
+            with self._phase("evolution", len(population)):
+                population = evolve_generation(population, fitness, self.mutation_rate, self._rng, selection=self.selection)
+            with self._phase("fitness", len(population)):
+                fitness, weight, value = self._evaluate(population)
+
+            best: int = int(fitness.argmax())
+            stop: bool = self._should_stop(gen, float(fitness[best]), float(value[best]))
+
+            if self.verbose and not stop:
+                self._log(f"Покоління {gen+1}: найкращий fitness = {fitness[best]:.4f}, вага = {int(weight[best])}")
+
+            yield gen, (population, fitness, weight, value)
+            if stop:
+                break
+
+    def _evolve_population(self, population: np.ndarray, generations: int) -> np.ndarray:
+        for _, (population, *_) in self._generations(population, generations):
+            pass
+        return population
+
+    def _run_generations(self) -> Iterator[Tuple[int, Tuple[np.ndarray, ...]]]:
+        self._start_profiler()
+        start, start_bits, rng_states = self._run_start(1, self.population_size)
+        population: np.ndarray = self._start_population(self.population_size, start_bits[0])
+        if rng_states:
+            self._restore_rng(rng_states[0])
+        state: Optional[Tuple[np.ndarray, ...]] = None
+
+        self.stop_reason = None
+        self._monitor = self._start_monitor()
+        gen: int = start - 1
+        try:
+            for gen, state in self._generations(population, self.generations, start):
+                self._checkpoint(gen, [state])
+                yield gen, state
+        finally:
+            self._monitor = None
+            if state is not None:
+                self._checkpoint(gen, [state], final=True)
+            self._finish_run(self._final_state(population, state))
+
+    # Стан, з якого береться результат: без жодного покоління (generations=0 або продовження
+    # з останнього покоління) — оцінена стартова популяція
+    def _final_state(self, population: np.ndarray, state: Optional[Tuple[np.ndarray, ...]]) -> Tuple[np.ndarray, ...]:
+        if state is not None:
+            return state
+        return (population, *self._evaluate(population))
+
+    def _finish_run(self, state: Tuple[np.ndarray, ...]) -> None:
+        population, fitness, weight, value = state
+        best: int = int(fitness.argmax())
+        self._set_result(population[best].tolist(), int(value[best]), int(weight[best]))
+        self._finish_profiler()
+
+    def _snapshot(self, gen: int, state: Tuple[np.ndarray, ...], start: float, island: Optional[int] = None) -> GenerationStats:
+        population, fitness, weight, value = state
+        best: int = int(fitness.argmax())
+        return GenerationStats(
+            gen + 1,
+            float(fitness[best]),
+            float(fitness.mean()),
+            int(weight[best]),
+            int(value[best]),
+            diversity(population),
+            time.perf_counter() - start,
+            island,
+        )
@@ -0,0 +1,184 @@
+import os
+import queue
+import time
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, Optional, Tuple, Type
+
+import numpy as np
+
+from BackpackGA import BackpackGA
+from BackpackGABitset import BackpackGABitset
+from BackpackGAVectorized import BackpackGAVectorized, solve_instances
+from RandomStreams import child_seed, seed_sequence
+
+# Екземпляр задачі: (предмети [(вага, цінність)], максимальна вага)
+Instance = Tuple[List[Tuple[int, int]], int]
+
+# Однопроцесні рушії: воркери пулу — демонічні процеси й не можуть запускати власні пули, острови чи потоки-острови
+SEQUENTIAL_ENGINES: Tuple[Type[BackpackGA], ...] = (BackpackGA, BackpackGABitset, BackpackGAVectorized)
+
+
+# Результат одного екземпляра потоку
+class BatchResult:
+    __slots__ = ("index", "solution", "value", "weight", "solve_time", "latency", "batch_size")
+
+    def __init__(
+        self,
+        index: int,
+        solution: List[int],
+        value: int,
+        weight: int,
+        solve_time: float,
+        latency: float,
+        batch_size: int,
+    ):
+        # Позиція екземпляра у вхідному потоці (результати надходять у порядку готовності)
+        self.index: int = index
+        self.solution: List[int] = solution
+        self.value: int = value
+        self.weight: int = weight
+        # Час обчислень у воркері; для пакета — частка часу пакета на один екземпляр
+        self.solve_time: float = solve_time
+        # Від надсилання завдання в пул до отримання результату
+        self.latency: float = latency
+        self.batch_size: int = batch_size
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchResult(#{self.index}: цінність = {self.value}, вага = {self.weight}, "
+            f"{self.solve_time * 1000:.2f} мс, пакет = {self.batch_size})"
+        )
+
+
+# Завдання воркера: пакет малих екземплярів (векторизовано одним прогоном) або один великий екземпляр
+def _solve_task(task) -> Tuple[List[int], List[Tuple[List[int], int, int]], float]:
+    indices, instances, engine, params, seeds = task
+    start = time.perf_counter()
+    if engine is None:
+        population_size, generations, mutation_rate = params
+        solutions = solve_instances(instances, population_size, generations, mutation_rate, seeds)
+    else:
+        (items, max_weight), = instances
+        solutions = [engine(items, max_weight, *params, seed=seeds[0]).run()]
+    return indices, solutions, time.perf_counter() - start
+
+
+# Розв'язувач потоку незалежних екземплярів на постійному пулі процесів.
+# Малі екземпляри (до batch_items предметів) збираються в пакети по batch_size і розв'язуються
+# одним векторизованим прогоном; великі — окремим завданням рушієм engine.
+# Екземпляр index отримує власний seed — дочірню послідовність seed розв'язувача з номером index,
+# тож із seed результати відтворювані незалежно від процесів пулу й порядку готовності.
+#
+#     with BatchSolver(population_size=100, generations=100, mutation_rate=0.01) as solver:
+#         for result in solver.solve(instances):
+#             print(result.index, result.value)
+class BatchSolver:
+    def __init__(
+        self,
+        population_size: int,
+        generations: int,
+        mutation_rate: float,
+        processes: Optional[int] = None,
+        batch_items: int = 256,
+        batch_size: int = 32,
+        engine: Type[BackpackGA] = BackpackGAVectorized,
+        seed: Optional[int] = None,
+    ):
+        if engine not in SEQUENTIAL_ENGINES:
+            raise ValueError(
+                "BatchSolver використовує лише послідовні рушії "
+                f"({', '.join(cls.__name__ for cls in SEQUENTIAL_ENGINES)}): паралелізм забезпечує пул екземплярів."
+            )
+        self.population_size: int = population_size
+        self.generations: int = generations
+        self.mutation_rate: float = mutation_rate
+        self.processes: Optional[int] = processes
+        self.batch_items: int = batch_items
+        self.batch_size: int = batch_size
+        self.engine: Type[BackpackGA] = engine
+        self.seed: Optional[int] = seed
+        self._pool: Optional[Pool] = None
+        # Статистика останнього solve(): кількість екземплярів, час, екземплярів за секунду
+        self.instances_solved: int = 0
+        self.elapsed: float = 0.0
+        self.throughput: float = 0.0
+
+    def __enter__(self) -> "BatchSolver":
+        self._ensure_pool()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def _ensure_pool(self) -> Pool:
+        if self._pool is None:
+            self._pool = Pool(processes=self.processes)
+        return self._pool
+
+    # Завдання з потоку екземплярів: малі накопичуються в пакет, великі йдуть окремо;
+    # кожне завдання несе seed своїх екземплярів
+    def _tasks(self, instances: Iterable[Instance]) -> Iterator[Tuple]:
+        params = (self.population_size, self.generations, self.mutation_rate)
+        root: np.random.SeedSequence = seed_sequence(self.seed)
+        batch_indices: List[int] = []
+        batch: List[Instance] = []
+        for index, (items, max_weight) in enumerate(instances):
+            if len(items) > self.batch_items:
+                yield [index], [(items, max_weight)], self.engine, params, [child_seed(root, index)]
+                continue
+            batch_indices.append(index)
+            batch.append((items, max_weight))
+            if len(batch) == self.batch_size:
+                yield batch_indices, batch, None, params, [child_seed(root, i) for i in batch_indices]
+                batch_indices, batch = [], []
+        if batch:
+            yield batch_indices, batch, None, params, [child_seed(root, i) for i in batch_indices]
+
+    # Результати віддаються по мірі готовності. Потік читається поступово: у пулі одночасно
+    # не більше max_in_flight завдань, тож нескінченний генератор екземплярів не накопичується в пам'яті
+    def solve(self, instances: Iterable[Instance], max_in_flight: Optional[int] = None) -> Iterator[BatchResult]:
+        pool = self._ensure_pool()
+        max_in_flight = max_in_flight or 2 * (self.processes or os.cpu_count() or 1)
+        results: "queue.Queue" = queue.Queue()
+        tasks = self._tasks(instances)
+        submitted_at = {}
+        in_flight = 0
+        exhausted = False
+
+        start = time.perf_counter()
+        self.instances_solved = 0
+        while True:
+            while not exhausted and in_flight < max_in_flight:
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                    break
+                submitted_at[task[0][0]] = time.perf_counter()
+                pool.apply_async(_solve_task, (task,), callback=results.put, error_callback=results.put)
+                in_flight += 1
+            if in_flight == 0:
+                break
+
+            result = results.get()
+            if isinstance(result, BaseException):
+                raise result
+            in_flight -= 1
+
+            indices, solutions, compute_time = result
+            latency = time.perf_counter() - submitted_at.pop(indices[0])
+            for index, (solution, value, weight) in zip(indices, solutions):
+                self.instances_solved += 1
+                yield BatchResult(index, solution, value, weight, compute_time / len(indices), latency, len(indices))
+
+        self.elapsed = time.perf_counter() - start
+        self.throughput = self.instances_solved / self.elapsed if self.elapsed > 0 else 0.0
+
+    # Усі результати одразу, у порядку вхідних екземплярів
+    def solve_all(self, instances: Iterable[Instance]) -> List[BatchResult]:
+        return sorted(self.solve(instances), key=lambda result: result.index)
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import random
+import struct
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Бінарний формат контрольної точки:
+#   заголовок: сигнатура, версія, кількість завершених поколінь, кількість предметів, кількість островів,
+#              відбиток екземпляра задачі (16 байт)
+#   для кожного острова: розмір популяції, довжина стану RNG, стан RNG (JSON), геноми — біти,
+#              упаковані по 8 предметів у байт (np.packbits), рядок на особину
+# Фітнес не зберігається: після відновлення популяція оцінюється заново
+MAGIC: bytes = b"KNAPCKPT"
+VERSION: int = 1
+HEADER = struct.Struct("<8sIIQI16s")
+ISLAND_HEADER = struct.Struct("<II")
+
+
+# Стан запуску, достатній для продовження: популяції островів як матриці бітів (P, n) і стани їх RNG
+class Checkpoint:
+    __slots__ = ("generation", "num_items", "fingerprint", "populations", "rng_states")
+
+    def __init__(
+        self,
+        generation: int,
+        num_items: int,
+        fingerprint: bytes,
+        populations: List[np.ndarray],
+        rng_states: List[bytes],
+    ):
+        # Кількість завершених поколінь
+        self.generation: int = generation
+        self.num_items: int = num_items
+        self.fingerprint: bytes = fingerprint
+        self.populations: List[np.ndarray] = populations
+        self.rng_states: List[bytes] = rng_states
+
+    def __repr__(self) -> str:
+        sizes = ", ".join(str(len(population)) for population in self.populations)
+        return f"Checkpoint(покоління {self.generation}, предметів = {self.num_items}, острови: [{sizes}])"
+
+
+# Відбиток екземпляра: відновлення можливе лише на тому самому екземплярі задачі
+def instance_fingerprint(items, max_weight: int) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(np.asarray(items, dtype=np.float64).reshape(-1, 2)).tobytes())
+    digest.update(struct.pack("<q", int(max_weight)))
+    return digest.digest()
+
+
+# Стан генератора модуля random (і, за потреби, генератора NumPy) у JSON — без pickle у файлі
+def rng_state(numpy_rng: Optional[np.random.Generator] = None, py_random=random) -> bytes:
+    version, internal, gauss_next = py_random.getstate()
+    state: Dict[str, Any] = {"random": [version, list(internal), gauss_next]}
+    if numpy_rng is not None:
+        state["numpy"] = numpy_rng.bit_generator.state
+    return json.dumps(state, separators=(",", ":")).encode()
+
+
+def restore_rng_state(data: bytes, numpy_rng: Optional[np.random.Generator] = None, py_random=random) -> None:
+    state = json.loads(data)
+    version, internal, gauss_next = state["random"]
+    py_random.setstate((version, tuple(internal), gauss_next))
+    if numpy_rng is not None and "numpy" in state:
+        numpy_rng.bit_generator.state = state["numpy"]
+
+
+# Атомарний запис: тимчасовий файл у тому самому каталозі, fsync і заміна — перерваний запис
+# не пошкоджує попередню контрольну точку
+def write_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(HEADER.pack(
+            MAGIC, VERSION, checkpoint.generation, checkpoint.num_items,
+            len(checkpoint.populations), checkpoint.fingerprint,
+        ))
+        for population, state in zip(checkpoint.populations, checkpoint.rng_states):
+            file.write(ISLAND_HEADER.pack(len(population), len(state)))
+            file.write(state)
+            file.write(np.packbits(population.reshape(len(population), checkpoint.num_items), axis=-1).tobytes())
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path: str) -> Checkpoint:
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"Файл {path} не є контрольною точкою: замалий заголовок.")
+    magic, version, generation, num_items, num_islands, fingerprint = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"Файл {path} не є контрольною точкою.")
+    if version != VERSION:
+        raise ValueError(f"Непідтримувана версія контрольної точки: {version}.")
+
+    row_bytes = (num_items + 7) // 8
+    offset = HEADER.size
+    populations: List[np.ndarray] = []
+    rng_states: List[bytes] = []
+    for _ in range(num_islands):
+        pop_size, state_size = ISLAND_HEADER.unpack_from(data, offset)
+        offset += ISLAND_HEADER.size
+        rng_states.append(data[offset:offset + state_size])
+        offset += state_size
+        packed = np.frombuffer(data, dtype=np.uint8, count=pop_size * row_bytes, offset=offset)
+        populations.append(np.unpackbits(packed.reshape(pop_size, row_bytes), axis=-1, count=num_items))
+        offset += pop_size * row_bytes
+    return Checkpoint(generation, num_items, fingerprint, populations, rng_states)
+
+
+# Популяції контрольної точки для теплого старту на схожому екземплярі: особини всіх островів
+# розподіляються по num_islands новим островах по черзі (не більше island_size на острів),
+# а геноми обрізаються або доповнюються нулями до num_items предметів
+def redistribute(populations: List[np.ndarray], num_islands: int, island_size: int, num_items: int) -> List[np.ndarray]:
+    rows: np.ndarray = np.concatenate(populations) if populations else np.zeros((0, num_items), dtype=np.uint8)
+    fitted: np.ndarray = np.zeros((len(rows), num_items), dtype=np.uint8)
+    width = min(num_items, rows.shape[-1])
+    fitted[:, :width] = rows[:, :width]
+    return [fitted[island::num_islands][:island_size] for island in range(num_islands)]
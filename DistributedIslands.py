@@ -0,0 +1,628 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import struct
+import sys
+import threading
+import time
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from BackpackGA import BackpackGA, Individual, by_fitness
+from BackpackGABitset import BackpackGABitset
+from ItemTable import load_items
+from MigrationMailbox import MigrantRecord
+from MigrationTopology import TOPOLOGIES, check_migration_config, migration_targets, replace_with_migrants, select_emigrants
+from StopCriteria import GLOBAL_REASONS
+
+# Island Model на кількох вузлах: острови — окремі процеси (на будь-яких машинах), а мігранти
+# ходять через брокер по TCP. Брокер не еволюціонує популяцій: він приймає острови, маршрутизує
+# емігрантів за топологією, стежить за серцебиттям островів і збирає їхні фінальні результати.
+#
+#     python DistributedIslands.py broker --islands 4 --port 5555
+#     python DistributedIslands.py island --id 0 --host broker-host --port 5555 --items items.csv --max-weight 1000
+#     python DistributedIslands.py local --islands 4          # усі острови на localhost
+#
+# Протокол: кадр = заголовок (тип, довжина вмісту) + вміст. Службові повідомлення — JSON
+# (без pickle: вузли не виконують чужого коду), мігранти — бінарні записи з упакованими геномами
+FRAME = struct.Struct("<BI")
+# Кадр, більший за цей, вважається порушенням протоколу
+MAX_FRAME: int = 64 << 20
+HELLO, WELCOME, HEARTBEAT, MIGRANTS, RESULT, STOP, ERROR = range(1, 8)
+
+_MIGRANTS = struct.Struct("<iII")   # острів-відправник, кількість мігрантів, байтів на геном
+_RECORD = struct.Struct("<dqq")     # фітнес, вага, цінність
+
+# Скільки байтів може чекати в черзі відправки острову, що не встигає читати; далі мігранти для нього
+# відкидаються, а не затримують маршрутизацію для решти островів
+MAX_BACKLOG: int = 4 << 20
+
+
+def frame(kind: int, payload: bytes) -> bytes:
+    return FRAME.pack(kind, len(payload)) + payload
+
+
+def json_frame(kind: int, data: Dict[str, Any]) -> bytes:
+    return frame(kind, json.dumps(data, separators=(",", ":")).encode())
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    kind, size = FRAME.unpack(await reader.readexactly(FRAME.size))
+    if size > MAX_FRAME:
+        raise ValueError(f"Завеликий кадр: {size} байт.")
+    return kind, await reader.readexactly(size)
+
+
+def pack_migrants(source: int, records: List[MigrantRecord], genome_nbytes: int) -> bytes:
+    parts: List[bytes] = [_MIGRANTS.pack(source, len(records), genome_nbytes)]
+    for fitness, weight, value, genome in records:
+        parts.append(_RECORD.pack(fitness, weight, value))
+        parts.append(genome)
+    return b"".join(parts)
+
+
+def unpack_migrants(payload: bytes) -> Tuple[int, List[MigrantRecord]]:
+    source, count, genome_nbytes = _MIGRANTS.unpack_from(payload)
+    record_size: int = _RECORD.size + genome_nbytes
+    if len(payload) != _MIGRANTS.size + count * record_size:
+        raise ValueError("Пошкоджене повідомлення з мігрантами.")
+    records: List[MigrantRecord] = []
+    offset: int = _MIGRANTS.size
+    for _ in range(count):
+        fitness, weight, value = _RECORD.unpack_from(payload, offset)
+        records.append((fitness, weight, value, payload[offset + _RECORD.size:offset + record_size]))
+        offset += record_size
+    return source, records
+
+
+# Розв'язок як список бітів <-> рядок для JSON (біти упаковано по 8 у байт)
+def encode_solution(bits: List[int]) -> str:
+    return np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes().hex()
+
+
+def decode_solution(data: str, num_items: int) -> List[int]:
+    return np.unpackbits(np.frombuffer(bytes.fromhex(data), dtype=np.uint8), count=num_items).tolist()
+
+
+# Підключений острів з погляду брокера
+class _IslandConnection:
+    __slots__ = ("id", "writer", "last_seen", "generation")
+
+    def __init__(self, id: int, writer: asyncio.StreamWriter):
+        self.id: int = id
+        self.writer: asyncio.StreamWriter = writer
+        self.last_seen: float = time.monotonic()
+        self.generation: int = 0
+
+
+# Брокер міграцій. Топологія застосовується до островів, підключених у момент міграції
+# (за зростанням номерів): поки на зв'язку всі, кільце — це i → i + 1, як у BackpackGAIslandModel;
+# острів, що запізнився, вбудовується в кільце після підключення, а відсутній чи втрачений — з нього випадає.
+# Острів вважається втраченим, якщо мовчить довше за heartbeat_timeout; острови, що не підключились
+# за join_timeout від старту брокера, — відсутніми. Запуск завершується, коли кожен острів надіслав результат,
+# втрачений або відсутній
+class MigrationBroker:
+    def __init__(
+        self,
+        num_islands: int,
+        topology: str = "ring",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        heartbeat_timeout: float = 10.0,
+        join_timeout: float = 30.0,
+        verbose: bool = False,
+    ):
+        if num_islands < 1:
+            raise ValueError("Кількість островів має бути не меншою за 1.")
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Невідома топологія міграції: {topology}. Доступні: {', '.join(TOPOLOGIES)}")
+        self.num_islands: int = num_islands
+        self.topology: str = topology
+        self.host: str = host
+        self.port: int = port
+        self.heartbeat_timeout: float = heartbeat_timeout
+        self.join_timeout: float = join_timeout
+        self.verbose: bool = verbose
+        # Адреса, на якій брокер приймає острови (з port=0 — порт, обраний системою)
+        self.address: Optional[Tuple[str, int]] = None
+        # Результати островів за номерами; втрачені (підключались, але зникли без результату) і відсутні острови
+        self.results: Dict[int, Dict[str, Any]] = {}
+        self.lost: Set[int] = set()
+        self.missing: List[int] = []
+        self.stats: Dict[str, int] = {
+            "messages_routed": 0, "migrants_routed": 0, "messages_dropped": 0, "heartbeats": 0,
+        }
+        self._islands: Dict[int, _IslandConnection] = {}
+        # Екземпляр задачі й розмір генома задає перший острів; решта мають збігатися з ним
+        self._fingerprint: Optional[str] = None
+        self._genome_nbytes: Optional[int] = None
+        # Цілі топології random
+        self._random: random.Random = random.Random()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._watchdog: Optional[asyncio.Task] = None
+        self._done: Optional[asyncio.Event] = None
+        self._start_time: float = 0.0
+
+    def _log(self, msg: str) -> None:
+        if self.verbose:
+            print(msg)
+
+    async def start(self) -> Tuple[str, int]:
+        self._done = asyncio.Event()
+        self._start_time = time.monotonic()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.address = self._server.sockets[0].getsockname()[:2]
+        self._watchdog = asyncio.create_task(self._watch())
+        self._log(f"Брокер міграцій слухає {self.address[0]}:{self.address[1]}, островів: {self.num_islands}")
+        return self.address
+
+    # Очікування завершення запуску; повертає результати островів
+    async def wait(self) -> Dict[int, Dict[str, Any]]:
+        try:
+            await self._done.wait()
+        finally:
+            await self.close()
+        self.missing = [i for i in range(self.num_islands) if i not in self.results and i not in self.lost]
+        if self.lost or self.missing:
+            self._log(f"Без результату: втрачені острови {sorted(self.lost)}, відсутні {self.missing}")
+        return self.results
+
+    async def serve(self) -> Dict[int, Dict[str, Any]]:
+        await self.start()
+        return await self.wait()
+
+    async def close(self) -> None:
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            self._watchdog = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for island in list(self._islands.values()):
+            island.writer.close()
+
+    # Найкращий результат серед островів (у порядку номерів): (розв'язок, цінність, вага) або None
+    def best(self) -> Optional[Tuple[List[int], int, int]]:
+        if not self.results:
+            return None
+        result = max((self.results[i] for i in sorted(self.results)), key=itemgetter("fitness"))
+        return decode_solution(result["solution"], result["num_items"]), result["value"], result["weight"]
+
+    # З'єднання одного острова: привітання, далі серцебиття, мігранти і, наприкінці, результат
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        island: Optional[_IslandConnection] = None
+        try:
+            kind, payload = await asyncio.wait_for(read_frame(reader), self.heartbeat_timeout)
+            if kind != HELLO:
+                raise ValueError("Очікувалось привітання острова.")
+            island = self._join(json.loads(payload), writer)
+            writer.write(json_frame(WELCOME, {"num_islands": self.num_islands, "topology": self.topology}))
+            await writer.drain()
+
+            while True:
+                kind, payload = await read_frame(reader)
+                island.last_seen = time.monotonic()
+                if kind == HEARTBEAT:
+                    island.generation = json.loads(payload)["generation"]
+                    self.stats["heartbeats"] += 1
+                elif kind == MIGRANTS:
+                    self._route(island.id, payload)
+                elif kind == RESULT:
+                    self._finish(island.id, json.loads(payload))
+                    break
+                else:
+                    raise ValueError(f"Невідомий тип повідомлення: {kind}")
+        except (ValueError, KeyError, TypeError, struct.error) as error:
+            self._log(f"Брокер: відхилено з'єднання острова: {error}")
+            writer.write(json_frame(ERROR, {"message": str(error)}))
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            if island is not None and self._islands.get(island.id) is island:
+                del self._islands[island.id]
+                if island.id not in self.results:
+                    self.lost.add(island.id)
+                    self._log(f"Брокер: острів {island.id} втрачено після покоління {island.generation}")
+            writer.close()
+            self._check_done()
+
+    def _join(self, hello: Dict[str, Any], writer: asyncio.StreamWriter) -> _IslandConnection:
+        # Привітання надходить з мережі: це має бути об'єкт, а номер острова — саме ціле число
+        if not isinstance(hello, dict):
+            raise ValueError("Некоректне привітання острова.")
+        id: int = hello["island"]
+        if not isinstance(id, int) or isinstance(id, bool):
+            raise ValueError(f"Некоректний номер острова: {id!r}.")
+        if not 0 <= id < self.num_islands:
+            raise ValueError(f"Номер острова {id} поза межами [0, {self.num_islands}).")
+        if id in self._islands or id in self.results:
+            raise ValueError(f"Острів {id} уже підключений або завершив роботу.")
+        if self._fingerprint is None:
+            self._fingerprint, self._genome_nbytes = hello["fingerprint"], hello["genome_nbytes"]
+        elif (hello["fingerprint"], hello["genome_nbytes"]) != (self._fingerprint, self._genome_nbytes):
+            raise ValueError(f"Острів {id} розв'язує інший екземпляр задачі або має інше кодування генома.")
+
+        island = _IslandConnection(id, writer)
+        self._islands[id] = island
+        self.lost.discard(id)
+        self._log(f"Брокер: острів {id} підключився ({len(self._islands)}/{self.num_islands})")
+        return island
+
+    # Мігранти пересилаються без розпакування: заголовок уже містить відправника
+    def _route(self, source: int, payload: bytes) -> None:
+        sender, count, _ = _MIGRANTS.unpack_from(payload)
+        if sender != source:
+            raise ValueError(f"Острів {source} надіслав мігрантів від імені острова {sender}.")
+        live: List[int] = sorted(self._islands)
+        data: bytes = frame(MIGRANTS, payload)
+        for target in migration_targets(self.topology, live.index(source), len(live), self._random):
+            transport = self._islands[live[target]].writer.transport
+            if transport.is_closing() or transport.get_write_buffer_size() > MAX_BACKLOG:
+                self.stats["messages_dropped"] += 1
+                continue
+            transport.write(data)
+            self.stats["messages_routed"] += 1
+            self.stats["migrants_routed"] += count
+
+    # Результат острова; якщо він зупинився через глобальну причину (ціль, бюджет часу), зупиняються всі
+    def _finish(self, id: int, result: Dict[str, Any]) -> None:
+        self.results[id] = result
+        self._log(f"Брокер: острів {id} завершив роботу, найкращий fitness = {result['fitness']:.4f}")
+        if result.get("stop_reason") in GLOBAL_REASONS:
+            for island in self._islands.values():
+                if island.id != id:
+                    island.writer.write(json_frame(STOP, {"reason": result["stop_reason"]}))
+
+    # Нагляд: острови, що мовчать довше за heartbeat_timeout, відключаються (і стають втраченими);
+    # після join_timeout острови, що так і не підключились, більше не очікуються
+    async def _watch(self) -> None:
+        period: float = min(1.0, self.heartbeat_timeout / 4)
+        while True:
+            await asyncio.sleep(period)
+            now: float = time.monotonic()
+            for island in list(self._islands.values()):
+                if now - island.last_seen > self.heartbeat_timeout:
+                    self._log(f"Брокер: острів {island.id} не відповідає {now - island.last_seen:.1f} с")
+                    island.writer.close()
+            self._check_done()
+
+    def _check_done(self) -> None:
+        if self._islands or self._done.is_set():
+            return
+        waiting: bool = any(i not in self.results and i not in self.lost for i in range(self.num_islands))
+        if not waiting or time.monotonic() - self._start_time >= self.join_timeout:
+            self._done.set()
+
+
+# Острів розподіленої моделі: еволюціонує свою популяцію спискового рушія (BackpackGA, BackpackGABitset),
+# раз на migration_interval поколінь надсилає емігрантів брокеру і на початку кожного покоління вбудовує
+# отримані. Покоління виконуються в окремому потоці, тож цикл подій тим часом надсилає серцебиття
+# і приймає мігрантів. Якщо брокер недоступний, острів доеволюціонує без міграцій.
+# З seed острів i використовує той самий потік випадкових чисел, що й острів i BackpackGAIslandModel,
+# але асинхронна міграція по мережі робить результат залежним від швидкості вузлів
+class IslandClient:
+    def __init__(
+        self,
+        ga: BackpackGA,
+        island_id: int,
+        host: str,
+        port: int,
+        island_size: Optional[int] = None,
+        migration_interval: int = 10,
+        migration_size: Optional[int] = None,
+        emigrant_policy: str = "best",
+        replacement_policy: str = "worst",
+        heartbeat_interval: float = 1.0,
+        connect_timeout: float = 30.0,
+    ):
+        check_migration_config("ring", emigrant_policy, replacement_policy)
+        self.ga: BackpackGA = ga
+        self.island_id: int = island_id
+        self.host: str = host
+        self.port: int = port
+        self.island_size: int = island_size or ga.population_size
+        self.migration_interval: int = migration_interval
+        self.migration_size: int = migration_size or max(1, self.island_size // 10)
+        self.emigrant_policy: str = emigrant_policy
+        self.replacement_policy: str = replacement_policy
+        self.heartbeat_interval: float = heartbeat_interval
+        self.connect_timeout: float = connect_timeout
+        self.generation: int = 0
+        self.stats: Dict[str, Any] = {"migrants_sent": 0, "migrants_received": 0, "migrants_replaced": 0}
+        self._inbox: List[Tuple[int, List[MigrantRecord]]] = []
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._last_heartbeat: float = 0.0
+
+    # Брокер може стартувати пізніше за острів: підключення повторюється до connect_timeout
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        deadline: float = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                return await asyncio.open_connection(self.host, self.port)
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise
+                await asyncio.sleep(0.2)
+
+    # Надсилання кадру; втрата брокера не зупиняє острів
+    async def _send(self, data: bytes) -> None:
+        if self._writer is None:
+            return
+        try:
+            self._writer.write(data)
+            await self._writer.drain()
+        except ConnectionError:
+            self._disconnect("з'єднання з брокером розірвано")
+
+    def _disconnect(self, reason: str) -> None:
+        if self._writer is not None:
+            self.ga._log(f"[Острів {self.island_id}] Далі без міграцій: {reason}")
+            self._writer.close()
+            self._writer = None
+
+    async def _listen(self, reader: asyncio.StreamReader, stop_event: threading.Event) -> None:
+        try:
+            while True:
+                kind, payload = await read_frame(reader)
+                if kind == MIGRANTS:
+                    self._inbox.append(unpack_migrants(payload))
+                elif kind == STOP:
+                    stop_event.set()
+                elif kind == ERROR:
+                    self._disconnect(json.loads(payload)["message"])
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, struct.error):
+            self._disconnect("брокер закрив з'єднання")
+
+    # Серцебиття надсилає сам цикл поколінь (не окрема задача циклу подій): острів, що завис
+    # усередині покоління, замовкає, і брокер позначає його втраченим
+    async def _heartbeat(self) -> None:
+        now: float = time.monotonic()
+        if now - self._last_heartbeat >= self.heartbeat_interval:
+            self._last_heartbeat = now
+            await self._send(json_frame(HEARTBEAT, {"generation": self.generation}))
+
+    # Мігранти, що надійшли від сусідів, вбудовуються в порядку номерів відправників
+    def _receive(self, population: List[Individual]) -> None:
+        messages, self._inbox = sorted(self._inbox, key=itemgetter(0)), []
+        ga = self.ga
+        for source, records in messages:
+            migrants = [Individual(ga._unpack_genome(genome), fitness, weight, value) for fitness, weight, value, genome in records]
+            self.stats["migrants_received"] += len(migrants)
+            self.stats["migrants_replaced"] += replace_with_migrants(population, migrants, self.replacement_policy, ga._random)
+
+    async def _emigrate(self, population: List[Individual]) -> None:
+        ga = self.ga
+        emigrants = select_emigrants(population, self.migration_size, self.emigrant_policy, ga._random)
+        records = [(ind.fitness, ind.weight, ind.value, ga._pack_genome(ind.genome)) for ind in emigrants]
+        await self._send(frame(MIGRANTS, pack_migrants(self.island_id, records, ga._genome_nbytes())))
+        self.stats["migrants_sent"] += len(records)
+
+    # Повний запуск острова; повертає його найкращий розв'язок (він же — у ga.result)
+    async def run(self) -> Tuple[List[int], int, int]:
+        ga = self.ga
+        start_time: float = time.perf_counter()
+        reader, self._writer = await self._connect()
+        await self._send(json_frame(HELLO, {
+            "island": self.island_id,
+            "fingerprint": ga._instance_fingerprint().hex(),
+            "genome_nbytes": ga._genome_nbytes(),
+        }))
+        kind, payload = await read_frame(reader)
+        if kind != WELCOME:
+            self._writer.close()
+            raise ValueError(f"Брокер відхилив острів {self.island_id}: {json.loads(payload).get('message')}")
+        ga._log(f"[Острів {self.island_id}] Підключився до брокера {self.host}:{self.port}")
+
+        if ga.seed is not None:
+            ga._reseed(np.random.SeedSequence(ga.seed, spawn_key=(self.island_id,)))
+        stop_event = threading.Event()
+        monitor = ga._start_monitor(stop_event)
+        listener = asyncio.create_task(self._listen(reader, stop_event))
+        try:
+            population: List[Individual] = await asyncio.to_thread(ga._start_population, self.island_size, None)
+            for gen in range(ga.generations):
+                await self._heartbeat()
+                self._receive(population)
+                population = await asyncio.to_thread(ga._evolve_population, population, 1)
+                self.generation = gen + 1
+                if gen % self.migration_interval == 0:
+                    await self._emigrate(population)
+
+                best: Individual = max(population, key=by_fitness)
+                if monitor.update(best.fitness, best.value):
+                    ga._log(f"[Острів {self.island_id}] Зупинка після покоління {gen+1}: {monitor.reason}")
+                    break
+
+            ga.stop_reason = monitor.reason
+            ga.generations_run = self.generation
+            best = max(population, key=by_fitness)
+            ga._set_result(ga._decode(best.genome), best.value, best.weight)
+            await self._send(json_frame(RESULT, {
+                "fitness": best.fitness,
+                "value": best.value,
+                "weight": best.weight,
+                "solution": encode_solution(ga.result[0]),
+                "num_items": len(ga.items),
+                "generations": self.generation,
+                "stop_reason": monitor.reason,
+                "elapsed": time.perf_counter() - start_time,
+                **self.stats,
+            }))
+        finally:
+            listener.cancel()
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        return ga.result
+
+
+def run_island(ga: BackpackGA, island_id: int, host: str, port: int, **options) -> Tuple[List[int], int, int]:
+    return asyncio.run(IslandClient(ga, island_id, host, port, **options).run())
+
+
+def run_broker(num_islands: int, **options) -> MigrationBroker:
+    broker = MigrationBroker(num_islands, **options)
+    asyncio.run(broker.serve())
+    return broker
+
+
+# Усі острови на localhost: брокер у поточному процесі, острови — в окремих процесах.
+# Популяція ga.population_size ділиться між островами, як у BackpackGAIslandModel;
+# підсумок — у ga.result, ga.stop_reason і ga.migration_stats
+def run_local(
+    ga: BackpackGA,
+    num_islands: int,
+    migration_interval: int = 10,
+    topology: str = "ring",
+    emigrant_policy: str = "best",
+    replacement_policy: str = "worst",
+    heartbeat_interval: float = 1.0,
+    heartbeat_timeout: float = 10.0,
+    join_timeout: float = 30.0,
+) -> Tuple[List[int], int, int]:
+    check_migration_config(topology, emigrant_policy, replacement_policy)
+    island_size: int = ga.population_size // num_islands
+    if island_size < 4:
+        raise ValueError("Неможливо розподілити популяцію по островах. Збільште розмір популяції або зменшіть кількість островів.")
+
+    async def serve() -> MigrationBroker:
+        broker = MigrationBroker(num_islands, topology, "127.0.0.1", 0, heartbeat_timeout, join_timeout, ga.verbose)
+        host, port = await broker.start()
+        processes = [
+            multiprocessing.Process(
+                target=run_island,
+                args=(ga, i, host, port),
+                kwargs={
+                    "island_size": island_size,
+                    "migration_interval": migration_interval,
+                    "emigrant_policy": emigrant_policy,
+                    "replacement_policy": replacement_policy,
+                    "heartbeat_interval": heartbeat_interval,
+                },
+            )
+            for i in range(num_islands)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            await broker.wait()
+        finally:
+            # Острови, що не завершились за heartbeat_timeout після брокера (зависли або втрачені), зупиняються примусово
+            deadline: float = time.monotonic() + heartbeat_timeout
+            for process in processes:
+                await asyncio.to_thread(process.join, max(0.0, deadline - time.monotonic()))
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                    await asyncio.to_thread(process.join, 1.0)
+                if process.is_alive():
+                    process.kill()
+                    await asyncio.to_thread(process.join)
+        return broker
+
+    broker: MigrationBroker = asyncio.run(serve())
+    if not broker.results:
+        raise RuntimeError("Жоден острів не надіслав результату.")
+
+    results = broker.results.values()
+    reasons = [result["stop_reason"] for result in results if result["stop_reason"] not in (None, "stop_signal")]
+    ga.stop_reason = reasons[0] if reasons else None
+    ga.generations_run = max(result["generations"] for result in results)
+    ga.migration_stats = {
+        "topology": topology,
+        "islands": num_islands,
+        **broker.stats,
+        "migrants_sent": sum(result["migrants_sent"] for result in results),
+        "migrants_replaced": sum(result["migrants_replaced"] for result in results),
+        "lost_islands": sorted(broker.lost),
+        "missing_islands": broker.missing,
+    }
+    ga._set_result(*broker.best())
+    return ga.result
+
+
+ENGINES = {"sequential": BackpackGA, "bitset": BackpackGABitset}
+
+
+def _make_ga(args: argparse.Namespace) -> BackpackGA:
+    items = load_items(args.items, args.max_weight)
+    max_weight = args.max_weight if args.max_weight is not None else items.max_weight
+    if max_weight is None:
+        raise ValueError("Максимальну вагу не задано ні в аргументах, ні в таблиці предметів.")
+    return ENGINES[args.engine](
+        items, max_weight, args.population, args.generations, args.mutation_rate, verbose=args.verbose, seed=args.seed,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Розподілена Island Model: брокер міграцій і острови по TCP")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    broker_parser = commands.add_parser("broker", help="запустити брокер міграцій")
+    island_parser = commands.add_parser("island", help="запустити один острів")
+    local_parser = commands.add_parser("local", help="брокер і всі острови на localhost")
+    for command in (broker_parser, local_parser):
+        command.add_argument("--islands", type=int, required=True)
+        command.add_argument("--topology", choices=TOPOLOGIES, default="ring")
+        command.add_argument("--heartbeat-timeout", type=float, default=10.0)
+        command.add_argument("--join-timeout", type=float, default=30.0)
+    broker_parser.add_argument("--host", default="0.0.0.0")
+    broker_parser.add_argument("--port", type=int, default=5555)
+    island_parser.add_argument("--id", type=int, required=True)
+    island_parser.add_argument("--host", default="127.0.0.1")
+    island_parser.add_argument("--port", type=int, default=5555)
+    for command in (island_parser, local_parser):
+        command.add_argument("--items", required=True, help="CSV або бінарна таблиця предметів")
+        command.add_argument("--max-weight", type=int, default=None)
+        command.add_argument("--engine", choices=sorted(ENGINES), default="sequential")
+        command.add_argument("--population", type=int, default=100)
+        command.add_argument("--generations", type=int, default=100)
+        command.add_argument("--mutation-rate", type=float, default=0.01)
+        command.add_argument("--migration-interval", type=int, default=10)
+        command.add_argument("--heartbeat-interval", type=float, default=1.0)
+        command.add_argument("--seed", type=int, default=None)
+    for command in (broker_parser, island_parser, local_parser):
+        command.add_argument("--verbose", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "broker":
+        broker = run_broker(
+            args.islands, topology=args.topology, host=args.host, port=args.port,
+            heartbeat_timeout=args.heartbeat_timeout, join_timeout=args.join_timeout, verbose=args.verbose,
+        )
+        best = broker.best()
+        print(json.dumps({
+            "value": best[1] if best else None,
+            "weight": best[2] if best else None,
+            "islands_reported": sorted(broker.results),
+            "lost_islands": sorted(broker.lost),
+            "missing_islands": broker.missing,
+            **broker.stats,
+        }))
+        return 0 if best else 1
+
+    ga = _make_ga(args)
+    if args.command == "island":
+        _, value, weight = run_island(
+            ga, args.id, args.host, args.port,
+            migration_interval=args.migration_interval, heartbeat_interval=args.heartbeat_interval,
+        )
+    else:
+        _, value, weight = run_local(
+            ga, args.islands, args.migration_interval, args.topology,
+            heartbeat_interval=args.heartbeat_interval, heartbeat_timeout=args.heartbeat_timeout,
+            join_timeout=args.join_timeout,
+        )
+    print(json.dumps({"value": value, "weight": weight, "stop_reason": ga.stop_reason}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+import math
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+from ItemTable import Items, ItemTable
+
+# Пакетна оцінка фітнесу. Контракт оцінювача: популяція — матриця бітів uint8 форми (..., P, n) —
+# на вході, масив фітнесу (..., P) на виході; провідні осі — незалежні популяції (острови).
+# Рушії самі рахують сумарні вагу й цінність (інкрементно або матричним добутком), тож оцінювач,
+# фітнес якого виражається через ці суми (additive), не перемножує популяцію вдруге,
+# а спискові рушії оновлюють фітнес через _flip за O(змінених бітів)
+
+# Частка ваги, що віднімається від цінності допустимого розв'язку
+WEIGHT_COST: float = 0.1
+
+# Штраф: (базовий фітнес, порушення > 0, коефіцієнт) -> фітнес недопустимого розв'язку.
+# Працює і з числами (інкрементний шлях), і з масивами
+Penalty = Callable[[float, float, float], float]
+
+
+# «Смертний» штраф: недопустимий розв'язок має нульовий фітнес (0.0 * порушення — нуль і для масивів)
+def death_penalty(base, violation, factor):
+    return 0.0 * violation
+
+
+def linear_penalty(base, violation, factor):
+    return base - factor * violation
+
+
+def quadratic_penalty(base, violation, factor):
+    return base - factor * violation * violation
+
+
+PENALTIES: Dict[str, Penalty] = {
+    "death": death_penalty,
+    "linear": linear_penalty,
+    "quadratic": quadratic_penalty,
+}
+
+
+# Штраф за назвою або власна функція з тим самим контрактом
+def resolve_penalty(penalty: Union[str, Penalty]) -> Penalty:
+    if callable(penalty):
+        return penalty
+    if penalty not in PENALTIES:
+        raise ValueError(f"Невідомий штраф: {penalty}. Доступні: {', '.join(PENALTIES)}")
+    return PENALTIES[penalty]
+
+
+# Фітнес за масивами: штраф застосовується лише там, де є порушення
+def penalized_fitness(base: np.ndarray, violation: np.ndarray, penalty: Penalty, factor: float) -> np.ndarray:
+    return np.where(violation > 0, penalty(base, violation, factor), base)
+
+
+# Матриця предметів (n, 2): перший стовпець — ваги, другий — цінності; для таблиці з файлу — без копії
+def item_matrix(items: Items) -> np.ndarray:
+    return np.asarray(items, dtype=np.float64).reshape(-1, 2)
+
+
+# Найбільша цінність на одиницю ваги серед предметів: з таким коефіцієнтом лінійний штраф
+# робить надлишок ваги не вигіднішим за вилучення найщільнішого предмета
+def max_density(values: np.ndarray, weights: np.ndarray) -> float:
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim == 1:
+        weights = weights[:, None]
+    ratios: np.ndarray = np.divide(
+        np.asarray(values, dtype=np.float64)[:, None], weights,
+        out=np.zeros(weights.shape), where=weights > 0,
+    )
+    return float(ratios.max()) if ratios.size and ratios.max() > 0 else 1.0
+
+
+# Базовий оцінювач: власна цільова функція реалізує лише evaluate()
+class Evaluator:
+    # Фітнес виражається через сумарні вагу й цінність (score / score_totals)
+    additive: bool = False
+
+    def evaluate(self, population: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    # Оцінка, коли рушій уже знає суми популяції; без формули від сум — повна оцінка
+    def evaluate_totals(self, population: np.ndarray, weight: np.ndarray, value: np.ndarray) -> np.ndarray:
+        return self.evaluate(population)
+
+    # Фітнес однієї особини за сумами; NaN — «не виражається через суми»:
+    # спискові рушії позначають так змінених нащадків і оцінюють їх потім одним пакетом
+    def score(self, weight: float, value: float) -> float:
+        return math.nan
+
+
+# Рюкзак з однією місткістю: цінність мінус weight_cost · вага, перевантажені розв'язки штрафуються
+# (за замовчуванням — нульовий фітнес, як у вихідній постановці)
+class KnapsackEvaluator(Evaluator):
+    additive = True
+
+    def __init__(
+        self,
+        items: Items,
+        max_weight: float,
+        penalty: Union[str, Penalty] = "death",
+        weight_cost: float = WEIGHT_COST,
+        penalty_factor: Optional[float] = None,
+    ):
+        self.items: Items = items
+        self.max_weight: float = max_weight
+        self.penalty: Penalty = resolve_penalty(penalty)
+        self.weight_cost: float = weight_cost
+        self._matrix: np.ndarray = item_matrix(items)
+        self.penalty_factor: float = penalty_factor if penalty_factor is not None else max_density(self._matrix[:, 1], self._matrix[:, 0])
+
+    # Таблиця з файлу серіалізується шляхом, а матриця відтворюється після десеріалізації (див. BackpackGA)
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        if isinstance(self.items, ItemTable):
+            del state["_matrix"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if isinstance(self.items, ItemTable):
+            self._matrix = item_matrix(self.items)
+
+    def evaluate(self, population: np.ndarray) -> np.ndarray:
+        totals: np.ndarray = population.astype(np.float64) @ self._matrix
+        return self.score_totals(totals[..., 0], totals[..., 1])
+
+    def evaluate_totals(self, population: np.ndarray, weight: np.ndarray, value: np.ndarray) -> np.ndarray:
+        return self.score_totals(weight, value)
+
+    def score_totals(self, weight: np.ndarray, value: np.ndarray) -> np.ndarray:
+        base: np.ndarray = value - self.weight_cost * weight
+        return penalized_fitness(base, weight - self.max_weight, self.penalty, self.penalty_factor)
+
+    def score(self, weight: float, value: float) -> float:
+        base: float = value - self.weight_cost * weight
+        violation: float = weight - self.max_weight
+        if violation <= 0:
+            return base
+        return self.penalty(base, violation, self.penalty_factor)
+
+
+# Багатовимірний рюкзак: крім основної ваги предмети мають додаткові «ваги» constraints (n, m)
+# з місткостями capacities (m,). Порушення — сумарний надлишок за всіма обмеженнями, основним теж.
+# Фітнес не виражається лише через вагу й цінність, тож спискові рушії оцінюють нащадків пакетом
+class MultiKnapsackEvaluator(KnapsackEvaluator):
+    additive = False
+
+    def __init__(
+        self,
+        items: Items,
+        max_weight: float,
+        constraints,
+        capacities,
+        penalty: Union[str, Penalty] = "death",
+        weight_cost: float = WEIGHT_COST,
+        penalty_factor: Optional[float] = None,
+    ):
+        self.constraints: np.ndarray = np.asarray(constraints, dtype=np.float64).reshape(len(items), -1)
+        self.capacities: np.ndarray = np.asarray(capacities, dtype=np.float64).reshape(-1)
+        if self.constraints.shape[1] != len(self.capacities):
+            raise ValueError(
+                f"Кількість обмежень ({self.constraints.shape[1]}) не збігається з кількістю місткостей ({len(self.capacities)})."
+            )
+        super().__init__(items, max_weight, penalty, weight_cost, penalty_factor)
+        if penalty_factor is None:
+            self.penalty_factor = max_density(self._matrix[:, 1], np.column_stack((self._matrix[:, 0], self.constraints)))
+
+    def evaluate(self, population: np.ndarray) -> np.ndarray:
+        totals: np.ndarray = population.astype(np.float64) @ self._matrix
+        return self.evaluate_totals(population, totals[..., 0], totals[..., 1])
+
+    def evaluate_totals(self, population: np.ndarray, weight: np.ndarray, value: np.ndarray) -> np.ndarray:
+        loads: np.ndarray = population.astype(np.float64) @ self.constraints
+        violation: np.ndarray = np.maximum(weight - self.max_weight, 0.0)
+        violation = violation + np.maximum(loads - self.capacities, 0.0).sum(axis=-1)
+        return penalized_fitness(value - self.weight_cost * weight, violation, self.penalty, self.penalty_factor)
+
+    def score(self, weight: float, value: float) -> float:
+        return math.nan
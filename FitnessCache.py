@@ -0,0 +1,65 @@
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# Закешована оцінка генома: (фітнес, вага, цінність)
+CacheEntry = Tuple[float, int, int]
+
+
+# Компактний ключ генома: 16-байтний хеш бітового рядка
+def genome_key(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# LRU-кеш оцінок геномів з обмеженим розміром і лічильниками влучань/промахів
+class FitnessCache:
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError("Розмір кешу має бути додатним.")
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: "OrderedDict[bytes, CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[CacheEntry]:
+        entry: Optional[CacheEntry] = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: bytes, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # Обнулення лічильників (напр., у воркері, що успадкував кеш батьківського процесу)
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+
+# Сумування статистик кешу з кількох процесів
+def merge_stats(*stats: Dict[str, int]) -> Dict[str, int]:
+    merged: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "size": 0}
+    for part in stats:
+        for name, value in part.items():
+            merged[name] = merged.get(name, 0) + value
+    return merged
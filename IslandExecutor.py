@@ -0,0 +1,171 @@
+import copy
+import multiprocessing
+import traceback
+from multiprocessing import resource_tracker
+from typing import Dict, List, Optional
+
+
+# Цикл довгоживучого процесу острова: чекає на команду, виконує один запуск острова і знову чекає.
+# Команда: (ga, номер острова, розмір популяції, SeedSequence острова, чи потрібна черга знімків,
+# аргументи _island_worker); None — завершення
+def _executor_loop(
+    commands: multiprocessing.Queue,
+    result_queue: multiprocessing.Queue,
+    stats_queue: multiprocessing.Queue,
+    stop_event: multiprocessing.Event,
+    migration_counter: multiprocessing.Value,
+    accepted_migrations_counter: multiprocessing.Value,
+    mailbox_locks: List[multiprocessing.Lock],
+    barriers: Dict[int, multiprocessing.Barrier],
+) -> None:
+    while True:
+        command = commands.get()
+        if command is None:
+            break
+        ga, id, island_pop_size, seed_sequence, stream, options = command
+        mailboxes = options["mailboxes"]
+        for mailbox, lock in zip(mailboxes, mailbox_locks):
+            mailbox.attach_lock(lock)
+        # Бар'єр синхронної міграції — на стільки островів, скільки їх у запуску
+        barrier = barriers[len(mailboxes)] if options.pop("synchronous", False) else None
+        try:
+            # Початкова популяція створюється на острові, тож батьківський процес не пересилає її
+            ga._profiler = None
+            ga._island_worker(
+                id,
+                island_pop_size,
+                result_queue=result_queue,
+                migration_counter=migration_counter,
+                accepted_migrations_counter=accepted_migrations_counter,
+                stop_event=stop_event,
+                stats_queue=stats_queue if stream else None,
+                seed_sequence=seed_sequence,
+                barrier=barrier,
+                **options,
+            )
+        except Exception:
+            # Помилка острова не повинна зупиняти процес: батьківський процес отримає її замість результату
+            stop_event.set()
+            if barrier is not None:
+                barrier.abort()
+            result_queue.put((id, None, traceback.format_exc(), None))
+            if stream:
+                stats_queue.put(None)
+        finally:
+            for mailbox in mailboxes:
+                mailbox.close()
+
+
+# Пул постійних процесів-островів. Процеси, черги, лічильники міграцій і сигнал зупинки створюються один раз
+# на сесію; кожен запуск BackpackGAIslandModel.run(..., executor=...) лише надсилає островам команди
+# з екземпляром задачі та seed, тож вартість старту процесів не входить у час розв'язання.
+#
+#     with IslandExecutor(4) as executor:
+#         for seed in range(10):
+#             BackpackGAIslandModel(items, max_weight, 200, 100, 0.1, seed=seed).run(4, executor=executor)
+class IslandExecutor:
+    def __init__(self, num_islands: int):
+        if num_islands < 1:
+            raise ValueError("Кількість островів має бути не меншою за 1.")
+        self.num_islands: int = num_islands
+        self.result_queue: Optional[multiprocessing.Queue] = None
+        self.stats_queue: Optional[multiprocessing.Queue] = None
+        self.stop_event: Optional[multiprocessing.Event] = None
+        self.migration_counter: Optional[multiprocessing.Value] = None
+        self.accepted_migrations_counter: Optional[multiprocessing.Value] = None
+        # Блокування скриньок мігрантів: скриньки створюються на кожен запуск, а блокування
+        # можна передати процесам лише під час їх створення
+        self.mailbox_locks: List[multiprocessing.Lock] = []
+        # Бар'єри синхронної міграції для кожної можливої кількості островів запуску (з тієї ж причини)
+        self._barriers: Dict[int, multiprocessing.Barrier] = {}
+        self._commands: List[multiprocessing.Queue] = []
+        self._processes: List[multiprocessing.Process] = []
+        self._busy: bool = False
+
+    def __enter__(self) -> "IslandExecutor":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._processes)
+
+    def start(self) -> "IslandExecutor":
+        if self.running:
+            return self
+        self.result_queue = multiprocessing.Queue()
+        self.stats_queue = multiprocessing.Queue()
+        self.stop_event = multiprocessing.Event()
+        self.migration_counter = multiprocessing.Value('i', 0)
+        self.accepted_migrations_counter = multiprocessing.Value('i', 0)
+        self.mailbox_locks = [multiprocessing.Lock() for _ in range(self.num_islands)]
+        self._barriers = {parties: multiprocessing.Barrier(parties) for parties in range(1, self.num_islands + 1)}
+        # Трекер спільної пам'яті має існувати до fork: інакше кожен острів запустить власний
+        # і після завершення намагатиметься видалити вже звільнені скриньки
+        resource_tracker.ensure_running()
+        for _ in range(self.num_islands):
+            commands: multiprocessing.Queue = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=_executor_loop,
+                args=(
+                    commands,
+                    self.result_queue,
+                    self.stats_queue,
+                    self.stop_event,
+                    self.migration_counter,
+                    self.accepted_migrations_counter,
+                    self.mailbox_locks,
+                    self._barriers,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._commands.append(commands)
+            self._processes.append(process)
+        return self
+
+    # Підготовка до нового запуску: скидання сигналу зупинки й лічильників попереднього запуску
+    def begin(self, num_islands: int) -> None:
+        if not self.running:
+            raise ValueError("Виконавець островів не запущено: використовуйте start() або with IslandExecutor(...).")
+        if num_islands > self.num_islands:
+            raise ValueError(f"Виконавець має {self.num_islands} островів, а запуск потребує {num_islands}.")
+        if self._busy:
+            raise ValueError("Виконавець островів уже виконує інший запуск.")
+        self._busy = True
+        self.stop_event.clear()
+        with self.migration_counter.get_lock():
+            self.migration_counter.value = 0
+        with self.accepted_migrations_counter.get_lock():
+            self.accepted_migrations_counter.value = 0
+
+    # Бар'єр на num_islands островів; попередній запуск міг залишити його зламаним (abort)
+    def barrier(self, num_islands: int) -> multiprocessing.Barrier:
+        barrier = self._barriers[num_islands]
+        barrier.reset()
+        return barrier
+
+    def submit(self, ga, id: int, island_pop_size: int, seed_sequence, stream: bool, **options) -> None:
+        # Колбек профілю може бути непіклюваним (lambda), а профайлер батьківського процесу змінюється
+        # під час серіалізації команди у фоновому потоці черги — острову не потрібне ні те, ні інше
+        worker_ga = copy.copy(ga)
+        worker_ga.on_profile = None
+        worker_ga._profiler = None
+        self._commands[id].put((worker_ga, id, island_pop_size, seed_sequence, stream, options))
+
+    def end(self) -> None:
+        self._busy = False
+
+    def close(self) -> None:
+        for commands in self._commands:
+            commands.put(None)
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._commands = []
+        self._processes = []
+        self._busy = False
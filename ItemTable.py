@@ -0,0 +1,140 @@
+import csv
+import os
+import struct
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Бінарний формат таблиці предметів:
+#   заголовок (32 байти): сигнатура, версія, кількість предметів, максимальна вага (-1 — не задана)
+#   матриця (n, 2) little-endian float64: перший стовпець — ваги, другий — цінності
+# Матриця зберігається саме у float64, бо в такому вигляді її читають векторизовані ядра:
+# відображений файл використовується без копіювання, а сторінки спільні для всіх процесів
+MAGIC: bytes = b"KNAPITEM"
+VERSION: int = 1
+HEADER = struct.Struct("<8sIIqq")
+DTYPE = np.dtype("<f8")
+
+# Скільки рядків читається/пишеться за раз при конвертації та ітерації
+CHUNK_ROWS: int = 1 << 16
+
+
+# Таблиця предметів, відображена з файлу (np.memmap). Серіалізується шляхом до файлу:
+# процес-воркер відображає той самий файл замість отримання копії предметів
+class ItemTable:
+    def __init__(self, path: str):
+        self.path: str = os.path.abspath(path)
+        with open(self.path, "rb") as file:
+            header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"Файл {path} не є таблицею предметів: замалий заголовок.")
+        magic, version, _, num_items, max_weight = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"Файл {path} не є таблицею предметів.")
+        if version != VERSION:
+            raise ValueError(f"Непідтримувана версія таблиці предметів: {version}.")
+
+        self.max_weight: Optional[int] = max_weight if max_weight >= 0 else None
+        # Порожній файл не можна відобразити, тож порожня таблиця — звичайний масив
+        if num_items:
+            self.matrix: np.ndarray = np.memmap(self.path, dtype=DTYPE, mode="r", offset=HEADER.size, shape=(num_items, 2))
+        else:
+            self.matrix = np.zeros((0, 2), dtype=DTYPE)
+        self.weights: np.ndarray = self.matrix[:, 0]
+        self.values: np.ndarray = self.matrix[:, 1]
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    # Предмети як (вага, цінність) цілими — для спискових рушіїв і еталонних розв'язувачів
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for start in range(0, len(self.matrix), CHUNK_ROWS):
+            chunk = self.matrix[start:start + CHUNK_ROWS].astype(np.int64)
+            yield from map(tuple, chunk.tolist())
+
+    def __getitem__(self, index: int) -> Tuple[int, int]:
+        weight, value = self.matrix[index]
+        return int(weight), int(value)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == DTYPE:
+            return self.matrix
+        return self.matrix.astype(dtype)
+
+    def __reduce__(self):
+        return ItemTable, (self.path,)
+
+    def __repr__(self) -> str:
+        return f"ItemTable({self.path!r}, предметів = {len(self)}, максимальна вага = {self.max_weight})"
+
+
+# Предмети рушія: список (вага, цінність) або таблиця з файлу
+Items = Union[List[Tuple[int, int]], ItemTable]
+
+
+def _write_header(file, num_items: int, max_weight: Optional[int]) -> None:
+    file.write(HEADER.pack(MAGIC, VERSION, 0, num_items, -1 if max_weight is None else max_weight))
+
+
+# Запис предметів у бінарний файл порціями (пам'ять не залежить від розміру екземпляра)
+def write_items(path: str, items: Iterable[Tuple[int, int]], max_weight: Optional[int] = None) -> ItemTable:
+    num_items = 0
+    with open(path, "wb") as file:
+        _write_header(file, 0, max_weight)
+        chunk: List[Tuple[int, int]] = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == CHUNK_ROWS:
+                np.asarray(chunk, dtype=DTYPE).tofile(file)
+                num_items += len(chunk)
+                chunk = []
+        if chunk:
+            np.asarray(chunk, dtype=DTYPE).reshape(-1, 2).tofile(file)
+            num_items += len(chunk)
+        # Кількість предметів відома лише після запису — заголовок оновлюється наприкінці
+        file.seek(0)
+        _write_header(file, num_items, max_weight)
+    return ItemTable(path)
+
+
+# Предмети з CSV: стовпці вага, цінність (рядок заголовка необов'язковий;
+# якщо він містить назви weight і value, порядок стовпців береться з нього)
+def _read_csv_items(csv_path: str) -> Iterator[Tuple[int, int]]:
+    with open(csv_path, newline="") as file:
+        reader = csv.reader(file)
+        weight_col, value_col = 0, 1
+        header_allowed = True
+        for line, row in enumerate(reader, start=1):
+            if not row or row[0].lstrip().startswith("#"):
+                continue
+            try:
+                item = int(row[weight_col]), int(row[value_col])
+            except (ValueError, IndexError):
+                if not header_allowed:
+                    raise ValueError(f"{csv_path}:{line}: очікувалось 'вага,цінність', отримано {row}")
+                names = [name.strip().lower() for name in row]
+                if "weight" in names and "value" in names:
+                    weight_col, value_col = names.index("weight"), names.index("value")
+                header_allowed = False
+                continue
+            header_allowed = False
+            yield item
+
+
+# Конвертація CSV у бінарну таблицю (за замовчуванням — поруч із CSV з розширенням .items)
+def csv_to_items(csv_path: str, path: Optional[str] = None, max_weight: Optional[int] = None) -> ItemTable:
+    path = path or os.path.splitext(csv_path)[0] + ".items"
+    return write_items(path, _read_csv_items(csv_path), max_weight)
+
+
+# Завантаження екземпляра: бінарна таблиця відображається, CSV один раз конвертується
+# (повторно — лише якщо CSV новіший за вже сконвертований файл)
+def load_items(path: str, max_weight: Optional[int] = None) -> ItemTable:
+    if not path.lower().endswith(".csv"):
+        return ItemTable(path)
+    binary_path = os.path.splitext(path)[0] + ".items"
+    if os.path.exists(binary_path) and os.path.getmtime(binary_path) >= os.path.getmtime(path):
+        table = ItemTable(binary_path)
+        if max_weight is None or table.max_weight == max_weight:
+            return table
+    return csv_to_items(path, binary_path, max_weight)
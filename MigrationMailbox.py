@@ -0,0 +1,95 @@
+import multiprocessing
+import struct
+from multiprocessing.context import get_spawning_popen
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+
+# Мігрант у серіалізованому вигляді: (фітнес, вага, цінність, упакований геном)
+MigrantRecord = Tuple[float, int, int, bytes]
+
+_HEADER = struct.Struct("QQQ")   # head (записано повідомлень), tail (прочитано), dropped (перезаписано)
+_MESSAGE = struct.Struct("qI")   # острів-відправник, кількість мігрантів
+_RECORD = struct.Struct("dqq")   # фітнес, вага, цінність
+
+
+# Поштова скринька острова: кільцевий буфер у спільній пам'яті на capacity повідомлень.
+# Відправники пишуть мігрантів безпосередньо у скриньку сусіда, власник вичитує її на початку покоління.
+# Якщо буфер повний, найстаріше повідомлення перезаписується, тож затримка міграції обмежена одним поколінням читача
+class MigrationMailbox:
+    # lock — спільне блокування, створене заздалегідь (напр., IslandExecutor для постійних процесів)
+    def __init__(self, capacity: int, max_migrants: int, genome_nbytes: int, lock: Optional[multiprocessing.Lock] = None):
+        self.capacity: int = capacity
+        self.max_migrants: int = max_migrants
+        self.genome_nbytes: int = genome_nbytes
+        self._record_size: int = _RECORD.size + genome_nbytes
+        self._slot_size: int = _MESSAGE.size + max_migrants * self._record_size
+        self._lock = lock if lock is not None else multiprocessing.Lock()
+        self._shm: SharedMemory = SharedMemory(create=True, size=_HEADER.size + capacity * self._slot_size)
+        _HEADER.pack_into(self._shm.buf, 0, 0, 0, 0)
+
+    # Дочірні процеси отримують скриньку за іменем блоку спільної пам'яті.
+    # Блокування серіалізується лише під час створення процесу; при пересиланні через чергу
+    # отримувач під'єднує свою успадковану копію через attach_lock()
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_shm"] = self._shm.name
+        if get_spawning_popen() is None:
+            state["_lock"] = None
+        return state
+
+    def __setstate__(self, state) -> None:
+        self.__dict__.update(state)
+        self._shm = SharedMemory(name=state["_shm"])
+
+    def attach_lock(self, lock: multiprocessing.Lock) -> None:
+        self._lock = lock
+
+    def put(self, source: int, migrants: List[MigrantRecord]) -> None:
+        migrants = migrants[:self.max_migrants]
+        buf = self._shm.buf
+        with self._lock:
+            head, tail, dropped = _HEADER.unpack_from(buf, 0)
+            if head - tail == self.capacity:
+                tail += 1
+                dropped += 1
+
+            offset = _HEADER.size + (head % self.capacity) * self._slot_size
+            _MESSAGE.pack_into(buf, offset, source, len(migrants))
+            offset += _MESSAGE.size
+            for fitness, weight, value, genome in migrants:
+                _RECORD.pack_into(buf, offset, fitness, weight, value)
+                buf[offset + _RECORD.size:offset + _RECORD.size + self.genome_nbytes] = genome
+                offset += self._record_size
+
+            _HEADER.pack_into(buf, 0, head + 1, tail, dropped)
+
+    # Вичитує всі непрочитані повідомлення: [(острів-відправник, мігранти)]
+    def get_all(self) -> List[Tuple[int, List[MigrantRecord]]]:
+        buf = self._shm.buf
+        messages: List[Tuple[int, List[MigrantRecord]]] = []
+        with self._lock:
+            head, tail, dropped = _HEADER.unpack_from(buf, 0)
+            for seq in range(tail, head):
+                offset = _HEADER.size + (seq % self.capacity) * self._slot_size
+                source, count = _MESSAGE.unpack_from(buf, offset)
+                offset += _MESSAGE.size
+                migrants: List[MigrantRecord] = []
+                for _ in range(count):
+                    fitness, weight, value = _RECORD.unpack_from(buf, offset)
+                    genome = bytes(buf[offset + _RECORD.size:offset + _RECORD.size + self.genome_nbytes])
+                    migrants.append((fitness, weight, value, genome))
+                    offset += self._record_size
+                messages.append((source, migrants))
+            _HEADER.pack_into(buf, 0, head, head, dropped)
+        return messages
+
+    @property
+    def dropped(self) -> int:
+        return _HEADER.unpack_from(self._shm.buf, 0)[2]
+
+    def close(self) -> None:
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
@@ -0,0 +1,101 @@
+import heapq
+import math
+import random
+from typing import List, Tuple
+
+from BackpackGA import Individual, by_fitness
+
+TOPOLOGIES = ("ring", "bidirectional_ring", "torus", "fully_connected", "random", "star")
+EMIGRANT_POLICIES = ("best", "random")
+REPLACEMENT_POLICIES = ("worst", "random")
+
+
+def check_migration_config(topology: str, emigrant_policy: str, replacement_policy: str) -> None:
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Невідома топологія міграції: {topology}. Доступні: {', '.join(TOPOLOGIES)}")
+    if emigrant_policy not in EMIGRANT_POLICIES:
+        raise ValueError(f"Невідома політика відбору мігрантів: {emigrant_policy}. Доступні: {', '.join(EMIGRANT_POLICIES)}")
+    if replacement_policy not in REPLACEMENT_POLICIES:
+        raise ValueError(f"Невідома політика заміщення: {replacement_policy}. Доступні: {', '.join(REPLACEMENT_POLICIES)}")
+
+
+# Розміри решітки тора: найближчий до квадрата розклад num_islands = rows * cols
+def torus_shape(num_islands: int) -> Tuple[int, int]:
+    rows = int(math.isqrt(num_islands))
+    while num_islands % rows:
+        rows -= 1
+    return rows, num_islands // rows
+
+
+# Острови, яким island_id надсилає мігрантів під час однієї міграції
+def migration_targets(topology: str, island_id: int, num_islands: int, rng=random) -> List[int]:
+    if num_islands < 2:
+        return []
+
+    if topology == "ring":
+        targets = [(island_id + 1) % num_islands]
+    elif topology == "bidirectional_ring":
+        targets = [(island_id + 1) % num_islands, (island_id - 1) % num_islands]
+    elif topology == "torus":
+        rows, cols = torus_shape(num_islands)
+        r, c = divmod(island_id, cols)
+        targets = [
+            r * cols + (c + 1) % cols,
+            r * cols + (c - 1) % cols,
+            ((r + 1) % rows) * cols + c,
+            ((r - 1) % rows) * cols + c,
+        ]
+    elif topology == "fully_connected":
+        targets = list(range(num_islands))
+    elif topology == "random":
+        target = rng.randrange(num_islands - 1)
+        targets = [target + 1 if target >= island_id else target]
+    elif topology == "star":
+        # Острів 0 — центр: розсилає всім, решта надсилають лише йому
+        targets = list(range(num_islands)) if island_id == 0 else [0]
+    else:
+        raise ValueError(f"Невідома топологія міграції: {topology}")
+
+    # Без дублікатів (напр., двонаправлене кільце з 2 островів) і без самого себе
+    return [t for t in dict.fromkeys(targets) if t != island_id]
+
+
+# Максимальна кількість островів, що можуть надсилати мігрантів одному острову (для розміру скриньки)
+def max_in_degree(topology: str, num_islands: int) -> int:
+    if num_islands < 2:
+        return 0
+    if topology == "random":
+        return num_islands - 1
+    in_degree = [0] * num_islands
+    for island_id in range(num_islands):
+        for target in migration_targets(topology, island_id, num_islands):
+            in_degree[target] += 1
+    return max(in_degree)
+
+
+# Відбір емігрантів без повного сортування популяції
+def select_emigrants(population: List[Individual], count: int, policy: str, rng=random) -> List[Individual]:
+    count = min(count, len(population))
+    if policy == "best":
+        return heapq.nlargest(count, population, key=by_fitness)
+    return rng.sample(population, count)
+
+
+# Вбудовування мігрантів у популяцію на місці, її розмір не змінюється.
+# "worst": найкращі мігранти заміщують найгірших особин, але лише якщо вони кращі (як злиття з відсіканням);
+# "random": мігранти заміщують випадкових особин
+def replace_with_migrants(population: List[Individual], migrants: List[Individual], policy: str, rng=random) -> int:
+    count = min(len(migrants), len(population))
+    if policy == "random":
+        for slot, migrant in zip(rng.sample(range(len(population)), count), migrants):
+            population[slot] = migrant
+        return count
+
+    worst_slots = heapq.nsmallest(count, range(len(population)), key=lambda i: population[i].fitness)
+    replaced = 0
+    for slot, migrant in zip(worst_slots, sorted(migrants, key=by_fitness, reverse=True)):
+        if migrant.fitness <= population[slot].fitness:
+            break
+        population[slot] = migrant
+        replaced += 1
+    return replaced
@@ -0,0 +1,54 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator
+
+# Звіт профілювання: фаза → {"time": секунди, "calls": кількість викликів}
+ProfileReport = Dict[str, Dict[str, float]]
+
+# Порожній контекст для фаз, коли профілювання вимкнено (без накладних витрат на таймер)
+NO_PHASE = nullcontext()
+
+
+# Накопичувач часу і кількості викликів по фазах гарячого шляху
+class PhaseProfiler:
+    def __init__(self):
+        self.times: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def phase(self, name: str, calls: int = 1) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[name] += time.perf_counter() - start
+            self.calls[name] += calls
+
+    def add(self, name: str, elapsed: float, calls: int = 1) -> None:
+        self.times[name] += elapsed
+        self.calls[name] += calls
+
+    # Лічильник подій без часу (напр., кількість міграцій)
+    def count(self, name: str, calls: int = 1) -> None:
+        self.calls[name] += calls
+
+    def merge(self, report: ProfileReport) -> None:
+        for name, entry in report.items():
+            self.times[name] += entry["time"]
+            self.calls[name] += int(entry["calls"])
+
+    def report(self) -> ProfileReport:
+        return {
+            name: {"time": self.times.get(name, 0.0), "calls": self.calls[name]}
+            for name in sorted(self.calls)
+        }
+
+
+def format_report(report: ProfileReport) -> str:
+    total = sum(entry["time"] for entry in report.values())
+    lines = []
+    for name, entry in sorted(report.items(), key=lambda pair: pair[1]["time"], reverse=True):
+        share = entry["time"] / total if total > 0 else 0.0
+        lines.append(f"  {name:<20} {entry['time']:>9.4f} с  {share:>6.1%}  викликів: {int(entry['calls'])}")
+    return "\n".join(lines)
@@ -0,0 +1,57 @@
+import math
+import random
+from typing import Optional
+
+import numpy as np
+
+# Незалежні відтворювані потоки випадкових чисел. Усі потоки запуску походять від одного SeedSequence:
+# острови отримують дочірні послідовності (spawn), а порції роботи воркерів — seed, обраний master-процесом
+# для кожної порції. Тож результат залежить лише від seed, а не від того, який процес і коли виконав роботу
+
+# Ключ дочірньої послідовності для генератора модуля random (бітові маски, вибір мігрантів і топології random).
+# Достатньо великий, щоб не збігтися з номерами дочірніх послідовностей spawn()
+PY_RANDOM_KEY: int = 2**63
+
+
+# Кореневий SeedSequence запуску: з seed — відтворюваний, без нього — з ентропії глобального random
+def seed_sequence(seed: Optional[int] = None) -> np.random.SeedSequence:
+    return np.random.SeedSequence(seed if seed is not None else random.getrandbits(128))
+
+
+def numpy_stream(sequence: np.random.SeedSequence) -> np.random.Generator:
+    return np.random.default_rng(sequence)
+
+
+# Генератор модуля random, незалежний від генератора NumPy тієї самої послідовності
+def python_stream(sequence: np.random.SeedSequence) -> random.Random:
+    child = np.random.SeedSequence(sequence.entropy, spawn_key=tuple(sequence.spawn_key) + (PY_RANDOM_KEY,))
+    return random.Random(int.from_bytes(child.generate_state(4, np.uint32).tobytes(), "little"))
+
+
+# Цілий seed дочірньої послідовності з номером keys — для рушіїв, що приймають seed числом
+# (напр., екземпляр index потоку BatchSolver або прогін run клітинки сітки sweep)
+def child_seed(sequence: np.random.SeedSequence, *keys: int) -> int:
+    child = np.random.SeedSequence(sequence.entropy, spawn_key=tuple(sequence.spawn_key) + keys)
+    return int.from_bytes(child.generate_state(4, np.uint32).tobytes(), "little")
+
+
+# Зростаючі позиції подій серед num_bits бітів, кожен з яких стається з імовірністю p.
+# Замість випробування для кожного біта генеруються блоки геометричних відстаней між подіями
+# (розмір блоку — з запасом над очікуваною кількістю подій, тож зазвичай досить одного виклику)
+def bernoulli_positions(num_bits: int, p: float, rng: np.random.Generator) -> np.ndarray:
+    if p <= 0 or num_bits <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(num_bits, dtype=np.int64)
+
+    blocks = []
+    position: int = -1
+    while True:
+        expected: float = (num_bits - 1 - position) * p
+        block: np.ndarray = position + np.cumsum(rng.geometric(p, size=int(expected + 4 * math.sqrt(expected)) + 16))
+        if block[-1] >= num_bits:
+            blocks.append(block[:np.searchsorted(block, num_bits)])
+            break
+        blocks.append(block)
+        position = int(block[-1])
+    return np.concatenate(blocks)
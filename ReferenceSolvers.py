@@ -0,0 +1,93 @@
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+
+# Еталонні розв'язувачі для вимірювання якості GA: точний оптимум і верхня межа.
+# Обидва працюють на тисячах предметів за частки секунди (W — максимальна вага рюкзака)
+
+def _check_capacity(max_weight: int) -> None:
+    if max_weight < 0:
+        raise ValueError("Максимальна вага рюкзака не може бути від'ємною.")
+
+
+# Точний оптимум динамічним програмуванням по вазі з одним рядком таблиці: O(n·W) часу, O(W) пам'яті.
+# best[w] — найкраща цінність для ваги не більше w; рядок оновлюється векторно:
+# best[w] = max(best[w], best_old[w - weight] + value)
+def dp_optimum(items: List[Tuple[int, int]], max_weight: int) -> int:
+    _check_capacity(max_weight)
+    best: np.ndarray = np.zeros(max_weight + 1, dtype=np.int64)
+    for weight, value in items:
+        if weight > max_weight or value <= 0:
+            continue
+        candidate: np.ndarray = best[:max_weight + 1 - weight] + value
+        np.maximum(best[weight:], candidate, out=best[weight:])
+    return int(best[max_weight])
+
+
+# Точний розв'язок: той самий однорядковий DP, а для відновлення набору предметів зберігаються
+# лише упаковані біти рішень «предмет узято» — n·W/8 байт замість таблиці n·W цілих.
+# Повертає (розв'язок, цінність, вага) у форматі run()
+def dp_solve(items: List[Tuple[int, int]], max_weight: int) -> Tuple[List[int], int, int]:
+    _check_capacity(max_weight)
+    best: np.ndarray = np.zeros(max_weight + 1, dtype=np.int64)
+    decisions: np.ndarray = np.zeros((len(items), (max_weight + 8) // 8), dtype=np.uint8)
+    taken: np.ndarray = np.zeros(max_weight + 1, dtype=bool)
+    for i, (weight, value) in enumerate(items):
+        if weight > max_weight or value <= 0:
+            continue
+        candidate: np.ndarray = best[:max_weight + 1 - weight] + value
+        taken[:weight] = False
+        np.greater(candidate, best[weight:], out=taken[weight:])
+        np.maximum(best[weight:], candidate, out=best[weight:])
+        decisions[i] = np.packbits(taken)
+
+    solution: List[int] = [0] * len(items)
+    capacity: int = max_weight
+    for i in reversed(range(len(items))):
+        # packbits пакує біти від старшого: біт ваги w — це біт 7 - w % 8 байта w // 8
+        if (decisions[i, capacity >> 3] >> (7 - (capacity & 7))) & 1:
+            solution[i] = 1
+            capacity -= items[i][0]
+
+    total_weight: int = sum(weight for (weight, _), bit in zip(items, solution) if bit)
+    total_value: int = sum(value for (_, value), bit in zip(items, solution) if bit)
+    return solution, total_value, total_weight
+
+
+# Верхня межа LP-релаксації (межа Данціга): предмети за спаданням щільності беруться цілком,
+# доки вміщаються, а наступний — частково. O(n log n); оптимум не перевищує цієї межі
+def lp_bound(items: List[Tuple[int, int]], max_weight: int) -> float:
+    _check_capacity(max_weight)
+    table: np.ndarray = np.asarray(items, dtype=np.float64).reshape(-1, 2)
+    weights, values = table[:, 0], np.maximum(table[:, 1], 0.0)
+    density: np.ndarray = np.divide(values, weights, out=np.full(len(table), np.inf), where=weights > 0)
+    order: np.ndarray = np.argsort(-density, kind="stable")
+
+    cumulative: np.ndarray = np.cumsum(weights[order])
+    whole: int = int(np.searchsorted(cumulative, max_weight, side="right"))
+    bound: float = float(values[order[:whole]].sum())
+    if whole < len(order):
+        remaining: float = max_weight - (float(cumulative[whole - 1]) if whole else 0.0)
+        bound += float(values[order[whole]]) * remaining / float(weights[order[whole]])
+    return bound
+
+
+# Еталон за назвою: "dp" — точний оптимум, "lp" — верхня межа
+REFERENCE_SOLVERS: Dict[str, Callable[[List[Tuple[int, int]], int], float]] = {
+    "dp": dp_optimum,
+    "lp": lp_bound,
+}
+
+
+def reference_value(items: List[Tuple[int, int]], max_weight: int, method: str) -> float:
+    if method not in REFERENCE_SOLVERS:
+        raise ValueError(f"Невідомий еталонний розв'язувач: {method}. Доступні: {', '.join(REFERENCE_SOLVERS)}")
+    return REFERENCE_SOLVERS[method](items, max_weight)
+
+
+# Відносний розрив до еталону: 0 — оптимум; для межі LP — оцінка розриву зверху
+def optimality_gap(value: float, reference: float) -> float:
+    if reference <= 0:
+        return 0.0
+    return (reference - value) / reference
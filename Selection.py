@@ -0,0 +1,87 @@
+from typing import Callable, Dict
+
+import numpy as np
+
+# Пакетна селекція: усі батьки покоління обираються за один векторизований прохід над масивом фітнесу.
+# Кожна схема має однаковий контракт: (фітнес (..., P), кількість, rng) -> індекси особин (..., num).
+# Провідні осі (...) — незалежні популяції (острови), як у векторизованих ядрах
+SELECTION_SCHEMES = ("tournament", "truncation", "sus")
+TOURNAMENT_SIZE: int = 3
+# Частка найкращих особин, серед яких обирає усічена селекція
+TRUNCATION_FRACTION: float = 0.5
+
+
+def check_selection(scheme: str) -> None:
+    if scheme not in SELECTION_SCHEMES:
+        raise ValueError(f"Невідома схема селекції: {scheme}. Доступні: {', '.join(SELECTION_SCHEMES)}")
+
+
+# Турнірна селекція (кандидати з поверненням): усі турніри покоління — одна матриця (num, k) індексів
+def tournament_selection(
+    fitness: np.ndarray,
+    num: int,
+    rng: np.random.Generator,
+    k: int = TOURNAMENT_SIZE,
+) -> np.ndarray:
+    pop_size: int = fitness.shape[-1]
+    batch = fitness.shape[:-1]
+    candidates: np.ndarray = rng.integers(0, pop_size, size=batch + (num * k,))
+    candidate_fit: np.ndarray = np.take_along_axis(fitness, candidates, axis=-1)
+    candidates = candidates.reshape(batch + (num, k))
+    winners: np.ndarray = candidate_fit.reshape(batch + (num, k)).argmax(axis=-1)
+    return np.take_along_axis(candidates, winners[..., None], axis=-1)[..., 0]
+
+
+# Індекси elite найкращих особин (за спаданням фітнесу) без повного сортування
+def elite_indices(fitness: np.ndarray, elite: int) -> np.ndarray:
+    if elite <= 0:
+        return np.zeros(fitness.shape[:-1] + (0,), dtype=np.intp)
+    top: np.ndarray = np.argpartition(-fitness, elite - 1, axis=-1)[..., :elite]
+    order: np.ndarray = np.argsort(-np.take_along_axis(fitness, top, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(top, order, axis=-1)
+
+
+# Усічена селекція: рівноймовірно серед частки fraction найкращих (відбір найкращих — argpartition)
+def truncation_selection(
+    fitness: np.ndarray,
+    num: int,
+    rng: np.random.Generator,
+    fraction: float = TRUNCATION_FRACTION,
+) -> np.ndarray:
+    best: np.ndarray = elite_indices(fitness, max(1, int(np.ceil(fitness.shape[-1] * fraction))))
+    picks: np.ndarray = rng.integers(0, best.shape[-1], size=fitness.shape[:-1] + (num,))
+    return np.take_along_axis(best, picks, axis=-1)
+
+
+# Стохастична універсальна вибірка: num рівновіддалених вказівників з одним випадковим зсувом
+# на «колесі» фітнесу. Фітнес зсувається так, щоб найгірша особина мала нульову частку
+# (якщо всі рівні — вибір рівноймовірний); обрані індекси перемішуються, щоб пари не складались із сусідів.
+# Популяції з провідних осей обробляються одним searchsorted: кожне колесо нормується до [0, 1)
+# і зсувається на номер популяції, тож сумарна послідовність монотонна
+def sus_selection(fitness: np.ndarray, num: int, rng: np.random.Generator) -> np.ndarray:
+    pop_size: int = fitness.shape[-1]
+    flat: np.ndarray = fitness.reshape(-1, pop_size)
+    shares: np.ndarray = flat - flat.min(axis=-1, keepdims=True)
+    totals: np.ndarray = shares.sum(axis=-1, keepdims=True)
+    shares = np.where(totals > 0, shares, 1.0)
+    wheel: np.ndarray = np.cumsum(shares, axis=-1)
+    wheel /= wheel[:, -1:]
+    rows: np.ndarray = np.arange(len(flat))[:, None]
+
+    pointers: np.ndarray = (rng.random((len(flat), 1)) + np.arange(num)) / num
+    chosen: np.ndarray = np.searchsorted((wheel + rows).ravel(), (pointers + rows).ravel(), side="right")
+    chosen = np.minimum(chosen.reshape(len(flat), num) - rows * pop_size, pop_size - 1)
+    return rng.permuted(chosen, axis=-1).reshape(fitness.shape[:-1] + (num,))
+
+
+SELECTORS: Dict[str, Callable[[np.ndarray, int, np.random.Generator], np.ndarray]] = {
+    "tournament": tournament_selection,
+    "truncation": truncation_selection,
+    "sus": sus_selection,
+}
+
+
+# Батьківські пари для num нащадків: індекси форми (..., num, 2)
+def select_parents(fitness: np.ndarray, num: int, rng: np.random.Generator, scheme: str = "tournament") -> np.ndarray:
+    indices: np.ndarray = SELECTORS[scheme](fitness, 2 * num, rng)
+    return indices.reshape(fitness.shape[:-1] + (num, 2))
@@ -0,0 +1,63 @@
+import math
+import time
+from typing import Optional
+
+# Причини, за якими зупиняються всі острови/воркери, а не лише той, хто їх виявив
+GLOBAL_REASONS = ("target_fitness", "target_value", "time_limit")
+
+
+# Критерії ранньої зупинки, спільні для всіх рушіїв (None — критерій вимкнено).
+# target_value — цінність найкращої особини (напр., відомий оптимум або межа з ReferenceSolvers)
+class StopCriteria:
+    def __init__(
+        self,
+        stall_generations: Optional[int] = None,
+        target_fitness: Optional[float] = None,
+        time_limit: Optional[float] = None,
+        target_value: Optional[float] = None,
+    ):
+        self.stall_generations: Optional[int] = stall_generations
+        self.target_fitness: Optional[float] = target_fitness
+        self.time_limit: Optional[float] = time_limit
+        self.target_value: Optional[float] = target_value
+
+
+# Стан перевірки критеріїв протягом одного запуску.
+# stop_event (multiprocessing.Event) — міжпроцесний сигнал: острів, що досяг цілі чи вичерпав бюджет часу,
+# встановлює його, і решта островів зупиняються на наступному поколінні
+class StopMonitor:
+    def __init__(self, criteria: StopCriteria, stop_event=None):
+        self.criteria: StopCriteria = criteria
+        self.stop_event = stop_event
+        self.start_time: float = time.perf_counter()
+        self.best_fitness: float = -math.inf
+        self.stall: int = 0
+        self.generations: int = 0
+        self.reason: Optional[str] = None
+
+    # Викликається раз на покоління з найкращим фітнесом популяції (і цінністю цієї особини); True — час зупинятися
+    def update(self, best_fitness: float, best_value: Optional[float] = None) -> bool:
+        self.generations += 1
+        if best_fitness > self.best_fitness:
+            self.best_fitness = best_fitness
+            self.stall = 0
+        else:
+            self.stall += 1
+
+        criteria = self.criteria
+        if criteria.target_fitness is not None and self.best_fitness >= criteria.target_fitness:
+            self.reason = "target_fitness"
+        elif criteria.target_value is not None and best_value is not None and best_value >= criteria.target_value:
+            self.reason = "target_value"
+        elif criteria.stall_generations is not None and self.stall >= criteria.stall_generations:
+            self.reason = "stall"
+        elif criteria.time_limit is not None and time.perf_counter() - self.start_time >= criteria.time_limit:
+            self.reason = "time_limit"
+        elif self.stop_event is not None and self.stop_event.is_set():
+            self.reason = "stop_signal"
+        else:
+            return False
+
+        if self.stop_event is not None and self.reason in GLOBAL_REASONS:
+            self.stop_event.set()
+        return True
@@ -0,0 +1,449 @@
+import argparse
+import csv
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from Evaluators import KnapsackEvaluator
+from ReferenceSolvers import dp_optimum
+
+# Рушії: назва → (модуль, клас, чи приймає run() кількість потоків, додаткові аргументи run())
+ENGINES: Dict[str, Tuple[str, str, bool, Dict[str, Any]]] = {
+    "sequential": ("BackpackGA", "BackpackGA", False, {}),
+    "bitset": ("BackpackGABitset", "BackpackGABitset", False, {}),
+    "vectorized": ("BackpackGAVectorized", "BackpackGAVectorized", False, {}),
+    "master_slave": ("BackpackGAMasterSlave", "BackpackGAMasterSlave", True, {}),
+    "master_slave_async": ("BackpackGAMasterSlave", "BackpackGAMasterSlave", True, {"asynchronous": True}),
+    "master_slave_shared": ("BackpackGAMasterSlaveShared", "BackpackGAMasterSlaveShared", True, {}),
+    "island": ("BackpackGAIslandModel", "BackpackGAIslandModel", True, {}),
+    "thread_island": ("BackpackGAThreadIslandModel", "BackpackGAThreadIslandModel", True, {}),
+}
+
+
+# Один сценарій бенчмарку: рушій + параметри GA + seed екземпляра задачі.
+# options — додаткові аргументи конструктора GA (напр., repair, greedy_fraction);
+# target — частка оптимуму, для якої вимірюється кількість поколінь до її досягнення
+class Scenario:
+    def __init__(
+        self,
+        engine: str,
+        num_items: int,
+        population_size: int,
+        generations: int,
+        mutation_rate: float = 0.1,
+        num_threads: int = 1,
+        seed: int = 42,
+        capacity_ratio: float = 0.4,
+        options: Optional[Dict[str, Any]] = None,
+        target: Optional[float] = None,
+    ):
+        if engine not in ENGINES:
+            raise ValueError(f"Невідомий рушій: {engine}. Доступні: {', '.join(ENGINES)}")
+        self.engine: str = engine
+        self.num_items: int = num_items
+        self.population_size: int = population_size
+        self.generations: int = generations
+        self.mutation_rate: float = mutation_rate
+        self.num_threads: int = num_threads
+        self.seed: int = seed
+        self.capacity_ratio: float = capacity_ratio
+        self.options: Dict[str, Any] = dict(options or {})
+        self.target: Optional[float] = target
+
+    # Стабільний ідентифікатор для порівняння результатів між комітами
+    @property
+    def name(self) -> str:
+        return (
+            f"{self.engine}/n{self.num_items}/p{self.population_size}/g{self.generations}"
+            f"/t{self.num_threads}/s{self.seed}"
+            + "".join(f"/{key}={value}" for key, value in sorted(self.options.items()))
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "engine": self.engine,
+            "num_items": self.num_items,
+            "population_size": self.population_size,
+            "generations": self.generations,
+            "mutation_rate": self.mutation_rate,
+            "num_threads": self.num_threads,
+            "seed": self.seed,
+            "capacity_ratio": self.capacity_ratio,
+            "options": self.options,
+            "target": self.target,
+        }
+
+
+def _suite(
+    engines: List[str],
+    sizes: List[Tuple[int, int, int]],
+    num_threads: int,
+    variants: Tuple[Dict[str, Any], ...] = ({},),
+    target: Optional[float] = None,
+) -> List[Scenario]:
+    return [
+        Scenario(
+            engine, num_items, population_size, generations,
+            num_threads=num_threads if ENGINES[engine][2] else 1, options=options, target=target,
+        )
+        for num_items, population_size, generations in sizes
+        for engine in engines
+        for options in variants
+    ]
+
+
+# Набори сценаріїв: quick — для перевірки перед комітом, full — для порівняння рушіїв на масштабі
+SUITES = {
+    "quick": lambda num_threads: _suite(
+        ["sequential", "bitset", "master_slave", "island"],
+        [(100, 100, 50)],
+        num_threads,
+    ),
+    "full": lambda num_threads: _suite(
+        list(ENGINES),
+        [(100, 200, 200), (1000, 500, 100), (5000, 500, 50)],
+        num_threads,
+    ),
+    # Ремонт і жадібний засів проти базового GA: скільки поколінь потрібно до 99% оптимуму
+    "seeding": lambda num_threads: _suite(
+        ["sequential", "bitset", "vectorized"],
+        [(100, 100, 100), (1000, 200, 100)],
+        num_threads,
+        variants=({}, {"repair": True}, {"repair": True, "greedy_fraction": 0.1}),
+        target=0.99,
+    ),
+    # Схеми пакетної селекції: час покоління і швидкість збіжності до 99% оптимуму
+    "selection": lambda num_threads: _suite(
+        ["sequential", "vectorized", "master_slave"],
+        [(100, 200, 100), (1000, 500, 50)],
+        num_threads,
+        variants=({"selection": "tournament"}, {"selection": "truncation"}, {"selection": "sus"}),
+        target=0.99,
+    ),
+    # Функції штрафу оцінювача: вартість оцінки в усіх рушіях (перевантажені розв'язки тут допустимі як кращі,
+    # тож збіжність до оптимуму не вимірюється)
+    "penalty": lambda num_threads: _suite(
+        ["sequential", "bitset", "vectorized", "master_slave"],
+        [(100, 200, 100), (1000, 500, 50)],
+        num_threads,
+        variants=({"penalty": "death"}, {"penalty": "linear"}, {"penalty": "quadratic"}),
+    ),
+}
+
+
+# Екземпляр задачі, повністю визначений seed (ваги 1..20, цінності 5..100)
+def generate_items(num_items: int, seed: int, capacity_ratio: float = 0.4) -> Tuple[List[Tuple[int, int]], int]:
+    rng = random.Random(seed)
+    items = [(rng.randint(1, 20), rng.randint(5, 100)) for _ in range(num_items)]
+    max_weight = int(sum(weight for weight, _ in items) * capacity_ratio)
+    return items, max_weight
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss у Linux — у кілобайтах; враховуємо і дочірні процеси (воркери пулу, острови)
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return max(self_rss, children_rss) / scale
+
+
+def _make_ga(scenario: Scenario, run_seed: int):
+    module_name, class_name, _, _ = ENGINES[scenario.engine]
+    engine_class = getattr(importlib.import_module(module_name), class_name)
+    items, max_weight = generate_items(scenario.num_items, scenario.seed, scenario.capacity_ratio)
+    options: Dict[str, Any] = dict(scenario.options)
+    # Штраф задається назвою в options, а рушію передається оцінювач екземпляра
+    if "penalty" in options:
+        options["evaluator"] = KnapsackEvaluator(items, max_weight, options.pop("penalty"))
+    return engine_class(
+        items,
+        max_weight,
+        population_size=scenario.population_size,
+        generations=scenario.generations,
+        mutation_rate=scenario.mutation_rate,
+        verbose=False,
+        seed=run_seed,
+        **options,
+    )
+
+
+# Номер першого покоління, в якому найкраща цінність досягла target_value (None — не досягла).
+# Окремий невимірюваний прогін з тим самим seed: знімки run_iter() не впливають на час основного запуску
+def _generations_to_target(scenario: Scenario, run_seed: int, target_value: float) -> Optional[int]:
+    _, _, threaded, run_kwargs = ENGINES[scenario.engine]
+    ga = _make_ga(scenario, run_seed)
+    args = (scenario.num_threads,) if threaded else ()
+    reached = None
+    try:
+        for snapshot in ga.run_iter(*args, **run_kwargs):
+            if snapshot.best_value >= target_value:
+                reached = snapshot.generation
+                break
+    finally:
+        if hasattr(ga, "close"):
+            ga.close()
+    return reached
+
+
+def _run_once(scenario: Scenario, run_seed: int, target_value: Optional[float] = None) -> Tuple[float, Dict[str, Any]]:
+    _, _, threaded, run_kwargs = ENGINES[scenario.engine]
+    ga = _make_ga(scenario, run_seed)
+    args = (scenario.num_threads,) if threaded else ()
+    start = time.perf_counter()
+    _, value, weight = ga.run(*args, **run_kwargs)
+    elapsed = time.perf_counter() - start
+    if hasattr(ga, "close"):
+        ga.close()
+    result: Dict[str, Any] = {"value": value, "weight": weight, "generations_run": ga.generations_run}
+    if target_value is not None:
+        result["generations_to_target"] = _generations_to_target(scenario, run_seed, target_value)
+    return elapsed, result
+
+
+# Тіло окремого процесу: прогрів (не вимірюється), потім вимірюваний запуск.
+# Кожен запуск — у свіжому процесі, тож пікова пам'ять (RSS) належить саме йому
+def _measure(connection, scenario: Scenario, run_seed: int, warmup: int, target_value: Optional[float]) -> None:
+    try:
+        for i in range(warmup):
+            _run_once(scenario, run_seed + 7919 * (i + 1))
+        elapsed, result = _run_once(scenario, run_seed, target_value)
+        result["time"] = elapsed
+        result["peak_rss_mb"] = _peak_rss_mb()
+        connection.send(result)
+    except BaseException as error:
+        connection.send({"error": f"{type(error).__name__}: {error}"})
+        raise
+    finally:
+        connection.close()
+
+
+def measure_run(scenario: Scenario, run_seed: int, warmup: int = 1, target_value: Optional[float] = None) -> Dict[str, Any]:
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_measure, args=(sender, scenario, run_seed, warmup, target_value))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {"error": f"процес завершився з кодом {process.exitcode}"}
+    process.join()
+    if "error" in result:
+        raise RuntimeError(f"Сценарій {scenario.name} завершився помилкою: {result['error']}")
+    return result
+
+
+# Медіана, міжквартильний розмах і бутстреп-інтервал довіри для медіани
+def summarize(samples: List[float], confidence: float = 0.95, resamples: int = 2000, seed: int = 0) -> Dict[str, float]:
+    median = statistics.median(samples)
+    if len(samples) < 2:
+        return {"median": median, "q1": median, "q3": median, "iqr": 0.0, "ci_low": median, "ci_high": median}
+
+    q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    rng = random.Random(seed)
+    medians = sorted(statistics.median(rng.choices(samples, k=len(samples))) for _ in range(resamples))
+    tail = (1.0 - confidence) / 2
+    return {
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "ci_low": medians[int(tail * (resamples - 1))],
+        "ci_high": medians[int((1.0 - tail) * (resamples - 1))],
+    }
+
+
+def benchmark_scenario(
+    scenario: Scenario,
+    repeats: int = 5,
+    warmup: int = 1,
+    optimum: Optional[int] = None,
+) -> Dict[str, Any]:
+    target_value = scenario.target * optimum if scenario.target and optimum else None
+    runs = [measure_run(scenario, scenario.seed * 1000 + r, warmup, target_value) for r in range(repeats)]
+    times = [run["time"] for run in runs]
+    values = [run["value"] for run in runs]
+
+    summary: Dict[str, Any] = {
+        "scenario": scenario.name,
+        **scenario.to_dict(),
+        "repeats": repeats,
+        "warmup": warmup,
+        "time": summarize(times),
+        "value": summarize(values),
+        "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+        "generations_run": statistics.median(run["generations_run"] for run in runs),
+        "optimum": optimum,
+        "runs": runs,
+    }
+    if optimum:
+        summary["gap"] = summarize([(optimum - value) / optimum for value in values])
+    if target_value is not None:
+        # Прогони, що не досягли цілі, рахуються як нескінченні: медіана чесна, доки ціль досягла більшість
+        reached = [run["generations_to_target"] for run in runs if run["generations_to_target"] is not None]
+        median = statistics.median([run["generations_to_target"] or math.inf for run in runs])
+        summary["generations_to_target"] = None if math.isinf(median) else median
+        summary["target_reached"] = len(reached) / len(runs)
+    return summary
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    scenarios: List[Scenario],
+    repeats: int = 5,
+    warmup: int = 1,
+    reference: bool = True,
+) -> Dict[str, Any]:
+    optima: Dict[Tuple[int, int, float], int] = {}
+    results = []
+    for scenario in scenarios:
+        optimum = None
+        if reference:
+            instance = (scenario.num_items, scenario.seed, scenario.capacity_ratio)
+            if instance not in optima:
+                optima[instance] = dp_optimum(*generate_items(*instance))
+            optimum = optima[instance]
+
+        summary = benchmark_scenario(scenario, repeats, warmup, optimum)
+        results.append(summary)
+        gap = f", розрив = {summary['gap']['median']:.2%}" if "gap" in summary else ""
+        if "target_reached" in summary:
+            gap += (
+                f", поколінь до {scenario.target:.0%} оптимуму = {summary['generations_to_target']}"
+                f" (досягли {summary['target_reached']:.0%})"
+            )
+        print(
+            f"{scenario.name}: медіана {summary['time']['median']:.3f} с "
+            f"[{summary['time']['ci_low']:.3f}; {summary['time']['ci_high']:.3f}], "
+            f"IQR = {summary['time']['iqr']:.3f} с, RSS = {summary['peak_rss_mb']:.1f} МБ{gap}"
+        )
+
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+CSV_FIELDS = [
+    "scenario", "engine", "num_items", "population_size", "generations", "num_threads", "seed", "repeats",
+    "time_median", "time_iqr", "time_ci_low", "time_ci_high", "value_median", "gap_median", "peak_rss_mb",
+    "generations_run", "target", "generations_to_target", "target_reached",
+]
+
+
+def write_csv(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for result in report["results"]:
+            writer.writerow({
+                **{field: result[field] for field in CSV_FIELDS if field in result},
+                "time_median": result["time"]["median"],
+                "time_iqr": result["time"]["iqr"],
+                "time_ci_low": result["time"]["ci_low"],
+                "time_ci_high": result["time"]["ci_high"],
+                "value_median": result["value"]["median"],
+                "gap_median": result["gap"]["median"] if "gap" in result else "",
+            })
+
+
+# Порівняння двох звітів (напр., з різних комітів). Регресія часу — медіана зросла більше ніж на
+# time_threshold і інтервали довіри не перетинаються; регресія якості — медіанний розрив зріс більше ніж на gap_threshold
+def compare_reports(
+    baseline: Dict[str, Any],
+    candidate: Dict[str, Any],
+    time_threshold: float = 0.10,
+    gap_threshold: float = 0.01,
+) -> List[str]:
+    base_results = {result["scenario"]: result for result in baseline["results"]}
+    regressions = []
+    for result in candidate["results"]:
+        base = base_results.get(result["scenario"])
+        if base is None:
+            continue
+
+        old, new = base["time"], result["time"]
+        change = new["median"] / old["median"] - 1.0 if old["median"] > 0 else 0.0
+        slower = change > time_threshold and new["ci_low"] > old["ci_high"]
+        print(f"{result['scenario']}: {old['median']:.3f} с → {new['median']:.3f} с ({change:+.1%}){' РЕГРЕСІЯ' if slower else ''}")
+        if slower:
+            regressions.append(f"{result['scenario']}: час {change:+.1%}")
+
+        if "gap" in base and "gap" in result:
+            gap_change = result["gap"]["median"] - base["gap"]["median"]
+            if gap_change > gap_threshold:
+                regressions.append(f"{result['scenario']}: розрив до оптимуму {gap_change:+.2%}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Відтворюваний бенчмарк рушіїв GA")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="виконати набір сценаріїв")
+    run_parser.add_argument("--suite", choices=sorted(SUITES), default="quick")
+    run_parser.add_argument("--engines", nargs="*", choices=sorted(ENGINES), help="лише ці рушії")
+    run_parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--no-reference", action="store_true", help="не обчислювати точний оптимум")
+    run_parser.add_argument("--target", type=float, default=None, help="частка оптимуму для поколінь до цілі")
+    run_parser.add_argument("--json", default="benchmark_results.json")
+    run_parser.add_argument("--csv", default=None)
+
+    compare_parser = commands.add_parser("compare", help="порівняти два JSON-звіти")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("--time-threshold", type=float, default=0.10)
+    compare_parser.add_argument("--gap-threshold", type=float, default=0.01)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        scenarios = SUITES[args.suite](args.threads)
+        if args.engines:
+            scenarios = [scenario for scenario in scenarios if scenario.engine in args.engines]
+        if args.target is not None:
+            for scenario in scenarios:
+                scenario.target = args.target
+        report = run_benchmarks(scenarios, args.repeats, args.warmup, reference=not args.no_reference)
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=2)
+        if args.csv:
+            write_csv(report, args.csv)
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.candidate) as file:
+        candidate = json.load(file)
+    regressions = compare_reports(baseline, candidate, args.time_threshold, args.gap_threshold)
+    for regression in regressions:
+        print(f"РЕГРЕСІЯ: {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
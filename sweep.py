@@ -0,0 +1,234 @@
+import csv
+import multiprocessing
+import os
+import queue
+import time
+from typing import Dict, List, Optional, Tuple
+
+from BackpackGA import BackpackGA
+from BackpackGAIslandModel import BackpackGAIslandModel
+from BackpackGAMasterSlave import BackpackGAMasterSlave
+from RandomStreams import child_seed, seed_sequence
+from ReferenceSolvers import dp_optimum, optimality_gap
+from benchmark import generate_items
+
+# Схема comparison_results_avg.csv, яку читає visualizeBackpackGAresults.py
+RESULT_FIELDS = [
+    "Pop.Size", "Generations", "Threads", "Max Weight",
+    "Seq.Time (s)", "Island.Time (s)", "MS.Time (s)",
+    "Seq Value", "Island Value", "MS Value",
+    "Island Speedup", "MS Speedup", "Island Eff.", "MS Eff.",
+    "Optimum", "Seq Gap", "Island Gap", "MS Gap",
+]
+
+# Клітинка сітки: (розмір популяції, покоління, потоки). «Потоки» — це і кількість островів Island Model
+# (num_islands = num_threads, якщо популяції вистачає на острови щонайменше по 4 особини), і розмір пулу Master-Slave
+Cell = Tuple[int, int, int]
+
+
+def _timed_run(ga: BackpackGA, *args, **kwargs) -> Tuple[float, int]:
+    start = time.perf_counter()
+    _, value, _ = ga.run(*args, **kwargs)
+    return time.perf_counter() - start, value
+
+
+# Середній розрив до оптимуму (порожньо, якщо оптимум невідомий)
+def _mean_gap(values: List[int], optimum: Optional[int]):
+    if optimum is None:
+        return ""
+    return round(sum(optimality_gap(value, optimum) for value in values) / len(values), 4)
+
+
+# Одна клітинка сітки: num_runs прогонів трьох рушіїв, усереднені метрики в схемі RESULT_FIELDS.
+# optimum — точний оптимум екземпляра для середнього розриву кожного рушія.
+# Усі рушії вимірюються «холодними»: час прогону включає запуск процесів островів і пулу Master-Slave
+def run_cell(
+    cell: Cell,
+    items: List[Tuple[int, int]],
+    max_weight: int,
+    mutation_rate: float,
+    num_runs: int,
+    seed: int = 42,
+    optimum: Optional[int] = None,
+) -> Dict[str, float]:
+    population_size, generations, num_threads = cell
+    params = dict(population_size=population_size, generations=generations, mutation_rate=mutation_rate, verbose=False)
+    root = seed_sequence(seed)
+    seq_times, par_times, ms_times = [], [], []
+    val_seq_list, val_par_list, val_ms_list = [], [], []
+
+    for run in range(num_runs):
+        # Незалежний і відтворюваний seed для кожного прогону (однаковий для всіх рушіїв)
+        params["seed"] = child_seed(root, population_size, generations, num_threads, run)
+
+        elapsed, value = _timed_run(BackpackGA(items, max_weight, **params))
+        seq_times.append(elapsed)
+        val_seq_list.append(value)
+
+        elapsed, value = _timed_run(BackpackGAIslandModel(items, max_weight, **params), num_threads)
+        par_times.append(elapsed)
+        val_par_list.append(value)
+
+        elapsed, value = _timed_run(BackpackGAMasterSlave(items, max_weight, **params), num_threads)
+        ms_times.append(elapsed)
+        val_ms_list.append(value)
+
+    avg_seq_time = sum(seq_times) / num_runs
+    avg_par_time = sum(par_times) / num_runs
+    avg_ms_time = sum(ms_times) / num_runs
+
+    island_speedup = avg_seq_time / avg_par_time if avg_par_time > 0 else float('inf')
+    ms_speedup = avg_seq_time / avg_ms_time if avg_ms_time > 0 else float('inf')
+
+    return {
+        "Pop.Size": population_size,
+        "Generations": generations,
+        "Threads": num_threads,
+        "Max Weight": max_weight,
+        "Seq.Time (s)": round(avg_seq_time, 2),
+        "Island.Time (s)": round(avg_par_time, 2),
+        "MS.Time (s)": round(avg_ms_time, 2),
+        "Seq Value": round(sum(val_seq_list) / num_runs, 1),
+        "Island Value": round(sum(val_par_list) / num_runs, 1),
+        "MS Value": round(sum(val_ms_list) / num_runs, 1),
+        "Island Speedup": round(island_speedup, 2),
+        "MS Speedup": round(ms_speedup, 2),
+        "Island Eff.": round(island_speedup / num_threads, 2),
+        "MS Eff.": round(ms_speedup / num_threads, 2),
+        "Optimum": optimum if optimum is not None else "",
+        "Seq Gap": _mean_gap(val_seq_list, optimum),
+        "Island Gap": _mean_gap(val_par_list, optimum),
+        "MS Gap": _mean_gap(val_ms_list, optimum),
+    }
+
+
+def _cell_worker(result_queue: multiprocessing.Queue, cell: Cell, *args) -> None:
+    try:
+        result_queue.put((cell, run_cell(cell, *args), None))
+    except Exception as error:
+        result_queue.put((cell, None, f"{type(error).__name__}: {error}"))
+
+
+# Клітинки, вже записані у файл результатів (для відновлення перерваного прогону)
+def completed_cells(results_path: str) -> set:
+    if not os.path.exists(results_path):
+        return set()
+    with open(results_path, newline="") as file:
+        return {
+            (int(row["Pop.Size"]), int(row["Generations"]), int(row["Threads"]))
+            for row in csv.DictReader(file)
+        }
+
+
+# Рядок дописується за заголовком наявного файлу: файл, розпочатий старішою версією схеми, лишається узгодженим
+def _append_row(results_path: str, row: Dict[str, float]) -> None:
+    new_file = not os.path.exists(results_path) or os.path.getsize(results_path) == 0
+    fieldnames = RESULT_FIELDS
+    if not new_file:
+        with open(results_path, newline="") as file:
+            fieldnames = next(csv.reader(file))
+    with open(results_path, "a", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction="ignore")
+        if new_file:
+            writer.writeheader()
+        writer.writerow(row)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+# Бюджет ядер клітинки: острови й пул Master-Slave займають num_threads ядер, послідовний рушій — одне
+# (тож клітинка не дешевша за одне ядро). Завелика клітинка займає весь бюджет
+def _cell_cost(cell: Cell, max_cores: int) -> int:
+    return min(max(cell[2], 1), max_cores)
+
+
+# Паралельний прогін сітки. Кожна клітинка — окремий процес зі своїм бюджетом ядер (_cell_cost),
+# тож одночасно запущені клітинки не перевищують max_cores (типово — усі логічні ядра).
+# max_cores=1 виконує клітинки по одній: виміряні часи не спотворюються конкуренцією за ядра.
+# Аварія клітинки (напр., процес вбила ОС) не зупиняє прогін.
+# Готові клітинки одразу дописуються у results_path; повторний запуск пропускає вже записані
+def run_sweep(
+    population_sizes: List[int],
+    generations_list: List[int],
+    num_threads_list: List[int],
+    num_items: int = 100,
+    mutation_rate: float = 0.1,
+    num_runs: int = 4,
+    results_path: str = "comparison_results_avg.csv",
+    max_cores: Optional[int] = None,
+    seed: int = 42,
+) -> List[Dict[str, float]]:
+    max_cores = max_cores or os.cpu_count() or 1
+    items, max_weight = generate_items(num_items, seed)
+    optimum = dp_optimum(items, max_weight)
+
+    done = completed_cells(results_path)
+    pending: List[Cell] = [
+        (population_size, generations, num_threads)
+        for population_size in population_sizes
+        for generations in generations_list
+        for num_threads in num_threads_list
+        if (population_size, generations, num_threads) not in done
+    ]
+    if done:
+        print(f"Відновлення: пропущено {len(done)} вже записаних клітинок, залишилось {len(pending)}")
+
+    result_queue: multiprocessing.Queue = multiprocessing.Queue()
+    running: Dict[Cell, Tuple[multiprocessing.Process, int]] = {}
+    rows: List[Dict[str, float]] = []
+    failed: List[Cell] = []
+    used_cores = 0
+
+    try:
+        while pending or running:
+            # Запуск клітинок, що вміщаються у вільний бюджет; завелика клітинка стартує, коли решта завершилась
+            for cell in list(pending):
+                cost = _cell_cost(cell, max_cores)
+                if used_cores + cost > max_cores and running:
+                    continue
+                process = multiprocessing.Process(
+                    target=_cell_worker,
+                    args=(result_queue, cell, items, max_weight, mutation_rate, num_runs, seed, optimum),
+                )
+                process.start()
+                running[cell] = (process, cost)
+                used_cores += cost
+                pending.remove(cell)
+
+            try:
+                cell, row, error = result_queue.get(timeout=1.0)
+            except queue.Empty:
+                # Процес, що впав без результату (напр., вбитий ОС), звільняє свій бюджет
+                for cell, (process, cost) in list(running.items()):
+                    if not process.is_alive() and process.exitcode != 0:
+                        print(f"Клітинка {cell} аварійно завершилась (код {process.exitcode})")
+                        failed.append(cell)
+                        del running[cell]
+                        used_cores -= cost
+                continue
+
+            if cell not in running:
+                continue
+            process, cost = running.pop(cell)
+            process.join()
+            used_cores -= cost
+            if error is not None:
+                print(f"Клітинка {cell} завершилась помилкою: {error}")
+                failed.append(cell)
+                continue
+
+            _append_row(results_path, row)
+            rows.append(row)
+            print(
+                f"Done: Pop={row['Pop.Size']}, Gen={row['Generations']}, Threads={row['Threads']} "
+                f"(Avg over {num_runs} runs) → Seq={row['Seq.Time (s)']:.2f}s, "
+                f"Island={row['Island.Time (s)']:.2f}s, MS={row['MS.Time (s)']:.2f}s"
+            )
+    finally:
+        for process, _ in running.values():
+            process.terminate()
+            process.join()
+
+    if failed:
+        print(f"Не завершено клітинок: {len(failed)}; повторний запуск виконає лише їх")
+    return rows
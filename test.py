@@ -1,6 +1,7 @@
 import random
-from typing import List, Tuple, Type
+from typing import List, Optional, Tuple, Type
 from BackpackGA import BackpackGA
+from ReferenceSolvers import dp_optimum, optimality_gap
 
 
 def test_against_known_optimum(
@@ -19,8 +20,12 @@ def test_against_known_optimum(
         (6, 9)    # 7
     ],
     max_weight: int = 10,
-    expected_value: int = 18
+    expected_value: Optional[int] = None
 ) -> None:
+    # Оптимум, якщо не заданий, обчислюється точним DP (для предметів за замовчуванням — 18)
+    if expected_value is None:
+        expected_value = dp_optimum(items, max_weight)
+
     print("=" * 60)
     print("ТЕСТ НА ВІДОМОМУ ОПТИМУМІ".center(60))
     print("=" * 60)
@@ -56,7 +61,8 @@ def test_against_known_optimum(
         if value == expected_value:
             success_count += 1
 
-        print(f"Тест {i+1:>2}: {status:<7} | Цінність = {value:>2}, Вага = {weight:>2}, Розв'язок = {best_solution}")
+        gap = optimality_gap(value, expected_value)
+        print(f"Тест {i+1:>2}: {status:<7} | Цінність = {value:>2}, Вага = {weight:>2}, Розрив = {gap:.2%}, Розв'язок = {best_solution}")
 
     print("-" * 60)
     print(f"РЕЗУЛЬТАТ: {success_count} з {runs} тестів успішно ({(success_count / runs) * 100:.1f}%)")
@@ -73,3 +79,13 @@ items: List[Tuple[int, int]] = [
 
 # Запуск тесту
 test_against_known_optimum(algorithm_class=BackpackGA)
+
+# Той самий тест на більшому екземплярі: оптимум обчислює DP
+test_against_known_optimum(
+    algorithm_class=BackpackGA,
+    runs=3,
+    population_size=100,
+    generations=200,
+    items=items,
+    max_weight=int(sum(w for w, _ in items) * 0.4),
+)
@@ -0,0 +1,58 @@
+import random
+from typing import List
+
+import pytest
+
+from BackpackGA import BackpackGA
+from BackpackGAIslandModel import BackpackGAIslandModel
+from BatchSolver import BatchResult, BatchSolver, Instance
+from test_engines import make_instance
+
+# Перевірки BatchSolver: малі екземпляри розв'язуються пакетами, великі — окремим рушієм
+
+
+# Суміш екземплярів: num_items до 20 — пакетний шлях, від 40 — рушій (batch_items=30)
+def make_instances(count: int = 12, seed: int = 3) -> List[Instance]:
+    rng = random.Random(seed)
+    return [make_instance(rng.choice([10, 20, 40, 60]), seed=rng.randrange(1000)) for _ in range(count)]
+
+
+def make_solver(**kwargs) -> BatchSolver:
+    options = {"processes": 2, "batch_items": 30, "batch_size": 4, **kwargs}
+    return BatchSolver(population_size=30, generations=10, mutation_rate=0.05, **options)
+
+
+def assert_feasible(result: BatchResult, instance: Instance) -> None:
+    items, max_weight = instance
+    assert len(result.solution) == len(items)
+    assert result.weight == sum(w for (w, _), bit in zip(items, result.solution) if bit) <= max_weight
+    assert result.value == sum(v for (_, v), bit in zip(items, result.solution) if bit)
+
+
+@pytest.mark.parametrize("engine", [None, BackpackGA])
+def test_batched_and_single_results_are_feasible(engine):
+    instances = make_instances()
+    options = {"engine": engine} if engine is not None else {}
+    with make_solver(seed=1, **options) as solver:
+        results = solver.solve_all(instances)
+
+    assert [result.index for result in results] == list(range(len(instances)))
+    assert {result.batch_size for result in results} > {1}
+    for result, instance in zip(results, instances):
+        assert_feasible(result, instance)
+
+
+def test_seeded_solve_all_is_reproducible():
+    instances = make_instances()
+    with make_solver(seed=5) as solver:
+        first = [(r.solution, r.value, r.weight) for r in solver.solve_all(instances)]
+        again = [(r.solution, r.value, r.weight) for r in solver.solve_all(instances)]
+    with make_solver(seed=5, processes=1) as other:
+        # Результат не залежить від кількості процесів пулу й порядку готовності завдань
+        fresh = [(r.solution, r.value, r.weight) for r in other.solve_all(instances)]
+    assert first == again == fresh
+
+
+def test_parallel_engines_are_rejected():
+    with pytest.raises(ValueError):
+        make_solver(engine=BackpackGAIslandModel)
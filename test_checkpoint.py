@@ -0,0 +1,37 @@
+import os
+
+import numpy as np
+import pytest
+
+from BackpackGAMasterSlaveShared import BackpackGAMasterSlaveShared
+from Checkpoint import read_checkpoint
+from test_engines import ENGINE_IDS, ENGINES, make_ga, run
+
+# Перевірки контрольних точок: продовження з точки після переривання дає той самий запуск, що й без перерви
+
+
+@pytest.mark.parametrize("engine, args", ENGINES, ids=ENGINE_IDS)
+def test_checkpoint_resume_is_exact(engine, args, tmp_path):
+    path = os.path.join(tmp_path, "run.ckpt")
+    expected_path = os.path.join(tmp_path, "expected.ckpt")
+    expected = run(make_ga(engine, generations=200, seed=5, checkpoint_path=expected_path, checkpoint_interval=5), args)
+
+    # Запуск переривається після 12 поколінь (острови можуть встигнути більше); контрольна точка
+    # записується кожні 5 — острови синхронізуються міграцією на 11-му поколінні, тож точка 10 вже повна
+    ga = make_ga(engine, generations=200, seed=5, checkpoint_path=path, checkpoint_interval=5)
+    stream = ga.run_iter(*args)
+    for snapshot in stream:
+        if snapshot.generation >= 12:
+            break
+    stream.close()
+    if isinstance(ga, BackpackGAMasterSlaveShared):
+        ga.close()
+
+    resumed = make_ga(engine, generations=200, seed=5, checkpoint_path=path, checkpoint_interval=5)
+    assert run(resumed.resume(path), args) == expected
+
+    # Підсумкові популяції всіх островів збігаються побітово, а не лише найкращий розв'язок
+    final, expected_final = read_checkpoint(path), read_checkpoint(expected_path)
+    assert final.generation == expected_final.generation
+    for bits, expected_bits in zip(final.populations, expected_final.populations, strict=True):
+        np.testing.assert_array_equal(bits, expected_bits)
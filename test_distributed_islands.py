@@ -0,0 +1,34 @@
+import asyncio
+
+from BackpackGA import BackpackGA
+from DistributedIslands import IslandClient, MigrationBroker, run_local
+from test_engines import ITEMS, MAX_WEIGHT, make_ga
+
+# Перевірки розподіленої моделі островів на localhost: міграції через брокер і острів, що не підключився
+
+
+def test_run_local_routes_migrants():
+    ga = make_ga(BackpackGA, generations=100, seed=1)
+    solution, value, weight = run_local(ga, 3, migration_interval=5, join_timeout=10.0)
+
+    assert len(solution) == len(ITEMS)
+    assert weight == sum(w for (w, _), bit in zip(ITEMS, solution) if bit) <= MAX_WEIGHT
+    assert value == sum(v for (_, v), bit in zip(ITEMS, solution) if bit) > 0
+    assert ga.migration_stats["messages_routed"] > 0
+    assert ga.migration_stats["missing_islands"] == [] and ga.migration_stats["lost_islands"] == []
+
+
+def test_island_that_never_joins_is_missing():
+    async def scenario() -> MigrationBroker:
+        broker = MigrationBroker(2, join_timeout=1.0, heartbeat_timeout=2.0)
+        host, port = await broker.start()
+        # Острів 1 так і не підключається: брокер не чекає на нього довше за join_timeout
+        client = IslandClient(make_ga(BackpackGA, generations=10, seed=1), 0, host, port, migration_interval=2)
+        await client.run()
+        await asyncio.wait_for(broker.wait(), timeout=10.0)
+        return broker
+
+    broker = asyncio.run(scenario())
+    assert sorted(broker.results) == [0]
+    assert broker.missing == [1]
+    assert broker.best()[2] <= MAX_WEIGHT
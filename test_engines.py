@@ -0,0 +1,82 @@
+import random
+from typing import List, Tuple, Type
+
+import numpy as np
+import pytest
+
+from BackpackGA import BackpackGA
+from BackpackGABitset import BackpackGABitset, BackpackGAIslandModelBitset, BackpackGAMasterSlaveBitset
+from BackpackGAIslandModel import BackpackGAIslandModel
+from BackpackGAMasterSlave import BackpackGAMasterSlave
+from BackpackGAMasterSlaveShared import BackpackGAMasterSlaveShared
+from BackpackGAThreadIslandModel import BackpackGAThreadIslandModel
+from BackpackGAVectorized import BackpackGAVectorized
+from Evaluators import MultiKnapsackEvaluator
+from ReferenceSolvers import dp_optimum
+
+# Перевірки рушіїв на малому екземплярі: результат допустимий і не перевищує точного оптимуму.
+# Спільні для інших модулів тестів: екземпляр ITEMS / MAX_WEIGHT, перелік рушіїв ENGINES, make_ga і run
+
+NUM_WORKERS: int = 2
+
+# Рушій і аргументи його run() / run_iter()
+ENGINES: List[Tuple[Type[BackpackGA], tuple]] = [
+    (BackpackGA, ()),
+    (BackpackGABitset, ()),
+    (BackpackGAVectorized, ()),
+    (BackpackGAMasterSlave, (NUM_WORKERS,)),
+    (BackpackGAMasterSlaveBitset, (NUM_WORKERS,)),
+    (BackpackGAMasterSlaveShared, (NUM_WORKERS,)),
+    (BackpackGAIslandModel, (NUM_WORKERS,)),
+    (BackpackGAIslandModelBitset, (NUM_WORKERS,)),
+    (BackpackGAThreadIslandModel, (NUM_WORKERS,)),
+]
+
+ENGINE_IDS: List[str] = [engine.__name__ for engine, _ in ENGINES]
+
+
+def make_instance(num_items: int = 25, seed: int = 7) -> Tuple[List[Tuple[int, int]], int]:
+    rng = random.Random(seed)
+    items = [(rng.randint(1, 20), rng.randint(5, 100)) for _ in range(num_items)]
+    return items, sum(w for w, _ in items) * 2 // 5
+
+
+ITEMS, MAX_WEIGHT = make_instance()
+
+
+def make_ga(engine: Type[BackpackGA], generations: int = 15, **kwargs) -> BackpackGA:
+    return engine(ITEMS, MAX_WEIGHT, population_size=40, generations=generations, mutation_rate=0.05, **kwargs)
+
+
+def run(ga: BackpackGA, args: tuple) -> Tuple[List[int], int, int]:
+    try:
+        return ga.run(*args)
+    finally:
+        if isinstance(ga, BackpackGAMasterSlaveShared):
+            ga.close()
+
+
+# Оцінювач, що падає після fail_after викликів (у кожному процесі — власний лічильник)
+class FailingEvaluator(MultiKnapsackEvaluator):
+    def __init__(self, items, max_weight, fail_after: int):
+        super().__init__(items, max_weight, [[0]] * len(items), [1])
+        self.fail_after: int = fail_after
+        self.calls: int = 0
+
+    def evaluate_totals(self, population: np.ndarray, weight: np.ndarray, value: np.ndarray) -> np.ndarray:
+        self.calls += 1
+        if self.calls > self.fail_after:
+            raise RuntimeError("збій оцінювача")
+        return super().evaluate_totals(population, weight, value)
+
+
+@pytest.mark.parametrize("engine, args", ENGINES, ids=ENGINE_IDS)
+def test_result_is_feasible_and_bounded_by_optimum(engine, args):
+    solution, value, weight = run(make_ga(engine, seed=1), args)
+
+    assert len(solution) == len(ITEMS)
+    assert set(solution) <= {0, 1}
+    assert weight == sum(w for (w, _), bit in zip(ITEMS, solution) if bit)
+    assert value == sum(v for (_, v), bit in zip(ITEMS, solution) if bit)
+    assert weight <= MAX_WEIGHT
+    assert 0 < value <= dp_optimum(ITEMS, MAX_WEIGHT)
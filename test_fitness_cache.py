@@ -0,0 +1,53 @@
+import pytest
+
+from BackpackGA import BackpackGA
+from BackpackGABitset import BackpackGABitset, BackpackGAIslandModelBitset, BackpackGAMasterSlaveBitset
+from BackpackGAIslandModel import BackpackGAIslandModel
+from BackpackGAMasterSlave import BackpackGAMasterSlave
+from BackpackGAVectorized import BackpackGAVectorized
+from FitnessCache import FitnessCache, genome_key, merge_stats
+from test_engines import NUM_WORKERS, make_ga, run
+
+# Перевірки кешу фітнесу: LRU-витіснення, статистика рушіїв, що оцінюють геноми поштучно
+
+
+def test_lru_eviction():
+    cache = FitnessCache(2)
+    first, second, third = (genome_key(bytes([i])) for i in range(3))
+    cache.put(first, (1.0, 1, 1))
+    cache.put(second, (2.0, 2, 2))
+    assert cache.get(first) == (1.0, 1, 1)
+    cache.put(third, (3.0, 3, 3))
+
+    # Витіснено давно не використаний second, а не first
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2}
+
+
+def test_merge_stats_sums_processes():
+    merged = merge_stats({"hits": 1, "misses": 2, "evictions": 0, "size": 3}, {"hits": 4, "misses": 1}, {})
+    assert merged == {"hits": 5, "misses": 3, "evictions": 0, "size": 3}
+
+
+@pytest.mark.parametrize(
+    "engine, args",
+    [
+        (BackpackGABitset, ()),
+        (BackpackGAMasterSlaveBitset, (NUM_WORKERS,)),
+        (BackpackGAIslandModelBitset, (NUM_WORKERS,)),
+    ],
+)
+def test_bitset_engines_report_cache_stats(engine, args):
+    ga = make_ga(engine, generations=30, seed=1, cache_size=1000)
+    run(ga, args)
+    assert ga.cache_stats["hits"] > 0
+    assert ga.cache_stats["misses"] > 0
+    # Розмір — сума кешів усіх процесів (master, воркери або острови)
+    assert 0 < ga.cache_stats["size"] <= 1000 * (1 + sum(args))
+
+
+@pytest.mark.parametrize("engine", [BackpackGA, BackpackGAMasterSlave, BackpackGAIslandModel, BackpackGAVectorized])
+def test_cache_is_rejected_for_list_engines(engine):
+    with pytest.raises(ValueError):
+        make_ga(engine, cache_size=100)
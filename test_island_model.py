@@ -0,0 +1,66 @@
+import os
+import signal
+
+import numpy as np
+import pytest
+
+from BackpackGABitset import BackpackGAIslandModelBitset
+from BackpackGAIslandModel import BackpackGAIslandModel
+from IslandExecutor import IslandExecutor
+from test_engines import ITEMS, MAX_WEIGHT, FailingEvaluator, make_ga
+
+# Перевірки процесної моделі островів: помилки й аварійне завершення островів, виконавець IslandExecutor
+
+PROCESS_ISLANDS = [BackpackGAIslandModel, BackpackGAIslandModelBitset]
+
+
+# Оцінювач, процес якого гине (SIGKILL, як від OOM killer) після kill_after викликів
+class KillingEvaluator(FailingEvaluator):
+    def evaluate_totals(self, population: np.ndarray, weight: np.ndarray, value: np.ndarray) -> np.ndarray:
+        self.calls += 1
+        if self.calls > self.fail_after:
+            os.kill(os.getpid(), signal.SIGKILL)
+        return super(FailingEvaluator, self).evaluate_totals(population, weight, value)
+
+
+@pytest.mark.parametrize("engine", PROCESS_ISLANDS)
+@pytest.mark.parametrize("seed", [None, 4])
+def test_island_failure_raises(engine, seed):
+    ga = make_ga(engine, generations=50, seed=seed, evaluator=FailingEvaluator(ITEMS, MAX_WEIGHT, fail_after=10))
+    with pytest.raises(RuntimeError, match="збій оцінювача"):
+        ga.run(4)
+
+
+@pytest.mark.parametrize("engine", PROCESS_ISLANDS)
+@pytest.mark.parametrize("seed", [None, 4])
+@pytest.mark.parametrize("stream", [False, True])
+def test_dead_island_raises(engine, seed, stream):
+    ga = make_ga(engine, generations=50, seed=seed, evaluator=KillingEvaluator(ITEMS, MAX_WEIGHT, fail_after=10))
+    with pytest.raises(RuntimeError, match="аварійно завершився"):
+        if stream:
+            list(ga.run_iter(4))
+        else:
+            ga.run(4)
+
+
+def test_dead_island_closes_executor():
+    ga = make_ga(BackpackGAIslandModel, generations=50, seed=4, evaluator=KillingEvaluator(ITEMS, MAX_WEIGHT, fail_after=10))
+    with IslandExecutor(4) as executor:
+        with pytest.raises(RuntimeError, match="аварійно завершився"):
+            ga.run(4, executor=executor)
+        assert not executor.running
+
+        # Перезапущений виконавець знову придатний до запусків
+        executor.start()
+        assert make_ga(BackpackGAIslandModel, seed=4).run(4, executor=executor)[2] <= MAX_WEIGHT
+
+
+@pytest.mark.parametrize("engine", PROCESS_ISLANDS)
+def test_executor_matches_plain_run(engine):
+    expected = make_ga(engine, seed=4).run(4)
+    expected_three = make_ga(engine, seed=4).run(3)
+    with IslandExecutor(4) as executor:
+        # Повторне використання тих самих процесів не змінює результат; запуск може мати менше островів
+        assert make_ga(engine, seed=4).run(4, executor=executor) == expected
+        assert make_ga(engine, seed=4).run(4, executor=executor) == expected
+        assert make_ga(engine, seed=4).run(3, executor=executor) == expected_three
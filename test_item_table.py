@@ -0,0 +1,71 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from BackpackGAVectorized import BackpackGAVectorized
+from ItemTable import ItemTable, load_items, write_items
+from test_engines import ITEMS, MAX_WEIGHT
+
+# Перевірки бінарної таблиці предметів: запис і відображення, конвертація CSV
+
+
+def test_binary_round_trip(tmp_path):
+    path = os.path.join(tmp_path, "instance.items")
+    write_items(path, ITEMS, MAX_WEIGHT)
+
+    table = load_items(path)
+    assert list(table) == ITEMS
+    assert len(table) == len(ITEMS) and table[3] == ITEMS[3]
+    assert table.max_weight == MAX_WEIGHT
+    np.testing.assert_array_equal(table.matrix, np.asarray(ITEMS, dtype=np.float64))
+    # Серіалізується шляхом: воркер відображає той самий файл
+    assert list(pickle.loads(pickle.dumps(table))) == ITEMS
+
+
+def test_empty_table(tmp_path):
+    table = write_items(os.path.join(tmp_path, "empty.items"), [])
+    assert len(table) == 0 and table.max_weight is None
+
+
+def test_csv_with_swapped_header(tmp_path):
+    csv_path = os.path.join(tmp_path, "instance.csv")
+    with open(csv_path, "w") as file:
+        file.write("# екземпляр для перевірки\nvalue,weight\n")
+        file.writelines(f"{value},{weight}\n" for weight, value in ITEMS)
+
+    table = load_items(csv_path, MAX_WEIGHT)
+    assert list(table) == ITEMS
+    assert table.path == os.path.abspath(os.path.join(tmp_path, "instance.items"))
+    # Повторне завантаження відображає вже сконвертований файл
+    assert list(load_items(csv_path, MAX_WEIGHT)) == ITEMS
+
+
+def test_csv_without_header(tmp_path):
+    csv_path = os.path.join(tmp_path, "plain.csv")
+    with open(csv_path, "w") as file:
+        file.writelines(f"{weight},{value}\n" for weight, value in ITEMS)
+    assert list(load_items(csv_path)) == ITEMS
+
+
+def test_malformed_csv_row_raises(tmp_path):
+    csv_path = os.path.join(tmp_path, "broken.csv")
+    with open(csv_path, "w") as file:
+        file.write("weight,value\n1,2\nтри,4\n")
+    with pytest.raises(ValueError):
+        load_items(csv_path)
+
+
+def test_not_an_item_table(tmp_path):
+    path = os.path.join(tmp_path, "other.items")
+    with open(path, "wb") as file:
+        file.write(b"x" * 64)
+    with pytest.raises(ValueError):
+        ItemTable(path)
+
+
+def test_engine_solves_from_table(tmp_path):
+    table = write_items(os.path.join(tmp_path, "instance.items"), ITEMS, MAX_WEIGHT)
+    solution, value, weight = BackpackGAVectorized(table, MAX_WEIGHT, 40, 15, 0.05, seed=1).run()
+    assert weight == sum(w for (w, _), bit in zip(ITEMS, solution) if bit) <= MAX_WEIGHT
@@ -0,0 +1,21 @@
+from BackpackGAMasterSlaveShared import BackpackGAMasterSlaveShared
+from Evaluators import KnapsackEvaluator
+from test_engines import ITEMS, MAX_WEIGHT, NUM_WORKERS
+
+# Перевірки постійного пулу Master-Slave: параметри, змінені між run(), діють у воркерах
+
+
+def make_shared(mutation_rate: float) -> BackpackGAMasterSlaveShared:
+    return BackpackGAMasterSlaveShared(ITEMS, MAX_WEIGHT, population_size=40, generations=15, mutation_rate=mutation_rate, seed=1)
+
+
+def test_reused_pool_sees_changed_parameters():
+    with make_shared(0.0) as ga:
+        ga.run(NUM_WORKERS)
+        ga.mutation_rate = 0.5
+        ga.evaluator = KnapsackEvaluator(ITEMS, MAX_WEIGHT, penalty="linear")
+        changed = ga.run(NUM_WORKERS)
+
+    with make_shared(0.5) as fresh:
+        fresh.evaluator = KnapsackEvaluator(ITEMS, MAX_WEIGHT, penalty="linear")
+        assert changed == fresh.run(NUM_WORKERS)
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from BackpackGA import Individual
+from MigrationTopology import (
+    TOPOLOGIES,
+    check_migration_config,
+    max_in_degree,
+    migration_targets,
+    replace_with_migrants,
+    select_emigrants,
+    torus_shape,
+)
+
+# Перевірки топологій міграції: цілі без самого острова й дублікатів, вхідні степені, політики мігрантів
+
+
+def in_degrees(topology: str, num_islands: int):
+    degrees = [0] * num_islands
+    for island_id in range(num_islands):
+        for target in migration_targets(topology, island_id, num_islands, random.Random(island_id)):
+            degrees[target] += 1
+    return degrees
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+@pytest.mark.parametrize("num_islands", [1, 2, 3, 4, 6, 9])
+def test_targets_have_no_self_or_duplicates(topology, num_islands):
+    rng = random.Random(0)
+    for island_id in range(num_islands):
+        for _ in range(5):
+            targets = migration_targets(topology, island_id, num_islands, rng)
+            assert island_id not in targets
+            assert len(targets) == len(set(targets))
+            assert all(0 <= target < num_islands for target in targets)
+
+
+@pytest.mark.parametrize(
+    "topology, num_islands, expected",
+    [
+        ("ring", 5, 1),
+        ("bidirectional_ring", 5, 2),
+        ("bidirectional_ring", 2, 1),
+        ("torus", 9, 4),
+        ("torus", 4, 2),
+        ("fully_connected", 5, 4),
+        ("star", 5, 4),
+    ],
+)
+def test_in_degree(topology, num_islands, expected):
+    assert max_in_degree(topology, num_islands) == expected
+    assert max(in_degrees(topology, num_islands)) == expected
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+@pytest.mark.parametrize("num_islands", [2, 4, 7])
+def test_in_degree_bounds_actual_senders(topology, num_islands):
+    # Скринька острова розрахована на max_in_degree відправників за міграцію (random — на найгірший випадок)
+    assert max(in_degrees(topology, num_islands)) <= max_in_degree(topology, num_islands)
+    assert max_in_degree(topology, 1) == 0
+
+
+def test_ring_and_star_structure():
+    assert [migration_targets("ring", i, 4) for i in range(4)] == [[1], [2], [3], [0]]
+    assert migration_targets("star", 0, 4) == [1, 2, 3]
+    assert migration_targets("star", 2, 4) == [0]
+    assert torus_shape(12) == (3, 4) and torus_shape(7) == (1, 7)
+
+
+def make_population(fitness):
+    return [Individual([0], f, 0, 0) for f in fitness]
+
+
+def test_best_emigrants_and_worst_replacement():
+    population = make_population([5.0, 1.0, 9.0, 3.0])
+    emigrants = select_emigrants(population, 2, "best")
+    assert [ind.fitness for ind in emigrants] == [9.0, 5.0]
+
+    # Найкращий мігрант заміщує найгіршу особину; наступний (2.0) не кращий за 3.0 — заміщення зупиняється
+    replaced = replace_with_migrants(population, make_population([4.0, 2.0, 0.5]), "worst")
+    assert replaced == 1
+    assert sorted(ind.fitness for ind in population) == [3.0, 4.0, 5.0, 9.0]
+
+
+def test_random_policies_keep_population_size():
+    rng = random.Random(1)
+    population = make_population(range(10))
+    assert len(select_emigrants(population, 20, "random", rng)) == 10
+    assert replace_with_migrants(population, make_population([100.0] * 3), "random", rng) == 3
+    assert len(population) == 10
+
+
+def test_unknown_config_is_rejected():
+    with pytest.raises(ValueError):
+        check_migration_config("hypercube", "best", "worst")
+    with pytest.raises(ValueError):
+        check_migration_config("ring", "oldest", "worst")
+    with pytest.raises(ValueError):
+        check_migration_config("ring", "best", "oldest")
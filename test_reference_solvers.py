@@ -0,0 +1,53 @@
+import itertools
+import random
+from typing import List, Tuple
+
+import pytest
+
+from ReferenceSolvers import dp_optimum, dp_solve, lp_bound, optimality_gap, reference_value
+
+# Перевірки еталонних розв'язувачів на малих екземплярах проти повного перебору
+
+
+def brute_force(items: List[Tuple[int, int]], max_weight: int) -> int:
+    best = 0
+    for bits in itertools.product((0, 1), repeat=len(items)):
+        weight = sum(w for (w, _), bit in zip(items, bits) if bit)
+        if weight <= max_weight:
+            best = max(best, sum(v for (_, v), bit in zip(items, bits) if bit))
+    return best
+
+
+def small_instance(seed: int) -> Tuple[List[Tuple[int, int]], int]:
+    rng = random.Random(seed)
+    items = [(rng.randint(1, 20), rng.randint(5, 100)) for _ in range(rng.randint(1, 12))]
+    return items, rng.randint(0, sum(w for w, _ in items))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_dp_matches_brute_force(seed):
+    items, max_weight = small_instance(seed)
+    optimum = brute_force(items, max_weight)
+
+    solution, value, weight = dp_solve(items, max_weight)
+    assert value == dp_optimum(items, max_weight) == optimum
+    assert weight == sum(w for (w, _), bit in zip(items, solution) if bit) <= max_weight
+    assert value == sum(v for (_, v), bit in zip(items, solution) if bit)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_lp_bound_is_not_below_optimum(seed):
+    items, max_weight = small_instance(seed)
+    assert lp_bound(items, max_weight) >= dp_optimum(items, max_weight)
+
+
+def test_gap_is_zero_at_optimum():
+    items, max_weight = small_instance(0)
+    optimum = reference_value(items, max_weight, "dp")
+    assert optimality_gap(dp_solve(items, max_weight)[1], optimum) == 0
+    assert optimality_gap(optimum / 2, optimum) == pytest.approx(0.5)
+
+
+def test_negative_capacity_is_rejected():
+    with pytest.raises(ValueError):
+        dp_optimum([(1, 1)], -1)
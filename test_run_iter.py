@@ -0,0 +1,22 @@
+import pytest
+
+from test_engines import ENGINE_IDS, ENGINES, ITEMS, MAX_WEIGHT, make_ga, run
+
+# Перевірки потоку поколінь run_iter: дострокове переривання на кожному рушії
+
+
+@pytest.mark.parametrize("engine, args", ENGINES, ids=ENGINE_IDS)
+def test_run_iter_can_be_interrupted(engine, args):
+    ga = make_ga(engine, generations=1000, seed=2)
+    stream = ga.run_iter(*args)
+    snapshots = [snapshot for _, snapshot in zip(range(3), stream)]
+    stream.close()
+
+    assert len(snapshots) == 3
+    assert ga.generations_run < ga.generations
+    solution, value, weight = ga.result
+    assert len(solution) == len(ITEMS) and weight <= MAX_WEIGHT
+
+    # Після переривання рушій придатний до нового запуску
+    ga.generations = 5
+    assert run(ga, args)[2] <= MAX_WEIGHT
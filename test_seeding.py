@@ -0,0 +1,16 @@
+import pytest
+
+from test_engines import ENGINE_IDS, ENGINES, make_ga, run
+
+# Перевірки відтворюваності: однаковий seed дає однаковий результат на кожному рушії
+
+
+@pytest.mark.parametrize("engine, args", ENGINES, ids=ENGINE_IDS)
+def test_seeded_rerun_is_deterministic(engine, args):
+    first = run(make_ga(engine, seed=3), args)
+    second = run(make_ga(engine, seed=3), args)
+    assert first == second
+
+    # Повторний run() того самого об'єкта починається з тих самих потоків випадкових чисел
+    ga = make_ga(engine, seed=3)
+    assert run(ga, args) == run(ga, args) == first
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from Selection import (
+    SELECTION_SCHEMES,
+    SELECTORS,
+    check_selection,
+    elite_indices,
+    select_parents,
+    sus_selection,
+    truncation_selection,
+)
+
+# Перевірки пакетної селекції: форма результату, рівноймовірність SUS, межі усіченої селекції
+
+
+@pytest.mark.parametrize("scheme", SELECTION_SCHEMES)
+@pytest.mark.parametrize("batch", [(), (3,), (2, 3)])
+def test_output_shape_and_range(scheme, batch):
+    rng = np.random.default_rng(0)
+    fitness = rng.random(batch + (20,))
+
+    indices = SELECTORS[scheme](fitness, 7, rng)
+    assert indices.shape == batch + (7,)
+    assert indices.min() >= 0 and indices.max() < 20
+
+    pairs = select_parents(fitness, 5, rng, scheme)
+    assert pairs.shape == batch + (5, 2)
+
+
+def test_sus_with_equal_fitness_is_uniform():
+    rng = np.random.default_rng(1)
+    # num кратне розміру популяції: рівновіддалені вказівники влучають у кожну особину однаково часто
+    counts = np.bincount(sus_selection(np.full(10, 3.0), 40, rng), minlength=10)
+    assert counts.tolist() == [4] * 10
+
+    # Незалежні популяції провідної осі обробляються кожна окремо
+    batched = sus_selection(np.full((3, 10), 3.0), 20, rng)
+    for row in batched:
+        assert np.bincount(row, minlength=10).tolist() == [2] * 10
+
+
+def test_sus_prefers_fitter_individuals():
+    rng = np.random.default_rng(2)
+    fitness = np.array([0.0, 1.0, 3.0])
+    counts = np.bincount(sus_selection(fitness, 400, rng), minlength=3)
+    # Найгірша особина має нульову частку; решта — пропорційно зсунутому фітнесу
+    assert counts.tolist() == [0, 100, 300]
+
+
+def test_truncation_picks_only_from_top_fraction():
+    rng = np.random.default_rng(3)
+    fitness = rng.permutation(40).astype(np.float64)
+    picks = truncation_selection(fitness, 1000, rng, fraction=0.25)
+    assert set(fitness[picks]) == set(range(30, 40))
+
+
+def test_elite_indices_are_sorted_best_first():
+    fitness = np.array([5.0, 1.0, 9.0, 7.0, 3.0])
+    assert elite_indices(fitness, 3).tolist() == [2, 3, 0]
+    assert elite_indices(fitness, 0).shape == (0,)
+
+
+def test_unknown_scheme_is_rejected():
+    with pytest.raises(ValueError):
+        check_selection("roulette")
@@ -0,0 +1,92 @@
+import multiprocessing
+import time
+
+import pytest
+
+from BackpackGAIslandModel import BackpackGAIslandModel
+from BackpackGABitset import BackpackGAIslandModelBitset
+from BackpackGAThreadIslandModel import BackpackGAThreadIslandModel
+from IslandExecutor import IslandExecutor
+from StopCriteria import StopCriteria, StopMonitor
+from test_engines import ENGINE_IDS, ENGINES, MAX_WEIGHT, make_ga, run
+
+# Перевірки критеріїв ранньої зупинки: монітор, зупинка рушіїв і міжпроцесний сигнал зупинки островів
+
+ISLAND_ENGINES = [BackpackGAIslandModel, BackpackGAIslandModelBitset, BackpackGAThreadIslandModel]
+
+
+def test_stall_counts_generations_without_improvement():
+    monitor = StopMonitor(StopCriteria(stall_generations=2))
+    assert not monitor.update(1.0)
+    assert not monitor.update(2.0)
+    assert not monitor.update(2.0)
+    assert monitor.update(1.5)
+    assert monitor.reason == "stall" and monitor.generations == 4
+
+
+def test_targets_and_time_limit():
+    monitor = StopMonitor(StopCriteria(target_fitness=5.0))
+    assert not monitor.update(4.0)
+    assert monitor.update(5.0) and monitor.reason == "target_fitness"
+
+    monitor = StopMonitor(StopCriteria(target_value=100))
+    assert not monitor.update(1.0, 99)
+    assert monitor.update(1.0, 100) and monitor.reason == "target_value"
+
+    monitor = StopMonitor(StopCriteria(time_limit=0.01))
+    time.sleep(0.02)
+    assert monitor.update(1.0) and monitor.reason == "time_limit"
+
+
+def _reach_target(stop_event) -> None:
+    StopMonitor(StopCriteria(target_value=10), stop_event).update(1.0, 10)
+
+
+def test_global_reason_signals_other_processes():
+    stop_event = multiprocessing.Event()
+    monitor = StopMonitor(StopCriteria(stall_generations=100), stop_event)
+    assert not monitor.update(1.0)
+
+    process = multiprocessing.Process(target=_reach_target, args=(stop_event,))
+    process.start()
+    process.join()
+    assert monitor.update(2.0) and monitor.reason == "stop_signal"
+
+
+def test_local_reason_does_not_signal():
+    stop_event = multiprocessing.Event()
+    monitor = StopMonitor(StopCriteria(stall_generations=1), stop_event)
+    monitor.update(1.0)
+    assert monitor.update(1.0) and monitor.reason == "stall"
+    assert not stop_event.is_set()
+
+
+@pytest.mark.parametrize("engine, args", ENGINES, ids=ENGINE_IDS)
+def test_engines_stop_at_target_value(engine, args):
+    ga = make_ga(engine, generations=500, seed=1, stop_criteria=StopCriteria(target_value=1))
+    assert run(ga, args)[2] <= MAX_WEIGHT
+    assert ga.stop_reason == "target_value"
+    assert ga.generations_run < ga.generations
+
+
+@pytest.mark.parametrize("engine", ISLAND_ENGINES)
+def test_islands_share_time_limit(engine):
+    ga = make_ga(engine, generations=10**6, seed=1, stop_criteria=StopCriteria(time_limit=0.3))
+    start = time.perf_counter()
+    ga.run(4)
+    assert time.perf_counter() - start < 10
+    assert ga.stop_reason == "time_limit"
+
+
+def test_stop_event_stops_all_islands():
+    # Сигнал ззовні (як від острова, що досяг цілі): острови зупиняються з причиною stop_signal,
+    # яка не вважається причиною зупинки запуску
+    ga = make_ga(BackpackGAIslandModel, generations=10**6, seed=None)
+    with IslandExecutor(4) as executor:
+        stream = ga.run_iter(4, executor=executor)
+        next(stream)
+        executor.stop_event.set()
+        for _ in stream:
+            pass
+    assert ga.stop_reason is None
+    assert ga.generations_run < ga.generations
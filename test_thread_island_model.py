@@ -0,0 +1,23 @@
+import pytest
+
+from BackpackGAThreadIslandModel import BackpackGAThreadIslandModel
+from test_engines import ITEMS, MAX_WEIGHT, FailingEvaluator, make_ga
+
+# Перевірки потокової моделі островів: помилка острова-потоку не лишає решту чекати на бар'єрі
+
+
+@pytest.mark.parametrize("seed", [None, 4])
+def test_island_failure_raises(seed):
+    ga = make_ga(BackpackGAThreadIslandModel, generations=50, seed=seed, evaluator=FailingEvaluator(ITEMS, MAX_WEIGHT, fail_after=10))
+    with pytest.raises(RuntimeError, match="збій оцінювача"):
+        ga.run(4)
+
+
+def test_engine_is_reusable_after_failure():
+    evaluator = FailingEvaluator(ITEMS, MAX_WEIGHT, fail_after=10)
+    ga = make_ga(BackpackGAThreadIslandModel, generations=50, seed=4, evaluator=evaluator)
+    with pytest.raises(RuntimeError):
+        ga.run(4)
+
+    evaluator.fail_after = 10**9
+    assert ga.run(4)[2] <= MAX_WEIGHT